@@ -1,19 +1,39 @@
 """
 Configuration settings for the test framework
+
+Importing this module has no side effects besides reading .env: directories
+are created by whatever writes to them first, and xdist workers skip .env
+because they inherit the controlling process's environment.
 """
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
 
 # Project root directory
 ROOT_DIR = Path(__file__).parent.parent
 
+# Load environment variables from the nearest .env (python-dotenv is only imported if there is one)
+_here = Path(__file__).resolve().parent
+if not os.getenv("PYTEST_XDIST_WORKER") and any((d / ".env").exists() for d in (_here, *_here.parents)):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Local OrangeHRM stand-in (utilities/standin_server.py) instead of the public demo.
+# Every xdist worker runs its own stand-in on STANDIN_PORT + <worker number>.
+STANDIN = os.getenv("STANDIN", "false").lower() == "true"
+STANDIN_HOST = os.getenv("STANDIN_HOST", "127.0.0.1")
+STANDIN_PORT = int(os.getenv("STANDIN_PORT", "8765")) + int(
+    "".join(filter(str.isdigit, os.getenv("PYTEST_XDIST_WORKER", ""))) or 0)
+# Injected response latency (ms) and random extra delay up to the jitter (ms)
+STANDIN_LATENCY_MS = int(os.getenv("STANDIN_LATENCY_MS", "0"))
+STANDIN_LATENCY_JITTER_MS = int(os.getenv("STANDIN_LATENCY_JITTER_MS", "0"))
+
 # URLs
-BASE_URL = os.getenv("BASE_URL", "https://opensource-demo.orangehrmlive.com/").strip()
-API_BASE_URL = os.getenv("API_BASE_URL", f"{BASE_URL}web/index.php/api/v2")
+if STANDIN:
+    BASE_URL = f"http://{STANDIN_HOST}:{STANDIN_PORT}/"
+    API_BASE_URL = f"{BASE_URL}web/index.php/api/v2"
+else:
+    BASE_URL = os.getenv("BASE_URL", "https://opensource-demo.orangehrmlive.com/").strip()
+    API_BASE_URL = os.getenv("API_BASE_URL", f"{BASE_URL}web/index.php/api/v2")
 
 # Credentials
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "Admin")
@@ -25,36 +45,122 @@ BROWSER = os.getenv("BROWSER", "chromium")
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 SLOW_MO = int(os.getenv("SLOW_MO", "0"))
 TIMEOUT = int(os.getenv("TIMEOUT", "30000"))
+# Record how long each page object selector takes to resolve and act on
+SELECTOR_TIMING = os.getenv("SELECTOR_TIMING", "true").lower() == "true"
+# Max wait for the API response a page declares as its readiness signal (ms)
+READY_API_TIMEOUT = int(os.getenv("READY_API_TIMEOUT", "10000"))
 
 # Viewport
 VIEWPORT_WIDTH = 1920
 VIEWPORT_HEIGHT = 1080
 
+# Mobile emulation
+MOBILE_DEVICE = "iPhone 14 Pro"
+MOBILE_POOL_SIZE = int(os.getenv("MOBILE_POOL_SIZE", "2"))
+
 # Screenshots & Videos
 SCREENSHOT_ON_FAILURE = True
 VIDEO_ON_FAILURE = True
 TRACE_ON_FAILURE = True
+# Artifact policy: off | on-failure | on-first-retry | sampled:<percent>
+ARTIFACT_POLICY = os.getenv("ARTIFACT_POLICY", "on-failure")
+# Video is the most expensive artifact and is only recorded when enabled
+ARTIFACT_VIDEO = os.getenv("ARTIFACT_VIDEO", "false").lower() == "true"
 
 # Reports
-REPORTS_DIR = ROOT_DIR / "reports"
+REPORTS_DIR = Path(os.getenv("REPORTS_DIR", ROOT_DIR / "reports"))
 SCREENSHOTS_DIR = REPORTS_DIR / "screenshots"
 VIDEOS_DIR = REPORTS_DIR / "videos"
 TRACES_DIR = REPORTS_DIR / "traces"
-
-# Create directories
-for directory in [REPORTS_DIR, SCREENSHOTS_DIR, VIDEOS_DIR, TRACES_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+STATS_DIR = REPORTS_DIR / "stats"
+ARTIFACT_COSTS_DIR = REPORTS_DIR / "artifact_costs"
+
+# Auth state cache (one login per role and per worker)
+AUTH_STATE_DIR = REPORTS_DIR / ".auth"
+AUTH_STATE_MAX_AGE = int(os.getenv("AUTH_STATE_MAX_AGE", "1800"))  # seconds
+# Try the HTTP login (no login form rendering) before falling back to the UI
+AUTH_VIA_API = os.getenv("AUTH_VIA_API", "true").lower() == "true"
+
+# Static asset cache shared by all workers (opt-in)
+ASSET_CACHE = os.getenv("ASSET_CACHE", "false").lower() == "true"
+ASSET_CACHE_DIR = REPORTS_DIR / ".asset-cache"
+ASSET_CACHE_MAX_MB = int(os.getenv("ASSET_CACHE_MAX_MB", "200"))
+
+# Front-end performance: Navigation Timing, paint, LCP/CLS and long tasks per page (opt-in)
+WEB_VITALS = os.getenv("WEB_VITALS", "false").lower() == "true"
+WEB_VITALS_DIR = REPORTS_DIR / "web_vitals"
+
+# Performance budgets (utilities/perf_budget.py): repetitions per budgeted interaction in
+# tests/ui/test_performance_budgets.py, and whether a breach fails the run ("fail") or is
+# only reported ("warn")
+PERF_BUDGET_SAMPLES = int(os.getenv("PERF_BUDGET_SAMPLES", "5"))
+PERF_BUDGET_BREACH = os.getenv("PERF_BUDGET_BREACH", "fail")
 
 # API Settings
 API_TIMEOUT = 30
-API_RETRY_COUNT = 3
+API_RETRY_COUNT = int(os.getenv("API_RETRY_COUNT", "3"))
+# Backoff before retry n: random delay in [0, min(BASE * 2**n, MAX)] seconds
+API_RETRY_BACKOFF_BASE = float(os.getenv("API_RETRY_BACKOFF_BASE", "0.5"))
+API_RETRY_BACKOFF_MAX = float(os.getenv("API_RETRY_BACKOFF_MAX", "8"))
+# Consecutive failures that open a host's circuit, and seconds until it is probed again
+API_BREAKER_THRESHOLD = int(os.getenv("API_BREAKER_THRESHOLD", "5"))
+API_BREAKER_RESET_TIMEOUT = float(os.getenv("API_BREAKER_RESET_TIMEOUT", "30"))
+# Paginated list endpoints (APIClient.iter_records): records per page, server cap,
+# and pages fetched ahead while the current one is consumed
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "50"))
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "100"))
+API_PAGE_PREFETCH = int(os.getenv("API_PAGE_PREFETCH", "2"))
+# Opt-in cache of APIClient GET responses (utilities/http_cache.py)
+API_CACHE = os.getenv("API_CACHE", "false").lower() == "true"
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "60"))
+API_CACHE_MAX_ENTRIES = int(os.getenv("API_CACHE_MAX_ENTRIES", "256"))
+# Async client connection pool (utilities/async_api_client.py)
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "100"))
+API_MAX_CONCURRENCY_PER_HOST = int(os.getenv("API_MAX_CONCURRENCY_PER_HOST", "10"))
+API_KEEPALIVE_TIMEOUT = float(os.getenv("API_KEEPALIVE_TIMEOUT", "30"))
+
+# Test data seeded through the API once per worker (seeded_data fixture)
+SEED_EMPLOYEES = int(os.getenv("SEED_EMPLOYEES", "10"))
+SEED_USERS = int(os.getenv("SEED_USERS", "5"))
+SEED_LEAVE_REQUESTS = int(os.getenv("SEED_LEAVE_REQUESTS", "10"))
+SEED_CONCURRENCY = int(os.getenv("SEED_CONCURRENCY", "8"))
+
+# Cleanup of created test data (utilities/data_registry.py). Generated usernames and
+# employee middle names start with TEST_DATA_PREFIX + run id; with ORPHAN_SWEEP, tagged
+# records of runs older than ORPHAN_MIN_AGE_MINUTES are swept before data is seeded
+TEST_DATA_PREFIX = os.getenv("TEST_DATA_PREFIX", "pwt-")
+CLEANUP_BATCH_SIZE = int(os.getenv("CLEANUP_BATCH_SIZE", "50"))
+ORPHAN_SWEEP = os.getenv("ORPHAN_SWEEP", "false").lower() == "true"
+ORPHAN_MIN_AGE_MINUTES = float(os.getenv("ORPHAN_MIN_AGE_MINUTES", "120"))
+
+# Batch data generation (utilities.generate_data.BatchDataGenerator): seed for
+# reproducible data (random when unset) and values precomputed per name/email pool
+DATA_SEED = int(os.environ["DATA_SEED"]) if os.getenv("DATA_SEED") else None
+DATA_POOL_SIZE = int(os.getenv("DATA_POOL_SIZE", "1000"))
+# Records per kind pre-generated once per run and shared by all workers (utilities/data_pool.py)
+DATA_POOL = os.getenv("DATA_POOL", "false").lower() == "true"
+DATA_POOL_RECORDS = int(os.getenv("DATA_POOL_RECORDS", "5000"))
+DATA_POOL_DIR = REPORTS_DIR / "data_pool"
+
+# Duration history used for duration-aware xdist scheduling
+DURATIONS_FILE = Path(os.getenv("DURATIONS_FILE", REPORTS_DIR / ".test_durations.json"))
+DURATION_SHARDING = os.getenv("DURATION_SHARDING", "false").lower() == "true"
 
 # Test Data
 TEST_DATA_DIR = ROOT_DIR / "config"
+TEST_DATA_FILE = TEST_DATA_DIR / "test_data.json"
+# <section>.json files here override sections of TEST_DATA_FILE; each is read on first use
+TEST_DATA_SECTIONS_DIR = TEST_DATA_DIR / "test_data"
+# Validated sections, keyed by source file hash, section type and model source
+TEST_DATA_CACHE_DIR = REPORTS_DIR / ".test-data-cache"
 
 # Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = REPORTS_DIR / "test_execution.log"
+# Per-worker log files, merged into LOG_FILE at the end of an xdist run
+LOG_DIR = REPORTS_DIR / "logs"
+# Decode and log API response bodies (only when LOG_LEVEL=DEBUG)
+LOG_API_BODIES = os.getenv("LOG_API_BODIES", "true").lower() == "true"
 
 
 class TestUsers:
@@ -76,6 +182,7 @@ class URLs:
     """Application URLs"""
     BASE = BASE_URL
     LOGIN = f"{BASE_URL}web/index.php/auth/login"
+    AUTH_VALIDATE = f"{BASE_URL}web/index.php/auth/validate"
     DASHBOARD = f"{BASE_URL}web/index.php/dashboard/index"
     ADMIN = f"{BASE_URL}web/index.php/admin/viewSystemUsers"
     PIM = f"{BASE_URL}web/index.php/pim/viewEmployeeList"
@@ -91,6 +198,8 @@ class APIEndpoints:
     USERS = f"{API_BASE_URL}/admin/users"
     EMPLOYEES = f"{API_BASE_URL}/pim/employees"
     LEAVE = f"{API_BASE_URL}/leave/leave-requests"
+    LEAVE_ASSIGN = f"{API_BASE_URL}/leave/employees/leave-requests"
+    LEAVE_ENTITLEMENTS = f"{API_BASE_URL}/leave/leave-entitlements"
 
 
 # Print config on import (for debugging)
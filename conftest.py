@@ -1,26 +1,208 @@
 """
 Pytest configuration and fixtures
+
+API clients, the seeder and the test data models are imported by the fixtures
+that use them, so collection and sessions that do not need them skip loading
+aiohttp, requests and pydantic.
 """
+from __future__ import annotations
 import pytest
-import json
+import time
 from pathlib import Path
-from datetime import datetime
-from playwright.sync_api import Page, BrowserContext, Browser
+from typing import TYPE_CHECKING
 from config.settings import (
     BASE_URL, BROWSER, HEADLESS, SLOW_MO, TIMEOUT,
-    VIEWPORT_WIDTH, VIEWPORT_HEIGHT, SCREENSHOTS_DIR,
-    VIDEOS_DIR, TRACES_DIR, TEST_DATA_DIR
+    VIEWPORT_WIDTH, VIEWPORT_HEIGHT, TestUsers,
+    MOBILE_DEVICE, MOBILE_POOL_SIZE, ARTIFACT_POLICY, ASSET_CACHE, DURATION_SHARDING, STANDIN, WEB_VITALS,
+    PERF_BUDGET_BREACH,
+    SEED_EMPLOYEES, SEED_USERS, SEED_LEAVE_REQUESTS, ORPHAN_SWEEP, DATA_POOL
+)
+from utilities import run_stats, web_vitals
+from utilities.artifacts import (
+    ArtifactPolicy, ArtifactRecorder, load_test_costs, record_test_cost, reset_test_costs
 )
-from utilities.logger import get_logger
+from utilities.logger import flush_logs, get_logger, merge_worker_logs
+from utilities.perf_budget import BudgetExceeded
+from utilities.asset_cache import AssetCache
+from utilities.auth_cache import AuthStateCache
+from utilities.browser_pool import BrowserContextPool
+from utilities.data_pool import build_pool, worker_pool
+from utilities.data_registry import DataRegistry, current_run_id, registry
+from utilities.helpers import get_worker_id
+from utilities.duration_scheduler import DurationHistory, DurationScheduling
+from utilities.standin_server import StandInServer
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page
+    from utilities.async_api_client import SyncAPIBridge
+    from utilities.data_pool import DataPool
+    from utilities.data_seeder import SeededData
+    from utilities.test_data_store import TestDataStore
 
 logger = get_logger(__name__)
 
+# Set in the controlling process only (see pytest_configure)
+duration_history = None
+
+
+def _is_xdist_worker(config) -> bool:
+    """True inside an xdist worker process"""
+    return hasattr(config, "workerinput")
+
+
+def pytest_addoption(parser):
+    """Framework command line options"""
+    parser.addoption(
+        "--artifact-policy",
+        default=ARTIFACT_POLICY,
+        help="Trace/video/screenshot policy: off, on-failure, on-first-retry or sampled:<percent>",
+    )
+    parser.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=ASSET_CACHE,
+        help="Serve static assets from a disk cache shared by all workers",
+    )
+    parser.addoption(
+        "--web-vitals",
+        action="store_true",
+        default=WEB_VITALS,
+        help="Record Navigation Timing, paint, LCP/CLS and long tasks of every page the UI tests load",
+    )
+    parser.addoption(
+        "--budget-breach",
+        choices=("fail", "warn"),
+        default=PERF_BUDGET_BREACH,
+        help="Whether a test that exceeds a performance budget fails the run or is only reported",
+    )
+    parser.addoption(
+        "--duration-sharding",
+        action="store_true",
+        default=DURATION_SHARDING,
+        help="With -n, distribute tests longest first using recorded durations",
+    )
+
 
 def pytest_configure(config):
-    """Create reports directories"""
-    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-    VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
-    TRACES_DIR.mkdir(parents=True, exist_ok=True)
+    """Set up run-wide state; report directories are created when artifacts are written"""
+    # Fix the run id before xdist workers start, so they inherit it
+    current_run_id()
+
+    policy = ArtifactPolicy.parse(config.getoption("--artifact-policy"))
+    if policy.mode == "on-first-retry" and not config.pluginmanager.hasplugin("rerunfailures"):
+        # Without it no test is ever rerun, so nothing would be recorded
+        raise pytest.UsageError("--artifact-policy on-first-retry needs pytest-rerunfailures (and --reruns)")
+
+    # Durations are recorded by the controlling process, which sees all reports
+    global duration_history
+    if not _is_xdist_worker(config):
+        duration_history = DurationHistory()
+        # Generated once, before the workers start; they only read their slices
+        if DATA_POOL and not config.option.collectonly:
+            build_pool()
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Longest-processing-time-first scheduling when --duration-sharding is set"""
+    if config.getoption("--duration-sharding"):
+        return DurationScheduling(config, log, history=duration_history)
+    return None
+
+
+def pytest_runtest_logreport(report):
+    """Collect per-test durations for the duration history"""
+    if duration_history is not None:
+        duration_history.add(report.nodeid, report.duration)
+
+
+def pytest_sessionstart(session):
+    """Clear run statistics of a previous run"""
+    if not _is_xdist_worker(session.config):
+        run_stats.reset()
+        reset_test_costs()
+        web_vitals.reset_samples()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """Persist this process's run statistics, the duration history and the logs"""
+    run_stats.dump()
+    if duration_history is not None:
+        duration_history.save()
+
+    # Workers finish before the controller, which then merges their log files
+    if _is_xdist_worker(session.config):
+        flush_logs()
+    else:
+        merge_worker_logs()
+        samples = web_vitals.load_samples()
+        if samples:
+            web_vitals.write_summary(web_vitals.aggregate(samples))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Show run statistics merged over all workers"""
+    if _is_xdist_worker(config):
+        return
+
+    merged = run_stats.merge_all()
+    lines = run_stats.format_summary(merged, exclude=("selectors",))
+    if lines:
+        terminalreporter.write_sep("=", "run statistics")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    selector_lines = run_stats.slowest(merged, "selectors")
+    if selector_lines:
+        terminalreporter.write_sep("=", "slowest selectors")
+        for line in selector_lines:
+            terminalreporter.write_line(line)
+
+    breaches = [report for report in terminalreporter.stats.get("budget", []) if report.when == "call"]
+    if breaches:
+        terminalreporter.write_sep("=", f"performance budgets exceeded ({config.getoption('--budget-breach')})")
+        for report in breaches:
+            message = dict(report.user_properties).get("budget_exceeded", "")
+            terminalreporter.write_line(f"{report.nodeid}: {message}")
+
+    vitals = web_vitals.aggregate(web_vitals.load_samples())
+    if vitals:
+        terminalreporter.write_sep("=", "web vitals (ms, cls unitless)")
+        for line in web_vitals.format_lines(vitals):
+            terminalreporter.write_line(line)
+
+    costs = load_test_costs()
+    if costs:
+        total_kb = sum(cost["artifact_bytes"] for cost in costs) / 1024
+        total_ms = sum(cost["artifact_ms"] for cost in costs)
+        terminalreporter.write_sep("=", f"artifact cost (policy: {config.getoption('--artifact-policy')})")
+        terminalreporter.write_line(f"total: {total_kb:.0f} KB, {total_ms:.0f} ms over {len(costs)} tests")
+        for cost in sorted(costs, key=lambda c: c["artifact_bytes"], reverse=True)[:5]:
+            terminalreporter.write_line(
+                f"{cost['artifact_bytes'] / 1024:8.0f} KB {cost['artifact_ms']:8.0f} ms "
+                f"{cost['wall_ms']:8.0f} ms wall  {cost['nodeid']}"
+            )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def standin_server():
+    """
+    Local OrangeHRM stand-in serving BASE_URL when STANDIN is set
+
+    Each process (xdist worker) runs its own server and dataset on its own
+    port, so tests never share state and scale with the number of workers.
+    Use set_latency() or reset_data() on the yielded server to adjust it.
+    """
+    if not STANDIN:
+        yield None
+        return
+
+    server = StandInServer().start()
+    yield server
+    server.stop()
+    for kind, count in server.request_counts.items():
+        run_stats.incr("standin", f"{kind}_requests", count)
 
 
 @pytest.fixture(scope="session")
@@ -32,50 +214,121 @@ def browser_context_args(browser_context_args):
             "width": VIEWPORT_WIDTH,
             "height": VIEWPORT_HEIGHT,
         },
-        "record_video_dir": str(VIDEOS_DIR),
         "record_video_size": {"width": 1280, "height": 720},
     }
 
 
+@pytest.fixture(scope="session")
+def artifact_policy(pytestconfig) -> ArtifactPolicy:
+    """Artifact policy selected by --artifact-policy / ARTIFACT_POLICY"""
+    return ArtifactPolicy.parse(pytestconfig.getoption("--artifact-policy"))
+
+
+@pytest.fixture(scope="function")
+def artifact_recorder(artifact_policy: ArtifactPolicy, request) -> ArtifactRecorder:
+    """Artifact recorder for the current test"""
+    return ArtifactRecorder(artifact_policy, request.node)
+
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig) -> AssetCache:
+    """Shared static asset cache, or None unless --asset-cache / ASSET_CACHE is set"""
+    return AssetCache() if pytestconfig.getoption("--asset-cache") else None
+
+
+@pytest.fixture(scope="session")
+def context_setup(pytestconfig, asset_cache: AssetCache):
+    """Installs the asset cache and web vitals observers, as enabled, in a new context"""
+    vitals = pytestconfig.getoption("--web-vitals")
+
+    def setup(context: BrowserContext):
+        if asset_cache:
+            asset_cache.install(context)
+        if vitals:
+            web_vitals.install(context)
+
+    return setup
+
+
 @pytest.fixture(scope="function")
-def page(context: BrowserContext) -> Page:
+def context(new_context, artifact_recorder: ArtifactRecorder, context_setup) -> BrowserContext:
+    """Browser context, recording video only when the artifact policy asks for it"""
+    context = new_context(**artifact_recorder.context_args())
+    context_setup(context)
+    return context
+
+
+def _test_failed(request) -> bool:
+    """Whether the test body failed (or never ran because setup failed)"""
+    report = getattr(request.node, "rep_call", None)
+    return report.failed if report else True
+
+
+@pytest.fixture(scope="function")
+def page(context: BrowserContext, artifact_recorder: ArtifactRecorder, request) -> Page:
     """Create a new page for each test"""
     page = context.new_page()
 
     # Set default timeout
     page.set_default_timeout(TIMEOUT)
+    artifact_recorder.attach(page)
 
     yield page
 
+    artifact_recorder.finish(_test_failed(request))
     page.close()
+    artifact_recorder.finish_videos()
 
 
-@pytest.fixture(scope="function")
-def mobile_page(playwright) -> Page:
-    """
-    Create a new page emulating iPhone 14 Pro
-    """
-    iphone_14_pro = playwright.devices["iPhone 14 Pro"]
-
+@pytest.fixture(scope="session")
+def mobile_browser(playwright) -> Browser:
+    """Chromium instance shared by all mobile tests of this worker"""
+    start = time.perf_counter()
     browser = playwright.chromium.launch(
         headless=HEADLESS,
         slow_mo=SLOW_MO
     )
+    run_stats.observe("mobile_context_pool", "browser_launch_ms", (time.perf_counter() - start) * 1000)
+
+    yield browser
+
+    browser.close()
 
-    context = browser.new_context(
-        **iphone_14_pro,
-        record_video_dir=str(VIDEOS_DIR),
-        record_video_size={"width": 393, "height": 852}  # iPhone 14 Pro actual size
+
+@pytest.fixture(scope="session")
+def mobile_context_pool(playwright, mobile_browser: Browser, context_setup) -> BrowserContextPool:
+    """Pre-created iPhone 14 Pro contexts, reset between tests"""
+    pool = BrowserContextPool(
+        mobile_browser,
+        context_args=playwright.devices[MOBILE_DEVICE],
+        size=MOBILE_POOL_SIZE,
+        name="mobile_context_pool",
+        setup=context_setup,
     )
+    pool.warm_up()
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def mobile_page(mobile_context_pool: BrowserContextPool, artifact_recorder: ArtifactRecorder,
+                request) -> Page:
+    """
+    Create a new page emulating iPhone 14 Pro
+    """
+    context = mobile_context_pool.acquire()
 
     page = context.new_page()
     page.set_default_timeout(TIMEOUT)
+    artifact_recorder.attach(page)
 
     yield page
 
+    artifact_recorder.finish(_test_failed(request))
     page.close()
-    context.close()
-    browser.close()
+    mobile_context_pool.release(context)
 
 
 @pytest.fixture(scope="function")
@@ -88,28 +341,125 @@ def navigate_to_home(page: Page):
 
 
 @pytest.fixture(scope="session")
-def test_data():
-    """Load test data from JSON"""
-    test_data_file = TEST_DATA_DIR / "test_data.json"
-    with open(test_data_file, 'r') as f:
-        data = json.load(f)
-    return data
+def test_data() -> TestDataStore:
+    """
+    Typed test data; each section is loaded and validated on first use
 
+    test_data.pagination.max_page_size, test_data.admin_users[0].username
+    """
+    from utilities.test_data_store import TestDataStore
+    return TestDataStore()
 
-@pytest.fixture(scope="function")
-def authenticated_page(page: Page):
-    """Create an authenticated page session"""
-    from tests.ui.pages.login_page import LoginPage
-    from config.settings import ADMIN_USERNAME, ADMIN_PASSWORD
 
-    logger.info("Creating authenticated session")
-    page.goto(BASE_URL)
+@pytest.fixture(scope="session")
+def async_api() -> SyncAPIBridge:
+    """Concurrent API client (pooled keep-alive connections) usable from sync tests"""
+    from utilities.async_api_client import SyncAPIBridge
+    bridge = SyncAPIBridge()
+    yield bridge
+    bridge.close()
+
+
+def _run_as_admin(action):
+    """Call action(SyncAPIBridge, APIClient) with both clients logged in as Admin"""
+    admin = TestUsers.ADMIN
+    from utilities.api_client import APIClient
+    from utilities.async_api_client import SyncAPIBridge
+    bridge, client = SyncAPIBridge(), APIClient(base_url="")
+    try:
+        if not (bridge.login(admin["username"], admin["password"])
+                and client.login(admin["username"], admin["password"])):
+            raise RuntimeError("Admin login failed")
+        return action(bridge, client)
+    finally:
+        bridge.close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def data_registry(standin_server) -> DataRegistry:
+    """
+    Entities created during the session, deleted in parallel bulk batches at its end
+
+    API-created employees, users and leave entitlements are registered by the
+    clients (leave requests go with their employee); register UI-created users with register_username(). Nothing is
+    sent to the server unless something was registered.
+    """
+    yield registry
 
-    login_page = LoginPage(page)
-    login_page.login(ADMIN_USERNAME, ADMIN_PASSWORD)
+    if len(registry):
+        try:
+            _run_as_admin(registry.cleanup)
+        except Exception as e:
+            logger.warning(f"Test data cleanup of run {current_run_id()} failed: {e}")
+
+
+@pytest.fixture(scope="session")
+def orphan_sweep(data_registry: DataRegistry):
+    """
+    Deletes tagged data of crashed earlier runs before this run seeds its own
+
+    Opt-in with ORPHAN_SWEEP=true; only the first worker sweeps.
+    """
+    if ORPHAN_SWEEP and get_worker_id() in ("master", "gw0"):
+        try:
+            _run_as_admin(registry.sweep_orphans)
+        except Exception as e:
+            logger.warning(f"Orphaned test data sweep skipped: {e}")
+
+
+@pytest.fixture(scope="session")
+def seeded_data(data_registry: DataRegistry, orphan_sweep) -> SeededData:
+    """
+    Employees, linked users and leave requests created through the API for this worker
+
+    Includes an employee named "Test Employee" for forms that need an existing
+    employee. The data registry deletes everything at the end of the session.
+    """
+    from utilities.data_seeder import DataSeeder
+    seeder = DataSeeder()
+    try:
+        yield seeder.seed(SEED_EMPLOYEES, SEED_USERS, SEED_LEAVE_REQUESTS,
+                          extra_employees=[{"firstName": "Test", "lastName": "Employee"}])
+    finally:
+        seeder.close()
 
-    # Wait for dashboard
-    page.wait_for_url("**/dashboard/index", timeout=10000)
+
+@pytest.fixture(scope="session")
+def data_pool() -> DataPool:
+    """
+    This worker's slice of the pre-generated data pool
+
+    Records handed out with take() are not handed out again in this run:
+    data_pool.users.take(1)[0]
+    """
+    pool = worker_pool()
+    if pool is None:
+        pytest.skip("Test data pool is disabled (set DATA_POOL=true)")
+    return pool
+
+
+@pytest.fixture(scope="session")
+def auth_state_cache(browser: Browser, browser_context_args) -> AuthStateCache:
+    """Per-worker cache of logged-in sessions, one login per role"""
+    return AuthStateCache(browser, context_args=browser_context_args)
+
+
+@pytest.fixture(scope="function")
+def authenticated_page(page: Page, auth_state_cache: AuthStateCache, request):
+    """
+    Create an authenticated page session
+
+    Reuses the cached storage state for the role given by the auth_role
+    marker (Admin by default) instead of logging in through the UI.
+    """
+    marker = request.node.get_closest_marker("auth_role")
+    role = marker.args[0] if marker else TestUsers.ADMIN["role"]
+
+    logger.info(f"Creating authenticated session for role: {role}")
+    auth_state_cache.open_authenticated(page, role)
+    request.node.user_properties.append(
+        ("auth_login_method", auth_state_cache.login_methods.get(role, "stored"))
+    )
     logger.info("Authentication successful")
 
     return page
@@ -118,36 +468,73 @@ def authenticated_page(page: Page):
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook to capture screenshot on test failure
+    Hook to capture screenshot on test failure, classify performance budget
+    breaches and record artifact cost
     """
     outcome = yield
     report = outcome.get_result()
-
-    if report.when == "call" and report.failed:
+    # rep_setup / rep_call / rep_teardown: read by the page fixtures and the cost accounting below
+    setattr(item, f"rep_{report.when}", report)
+    recorder = item.funcargs.get("artifact_recorder")
+
+    budget_breach = report.when == "call" and call.excinfo is not None and call.excinfo.errisinstance(BudgetExceeded)
+    if budget_breach:
+        # Reported as "budget" (see pytest_report_teststatus), not as a functional failure
+        report.user_properties.append(("budget_exceeded", str(call.excinfo.value)))
+        if item.config.getoption("--budget-breach") == "warn":
+            report.outcome = "passed"
+            report.longrepr = None
+
+    if report.when == "call" and report.failed and recorder and not budget_breach:
         # Get page from test
         page = None
-        for fixture_name in item.fixturenames:
-            if fixture_name == "page" or fixture_name == "authenticated_page":
-                page = item.funcargs.get(fixture_name)
+        for fixture_name in ("authenticated_page", "page", "mobile_page"):
+            if fixture_name in item.funcargs:
+                page = item.funcargs[fixture_name]
                 break
 
         if page:
-            # Take screenshot
-            screenshot_name = f"{item.name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            screenshot_path = SCREENSHOTS_DIR / screenshot_name
-
             try:
-                page.screenshot(path=str(screenshot_path), full_page=True)
-                logger.info(f"Screenshot saved: {screenshot_path}")
+                screenshot_path = recorder.capture_screenshot(page)
+                if screenshot_path:
+                    logger.info(f"Screenshot saved: {screenshot_path}")
             except Exception as e:
                 logger.error(f"Failed to capture screenshot: {e}")
 
+    if report.when == "teardown" and recorder:
+        wall_ms = sum(
+            getattr(item, f"rep_{phase}").duration * 1000
+            for phase in ("setup", "call")
+            if hasattr(item, f"rep_{phase}")
+        ) + report.duration * 1000
+        cost = recorder.cost()
+        item.user_properties.extend(cost.items())
+        record_test_cost(item.nodeid, wall_ms, cost)
+
+
+def pytest_report_teststatus(report, config):
+    """Show performance budget breaches as their own outcome: B / BUDGET"""
+    if report.when == "call" and any(name == "budget_exceeded" for name, _ in report.user_properties):
+        return "budget", "B", "BUDGET"
+    return None
+
 
 def pytest_html_report_title(report):
     """Customize HTML report title"""
     report.title = "OrangeHRM Test Automation Report"
 
 
+def pytest_html_results_summary(prefix, summary, postfix):
+    """Add run statistics to the HTML report summary"""
+    merged = run_stats.merge_all()
+    for line in run_stats.format_summary(merged, exclude=("selectors",)):
+        prefix.append(f"<p>{line}</p>")
+
+    vitals = web_vitals.aggregate(web_vitals.load_samples())
+    if vitals:
+        prefix.append(web_vitals.format_html(vitals))
+
+
 def pytest_metadata(metadata):
     """Add metadata to HTML report"""
     metadata["Project"] = "OrangeHRM Automation"
@@ -0,0 +1,72 @@
+"""
+API Response Cache Tests
+"""
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import APIEndpoints, TestUsers
+from utilities import run_stats
+from utilities.api_client import APIClient
+from utilities.http_cache import HTTPCache
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _cache_count(key: str) -> float:
+    return run_stats.snapshot()["counters"].get("http_cache", {}).get(key, 0)
+
+
+@pytest.mark.api
+class TestAPICache:
+    """Opt-in response cache of APIClient"""
+
+    @pytest.fixture
+    def cache(self):
+        """Empty cache for one test"""
+        return HTTPCache(ttl=60)
+
+    @pytest.fixture
+    def api_client(self, cache):
+        """Cached API client logged in as Admin"""
+        client = APIClient(base_url="", cache=cache)
+        admin = TestUsers.ADMIN
+        assert client.login(admin["username"], admin["password"]), "API login failed"
+        return client
+
+    def test_repeated_get_is_served_from_cache(self, api_client):
+        """Test that a second identical GET does not reach the server"""
+        logger.info("🧪 API TEST: Repeated GET served from cache")
+
+        hits_before = _cache_count("hits")
+        first = api_client.get(APIEndpoints.USERS, params={"limit": 5})
+        second = api_client.get(APIEndpoints.USERS, params={"limit": 5})
+
+        assert first.status_code == 200
+        assert second is first
+        assert _cache_count("hits") == hits_before + 1
+
+        logger.info("✅ TEST PASSED")
+
+    def test_concurrent_gets_share_one_request(self, api_client):
+        """Test that identical GETs in flight at the same time are coalesced"""
+        logger.info("🧪 API TEST: Concurrent GETs coalesced")
+
+        misses_before = _cache_count("misses")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: api_client.get(APIEndpoints.EMPLOYEES), range(8)))
+
+        assert all(response.status_code == 200 for response in responses)
+        assert _cache_count("misses") == misses_before + 1
+
+        logger.info("✅ TEST PASSED")
+
+    def test_cache_is_not_shared_between_identities(self, api_client, cache):
+        """Test that an anonymous client does not get the admin's cached response"""
+        logger.info("🧪 API TEST: Cache keyed on auth identity")
+
+        assert api_client.get(APIEndpoints.USERS).status_code == 200
+        anonymous = APIClient(base_url="", cache=cache)
+
+        assert anonymous.get(APIEndpoints.USERS).status_code == 401
+
+        logger.info("✅ TEST PASSED")
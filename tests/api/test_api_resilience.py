@@ -0,0 +1,74 @@
+"""
+API Retry and Circuit Breaker Tests
+"""
+import time
+import pytest
+from config.settings import APIEndpoints, STANDIN
+from utilities.api_client import APIClient
+from utilities.logger import get_logger
+from utilities.resilience import CircuitOpenError, RetryPolicy, reset_breakers
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.api
+@pytest.mark.skipif(not STANDIN, reason="Fault injection requires the local stand-in (STANDIN=true)")
+class TestAPIResilience:
+    """Retries and fail-fast behaviour against injected server faults"""
+
+    @pytest.fixture
+    def api_client(self):
+        """API client with short backoff and a fresh circuit breaker"""
+        reset_breakers()
+        yield APIClient(base_url="", retry_policy=RetryPolicy(retries=3, backoff_base=0.01))
+        reset_breakers()
+
+    def test_get_is_retried_through_transient_errors(self, api_client, standin_server):
+        """Test that a GET succeeds after two 502 responses"""
+        logger.info("🧪 API TEST: Retry transient 502")
+
+        standin_server.inject_faults(2, status=502)
+        response = api_client.get(APIEndpoints.USERS)
+
+        # Reached the application: anonymous call is rejected
+        assert response.status_code == 401
+
+        logger.info("✅ TEST PASSED")
+
+    def test_retry_after_is_honoured(self, api_client, standin_server):
+        """Test that a 429 with Retry-After is retried after the given delay"""
+        logger.info("🧪 API TEST: Honour Retry-After")
+
+        standin_server.inject_faults(1, status=429, retry_after=0.2)
+        started = time.monotonic()
+        response = api_client.get(APIEndpoints.USERS)
+        waited = time.monotonic() - started
+
+        assert response.status_code == 401
+        assert waited >= 0.19, f"Retried after {waited:.3f}s, before the 0.2s Retry-After"
+
+        logger.info("✅ TEST PASSED")
+
+    def test_post_is_not_retried(self, api_client, standin_server):
+        """Test that non-idempotent calls return the first error"""
+        logger.info("🧪 API TEST: POST not retried")
+
+        standin_server.inject_faults(1, status=503)
+        response = api_client.post(APIEndpoints.EMPLOYEES, json={"firstName": "Retry", "lastName": "Check"})
+
+        assert response.status_code == 503
+
+        logger.info("✅ TEST PASSED")
+
+    def test_circuit_opens_when_backend_is_down(self, api_client, standin_server):
+        """Test that calls fail fast once the host keeps failing"""
+        logger.info("🧪 API TEST: Circuit breaker opens")
+
+        standin_server.inject_faults(5, status=503)
+        for _ in range(2):
+            api_client.get(APIEndpoints.USERS)
+
+        with pytest.raises(CircuitOpenError):
+            api_client.get(APIEndpoints.USERS)
+
+        logger.info("✅ TEST PASSED")
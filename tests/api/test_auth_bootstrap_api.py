@@ -0,0 +1,38 @@
+"""
+API Login Bootstrap Tests
+
+The storage state AuthStateCache builds from an HTTP login must open the
+dashboard directly, without going through the UI login form.
+"""
+import pytest
+import requests
+from config.settings import TestUsers, URLs
+from utilities.auth_cache import AuthStateCache
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.api
+class TestAuthBootstrapAPI:
+    """HTTP login bootstrap test suite"""
+
+    def test_api_state_opens_dashboard(self, tmp_path):
+        """Test cookies of the API login are accepted by the web application"""
+        logger.info("🧪 API TEST: Bootstrapped session reaches the dashboard")
+
+        # No browser: a UI fallback would fail instead of hiding a rejected API login
+        cache = AuthStateCache(browser=None, state_dir=tmp_path, via_api=True)
+        state = cache.get_state(TestUsers.ADMIN["role"])
+        assert cache.login_methods[TestUsers.ADMIN["role"]] == "api"
+        assert state["cookies"], "API login produced no cookies"
+
+        session = requests.Session()
+        for cookie in state["cookies"]:
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+        response = session.get(URLs.DASHBOARD, headers={"Accept": "text/html"})
+
+        assert response.status_code == 200
+        assert "/dashboard/index" in response.url, f"Redirected to {response.url}"
+
+        logger.info("✅ TEST PASSED")
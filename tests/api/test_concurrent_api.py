@@ -0,0 +1,46 @@
+"""
+Concurrent API Tests
+"""
+import pytest
+from config.settings import APIEndpoints, TestUsers
+from utilities.async_api_client import SyncAPIBridge
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.api
+class TestConcurrentAPI:
+    """API calls fanned out over the async client"""
+
+    def test_endpoints_require_authentication(self):
+        """Test that all protected endpoints reject anonymous calls"""
+        logger.info("🧪 API TEST: Protected endpoints, concurrently")
+
+        endpoints = [APIEndpoints.USERS, APIEndpoints.EMPLOYEES, APIEndpoints.LEAVE]
+        # Own client: the shared async_api session may already be logged in
+        with SyncAPIBridge() as anonymous_api:
+            responses = anonymous_api.gather([("GET", endpoint) for endpoint in endpoints])
+
+        for endpoint, response in zip(endpoints, responses):
+            assert response.status_code == 401, f"{endpoint} returned {response.status_code}"
+
+        logger.info("✅ TEST PASSED")
+
+    def test_fetch_user_records_concurrently(self, async_api):
+        """Test fetching every listed user by id in one batch"""
+        logger.info("🧪 API TEST: Fetch user records concurrently")
+
+        admin = TestUsers.ADMIN
+        assert async_api.login(admin["username"], admin["password"]), "API login failed"
+
+        listing = async_api.get(APIEndpoints.USERS, params={"limit": 20})
+        assert listing.status_code == 200
+        user_ids = [user["id"] for user in listing.json()["data"]]
+
+        responses = async_api.gather([("GET", f"{APIEndpoints.USERS}/{user_id}") for user_id in user_ids])
+
+        assert all(response.status_code == 200 for response in responses)
+        assert [response.json()["data"]["id"] for response in responses] == user_ids
+
+        logger.info("✅ TEST PASSED")
@@ -0,0 +1,97 @@
+"""
+API Test Data Cleanup Tests
+"""
+import time
+import pytest
+from config.settings import APIEndpoints, TEST_DATA_PREFIX, TestUsers
+from utilities.api_client import APIClient
+from utilities.data_registry import DataRegistry, _base36, data_tag
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.api
+class TestDataCleanupAPI:
+    """Bulk deletion of registered entities and the orphan sweep"""
+
+    @pytest.fixture(scope="class")
+    def api_client(self):
+        """API client logged in as Admin"""
+        client = APIClient(base_url="")
+        admin = TestUsers.ADMIN
+        assert client.login(admin["username"], admin["password"]), "API login failed"
+        return client
+
+    @pytest.fixture
+    def admin_api(self, async_api):
+        """Shared async client logged in as Admin"""
+        admin = TestUsers.ADMIN
+        assert async_api.login(admin["username"], admin["password"]), "API login failed"
+        return async_api
+
+    def _create_employee(self, api_client, middle_name: str) -> int:
+        response = api_client.post(APIEndpoints.EMPLOYEES, json={
+            "firstName": "Cleanup", "middleName": middle_name, "lastName": "Check", "empPicture": None})
+        assert response.status_code == 200
+        return response.json()["data"]["empNumber"]
+
+    def test_registered_entities_are_bulk_deleted(self, api_client, admin_api):
+        """Test that registered employees are deleted in batches"""
+        logger.info("🧪 API TEST: Bulk delete registered entities")
+
+        registry = DataRegistry()
+        emp_numbers = [self._create_employee(api_client, data_tag()) for _ in range(5)]
+        for emp_number in emp_numbers:
+            registry.register("employees", emp_number)
+
+        deleted = registry.cleanup(admin_api, api_client, batch_size=2)
+
+        assert deleted["employees"] == 5
+        assert len(registry) == 0
+        for emp_number in emp_numbers:
+            assert api_client.get(f"{APIEndpoints.EMPLOYEES}/{emp_number}").status_code == 404
+
+        logger.info("✅ TEST PASSED")
+
+    def test_orphans_of_old_runs_are_swept(self, api_client, admin_api):
+        """Test that tagged data of an old run is swept and data of this run is kept"""
+        logger.info("🧪 API TEST: Sweep orphaned test data")
+
+        old_tag = f"{TEST_DATA_PREFIX}{_base36(int(time.time() // 60) - 24 * 60)}zz"
+        orphan = self._create_employee(api_client, old_tag)
+        current = self._create_employee(api_client, data_tag())
+
+        deleted = DataRegistry().sweep_orphans(admin_api, api_client)
+
+        assert deleted["employees"] >= 1
+        assert api_client.get(f"{APIEndpoints.EMPLOYEES}/{orphan}").status_code == 404
+        assert api_client.get(f"{APIEndpoints.EMPLOYEES}/{current}").status_code == 200
+
+        logger.info("✅ TEST PASSED")
+
+    def test_entitlements_are_deleted_before_their_employee(self, api_client, admin_api):
+        """Test that a created entitlement is registered and deleted, and assigned leave is not registered"""
+        logger.info("🧪 API TEST: Cleanup of leave entitlements")
+
+        registry = DataRegistry()
+        emp_number = self._create_employee(api_client, data_tag())
+        registry.register("employees", emp_number)
+        year = time.localtime().tm_year
+        entitlement = api_client.post(APIEndpoints.LEAVE_ENTITLEMENTS, json={
+            "empNumber": emp_number, "leaveTypeId": 1, "entitlement": "2",
+            "fromDate": f"{year}-01-01", "toDate": f"{year}-12-31"})
+        assert entitlement.status_code == 200
+        registry.track("POST", APIEndpoints.LEAVE_ENTITLEMENTS, entitlement.status_code, entitlement.json)
+        leave = api_client.post(APIEndpoints.LEAVE_ASSIGN, json={
+            "empNumber": emp_number, "leaveTypeId": 1, "fromDate": f"{year}-12-01", "toDate": f"{year}-12-01",
+            "duration": {"type": "full_day"}, "comment": "cleanup check"})
+        assert leave.status_code == 200
+        registry.track("POST", APIEndpoints.LEAVE_ASSIGN, leave.status_code, leave.json)
+
+        deleted = registry.cleanup(admin_api, api_client)
+
+        assert deleted == {"leave_entitlements": 1, "users": 0, "employees": 1}
+        assert len(registry) == 0
+
+        logger.info("✅ TEST PASSED")
@@ -0,0 +1,41 @@
+"""
+API Data Seeding Tests
+"""
+import pytest
+from config.settings import APIEndpoints, SEED_EMPLOYEES, SEED_LEAVE_REQUESTS, SEED_USERS, TestUsers
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.api
+class TestDataSeedingAPI:
+    """Records provisioned by the seeded_data fixture"""
+
+    def test_seeded_records_are_created(self, seeded_data):
+        """Test that the requested numbers of records were created with ids"""
+        logger.info("🧪 API TEST: Seeded data set")
+
+        # Generated employees plus "Test Employee"
+        assert len(seeded_data.employees) == SEED_EMPLOYEES + 1
+        assert len(seeded_data.users) == SEED_USERS
+        assert len(seeded_data.leave_requests) == SEED_LEAVE_REQUESTS
+        assert len(set(seeded_data.employee_numbers)) == len(seeded_data.employees)
+
+        logger.info("✅ TEST PASSED")
+
+    def test_seeded_users_are_linked_to_seeded_employees(self, seeded_data, async_api):
+        """Test that each seeded user can be read back with its employee"""
+        logger.info("🧪 API TEST: Seeded users linked to employees")
+
+        admin = TestUsers.ADMIN
+        assert async_api.login(admin["username"], admin["password"]), "API login failed"
+        responses = async_api.gather([("GET", f"{APIEndpoints.USERS}/{user_id}")
+                                      for user_id in seeded_data.user_ids])
+
+        employee_numbers = set(seeded_data.employee_numbers)
+        for response in responses:
+            assert response.status_code == 200
+            assert response.json()["data"]["employee"]["empNumber"] in employee_numbers
+
+        logger.info("✅ TEST PASSED")
@@ -47,6 +47,16 @@ class TestLoginAPI:
 
         logger.info(" TEST PASSED")
 
+    def test_login_with_admin_users_from_test_data(self, test_data):
+        """Test that every admin account of the test data can log in"""
+        logger.info(" API TEST: Login with test data admin users")
+
+        for admin in test_data.admin_users:
+            assert APIClient(base_url=BASE_URL).login(admin.username, admin.password), \
+                f"Login failed for {admin.username}"
+
+        logger.info(" TEST PASSED")
+
     @pytest.mark.skip(reason="Authentication flow needs to be implemented")
     def test_get_users_with_valid_token(self, api_client):
         """
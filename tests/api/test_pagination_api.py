@@ -0,0 +1,69 @@
+"""
+API Pagination Tests
+"""
+import pytest
+from config.settings import APIEndpoints, TestUsers
+from utilities import run_stats
+from utilities.api_client import APIClient
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _pages_fetched() -> float:
+    return run_stats.snapshot()["counters"].get("api_pagination", {}).get("pages", 0)
+
+
+@pytest.mark.api
+class TestPaginationAPI:
+    """Streaming iteration over paginated list endpoints"""
+
+    @pytest.fixture(scope="class")
+    def api_client(self):
+        """API client logged in as Admin"""
+        client = APIClient(base_url="")
+        admin = TestUsers.ADMIN
+        assert client.login(admin["username"], admin["password"]), "API login failed"
+        return client
+
+    def test_iterates_all_users_across_pages(self, api_client):
+        """Test that iterating small pages yields every user exactly once"""
+        logger.info("🧪 API TEST: Iterate users page by page")
+
+        total = api_client.get(APIEndpoints.USERS, params={"limit": 1}).json()["meta"]["total"]
+        user_ids = [user["id"] for user in api_client.iter_records(APIEndpoints.USERS, page_size=10)]
+
+        assert len(user_ids) == total
+        assert len(set(user_ids)) == total, "A user was returned on two pages"
+
+        logger.info("✅ TEST PASSED")
+
+    def test_stops_fetching_when_caller_breaks(self, api_client):
+        """Test that leaving the loop early does not fetch the remaining pages"""
+        logger.info("🧪 API TEST: Early exit from employee iteration")
+
+        pages_before = _pages_fetched()
+        employees = api_client.iter_records(APIEndpoints.EMPLOYEES, page_size=5, prefetch=2)
+        first = [employee for _, employee in zip(range(3), employees)]
+        employees.close()
+
+        assert len(first) == 3
+        # The consumed page plus at most `prefetch` pages ahead
+        assert _pages_fetched() - pages_before <= 3
+
+        logger.info("✅ TEST PASSED")
+
+    def test_prefetch_threads_use_their_own_session(self, api_client, monkeypatch):
+        """Test that pages are fetched on per-thread copies of the logged-in session"""
+        logger.info("🧪 API TEST: Prefetch threads do not share the client's session")
+
+        def shared_session_request(*args, **kwargs):
+            raise AssertionError("A page was fetched on the client's shared session")
+
+        monkeypatch.setattr(api_client.session, "request", shared_session_request)
+        employees = list(api_client.iter_records(APIEndpoints.EMPLOYEES, page_size=5, prefetch=2))
+
+        # The copies carry the login cookie: an anonymous page request would fail
+        assert employees
+
+        logger.info("✅ TEST PASSED")
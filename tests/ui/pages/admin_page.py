@@ -1,44 +1,117 @@
 """
 Admin Page Object
 """
-from playwright.sync_api import Page
-from tests.ui.pages.base_page import BasePage
+from typing import Dict, Iterator, List, NamedTuple, Optional
+from tests.ui.pages.base_page import BasePage, ReadySignals, TableSnapshot
+from utilities.perf_budget import Budget
 from utilities.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class UserRow(NamedTuple):
+    """One row of the System Users table"""
+    username: str
+    user_role: str
+    employee_name: str
+    status: str
+
+
+class UserTable:
+    """System Users results of one table page, with indexed lookups by column"""
+
+    # Header text -> UserRow field
+    COLUMNS = {
+        "Username": "username",
+        "User Role": "user_role",
+        "Employee Name": "employee_name",
+        "Status": "status",
+    }
+
+    def __init__(self, snapshot: TableSnapshot):
+        positions = {field: snapshot.headers.index(header)
+                     for header, field in self.COLUMNS.items() if header in snapshot.headers}
+        if snapshot.rows and len(positions) != len(self.COLUMNS):
+            logger.warning(f"Unexpected users table headers: {snapshot.headers}")
+        self.rows: List[UserRow] = [
+            UserRow(**{field: cells[position] if position < len(cells) else ""
+                       for field, position in positions.items()})
+            for cells in snapshot.rows
+        ] if len(positions) == len(self.COLUMNS) else []
+        self.has_next_page = snapshot.has_next_page
+        self._indexes: Dict[str, Dict[str, List[UserRow]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[UserRow]:
+        return iter(self.rows)
+
+    def lookup(self, column: str, value: str) -> List[UserRow]:
+        """
+        Rows whose column equals value; the index is built on first use
+
+        Args:
+            column: UserRow field (username, user_role, employee_name, status)
+            value: Exact cell text
+
+        Returns:
+            Matching rows
+        """
+        if column not in UserRow._fields:
+            raise ValueError(f"Unknown column '{column}', expected one of: {UserRow._fields}")
+        if column not in self._indexes:
+            index: Dict[str, List[UserRow]] = {}
+            for row in self.rows:
+                index.setdefault(getattr(row, column), []).append(row)
+            self._indexes[column] = index
+        return self._indexes[column].get(value, [])
+
+
 class AdminPage(BasePage):
     """Admin Page interactions"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
+    # Readiness signals
+    USERS_LOADED = ReadySignals(api=("/api/v2/admin/users",))
+    TABLE_RENDERED = ReadySignals(selector=".oxd-table-card, span:text-is('No Records Found')",
+                                  replaced_sleep_ms=1000)
+    EMPLOYEE_HINTS_LOADED = ReadySignals(api=("/api/v2/pim/employees",),
+                                         selector=".oxd-autocomplete-option:not(:has-text('Searching'))",
+                                         replaced_sleep_ms=1000)
+
+    BUDGETS = {
+        "search_by_username": Budget(max_ms=800),
+    }
 
-        # Locators
-        self.page_title = "h6:has-text('Admin')"
-        self.add_button = "button:has-text('Add')"
-        self.search_button = "button[type='submit']"
-        self.reset_button = "button:has-text('Reset')"
+    LOCATORS = {
+        "page_title": "h6:has-text('Admin')",
+        "add_button": "role=button[name='Add']",
+        "search_button": "button[type='submit']",
+        "reset_button": "role=button[name='Reset']",
 
         # Search fields
-        self.username_search = "//label[text()='Username']/parent::div/following-sibling::div/input"
-        self.user_role_dropdown = "//label[text()='User Role']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']"
-        self.status_dropdown = "//label[text()='Status']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']"
+        "username_search": "//label[text()='Username']/parent::div/following-sibling::div/input",
+        "user_role_dropdown": "//label[text()='User Role']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']",
+        "status_dropdown": "//label[text()='Status']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']",
 
         # Table
-        self.table_row = ".oxd-table-card"
-        self.delete_button = "button:has-text('Delete')"
-        self.edit_button = "button:has-text('Edit')"
+        "table_row": ".oxd-table-card",
+        "delete_button": "button:has-text('Delete')",
+        "edit_button": "button:has-text('Edit')",
+        "confirm_delete_button": "role=button[name='Yes, Delete']",
+        "next_page_button": ".oxd-pagination-page-item--previous-next:has(.bi-chevron-right)",
 
         # Add/Edit User Form
-        self.user_role_field = "//label[text()='User Role']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']"
-        self.employee_name_field = "input[placeholder='Type for hints...']"
-        self.status_field = "//label[text()='Status']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']"
-        self.username_field = "//label[text()='Username']/parent::div/following-sibling::div/input"
-        self.password_field = "//label[text()='Password']/parent::div/following-sibling::div/input"
-        self.confirm_password_field = "//label[text()='Confirm Password']/parent::div/following-sibling::div/input"
-        self.save_button = "button[type='submit']"
-        self.cancel_button = "button:has-text('Cancel')"
+        "user_role_field": "//label[text()='User Role']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']",
+        "employee_name_field": "role=textbox[name='Type for hints...']",
+        "status_field": "//label[text()='Status']/parent::div/following-sibling::div//div[@class='oxd-select-text-input']",
+        "username_field": "//label[text()='Username']/parent::div/following-sibling::div/input",
+        "password_field": "//label[text()='Password']/parent::div/following-sibling::div/input",
+        "confirm_password_field": "//label[text()='Confirm Password']/parent::div/following-sibling::div/input",
+        "save_button": "button[type='submit']",
+        "cancel_button": "role=button[name='Cancel']",
+        "success_toast": ".oxd-toast--success",
+    }
 
     def is_admin_page_loaded(self) -> bool:
         """Check if admin page is loaded"""
@@ -59,29 +132,56 @@ class AdminPage(BasePage):
         """
         logger.info(f"Searching for username: {username}")
         self.fill(self.username_search, username)
-        self.click(self.search_button)
-        self.wait_for_loading_to_disappear()
+        self.run_until_ready(lambda: self.click(self.search_button), self.USERS_LOADED,
+                             label="AdminPage.search_by_username")
 
     def click_reset(self):
         """Click Reset button"""
         logger.info("Clicking Reset button")
-        self.click(self.reset_button)
+        self.run_until_ready(lambda: self.click(self.reset_button), self.USERS_LOADED,
+                             label="AdminPage.click_reset")
+
+    def wait_for_table(self):
+        """Wait until the results table shows rows or its empty state"""
+        # Nothing navigates here: wait on the element only, without a readiness or web vitals sample
+        self.locator(self.TABLE_RENDERED.selector).first.wait_for()
+
+    def get_user_table(self) -> UserTable:
+        """Read the current results page into typed rows (one round trip)"""
+        self.wait_for_table()
+        return UserTable(self.snapshot_table())
+
+    def iter_user_pages(self) -> Iterator[UserTable]:
+        """
+        Yield every results page, clicking through the pagination
+
+        Each page costs one snapshot round trip plus the page change itself.
+        """
+        table = self.get_user_table()
+        yield table
+        while table.has_next_page:
+            self.run_until_ready(lambda: self.click(self.next_page_button), self.USERS_LOADED,
+                                 label="AdminPage.next_page")
+            table = self.get_user_table()
+            yield table
+
+    def find_user(self, username: str) -> Optional[UserRow]:
+        """Find user by exact username across all results pages"""
+        for table in self.iter_user_pages():
+            rows = table.lookup("username", username)
+            if rows:
+                return rows[0]
+        return None
 
     def get_table_row_count(self) -> int:
         """Get number of rows in table"""
-        # Wait for table to load
-        self.page.wait_for_timeout(1000)
-        return self.page.locator(self.table_row).count()
+        self.wait_for_table()
+        return len(self.snapshot_table().rows)
 
     def is_user_found_in_table(self, username: str) -> bool:
-        """Check if user exists in table"""
+        """Check if user exists in the current results page"""
         try:
-            # Wait for results
-            self.page.wait_for_timeout(1000)
-
-            # Search in table cells
-            user_cell = self.page.locator(f".oxd-table-cell:has-text('{username}')")
-            is_found = user_cell.count() > 0
+            is_found = bool(self.get_user_table().lookup("username", username))
 
             if is_found:
                 logger.info(f"✅ User '{username}' found in table")
@@ -97,14 +197,26 @@ class AdminPage(BasePage):
     def click_first_delete_button(self):
         """Click delete button on first row"""
         logger.info("Clicking delete button on first row")
-        self.page.locator(self.delete_button).first.click()
+        self.locator(self.delete_button).first.click()
 
     def confirm_delete(self):
         """Confirm delete action"""
         logger.info("Confirming delete")
-        self.click("button:has-text('Yes, Delete')")
+        self.click(self.confirm_delete_button)
         self.wait_for_loading_to_disappear()
 
+    def select_option(self, field: str, option: str):
+        """
+        Open an OXD select and pick an option from its dropdown
+
+        Args:
+            field: Select field to open
+            option: Exact option text
+        """
+        self.click(field)
+        # Only the open listbox: "Admin" or "Enabled" also appear elsewhere on the page
+        self.click(f".oxd-select-dropdown [role='option']:text-is('{option}'):visible")
+
     def fill_add_user_form(self, user_role: str, employee_name: str, status: str,
                            username: str, password: str):
         """
@@ -120,18 +232,16 @@ class AdminPage(BasePage):
         logger.info(f"Filling add user form for: {username}")
 
         # Select user role
-        self.click(self.user_role_field)
-        self.click(f"text={user_role}")
+        self.select_option(self.user_role_field, user_role)
 
-        # Enter employee name
-        self.fill(self.employee_name_field, employee_name)
-        self.page.wait_for_timeout(1000)  # Wait for autocomplete
+        # Enter employee name and wait for the autocomplete hints
+        self.run_until_ready(lambda: self.fill(self.employee_name_field, employee_name),
+                             self.EMPLOYEE_HINTS_LOADED, label="AdminPage.employee_autocomplete")
         self.press_key(self.employee_name_field, "ArrowDown")
         self.press_key(self.employee_name_field, "Enter")
 
         # Select status
-        self.click(self.status_field)
-        self.click(f"text={status}")
+        self.select_option(self.status_field, status)
 
         # Enter credentials
         self.fill(self.username_field, username)
@@ -153,5 +263,5 @@ class AdminPage(BasePage):
 
     def assert_user_added_successfully(self):
         """Assert success message displayed"""
-        self.assert_element_visible(".oxd-toast--success", "Success message should be displayed")
+        self.assert_element_visible(self.success_toast, "Success message should be displayed")
         logger.info("✅ User added successfully")
\ No newline at end of file
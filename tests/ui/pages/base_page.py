@@ -1,73 +1,269 @@
 """
 Base Page Object - Parent class for all page objects
 """
-from playwright.sync_api import Page, expect
+import re
+import time
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from playwright.sync_api import Locator, Page, expect, TimeoutError as PlaywrightTimeoutError
+from utilities import perf_budget, run_stats, web_vitals
+from utilities.perf_budget import Budget
 from utilities.logger import get_logger
-from config.settings import TIMEOUT
+from config.settings import TIMEOUT, READY_API_TIMEOUT, SELECTOR_TIMING
 
 logger = get_logger(__name__)
 
+# OrangeHRM form fields: //label[text()='X']/parent::div/following-sibling::div/<tail>
+_LABEL_FIELD_XPATH = re.compile(
+    r"^//label\[text\(\)='(?P<label>[^']+)'\]/parent::div/following-sibling::div/{1,2}(?P<tail>.+)$"
+)
+_XPATH_STEP = re.compile(r"^(?P<tag>[a-z]+)(?:\[@class='(?P<cls>[\w-]+)'\])?$")
+
+
+def rewrite_selector(selector: str) -> str:
+    """
+    Rewrite label-anchored field XPath into the equivalent CSS selector
+
+    The label is matched exactly inside its .oxd-input-group, which lets the
+    browser resolve the field with one CSS query instead of an XPath walk.
+    Selectors that do not follow the pattern are returned unchanged.
+
+    Args:
+        selector: Selector as declared by a page object
+
+    Returns:
+        Selector to use with page.locator()
+    """
+    match = _LABEL_FIELD_XPATH.match(selector)
+    if not match:
+        return selector
+
+    step = _XPATH_STEP.match(match.group("tail"))
+    if not step:
+        return selector
+
+    target = step.group("tag")
+    if step.group("cls"):
+        target += f".{step.group('cls')}"
+    return f".oxd-input-group:has(label:text-is('{match.group('label')}')) {target}"
+
+
+class ReadySignals(NamedTuple):
+    """
+    Concrete signals that a page is ready, declared per page object
+
+    route: URL glob the page must reach (SPA route change or full navigation)
+    api: Substrings of API URLs whose responses must complete
+    selector: Element that is visible once the data is rendered
+    replaced_sleep_ms: Fixed sleep this wait replaces, for the timing log
+    """
+    route: Optional[str] = None
+    api: Tuple[str, ...] = ()
+    selector: Optional[str] = None
+    replaced_sleep_ms: int = 0
+
+
+class TableSnapshot(NamedTuple):
+    """Rendered content of an OXD table, read in one round trip"""
+    headers: List[str]
+    rows: List[List[str]]
+    has_next_page: bool
+
+
+# Reads header texts, every card's cell texts and the pagination state at once.
+# Selectors are plain CSS (document.querySelector), not Playwright selectors.
+_TABLE_SNAPSHOT_JS = """
+([tableSelector, nextPageSelector]) => {
+    const table = document.querySelector(tableSelector);
+    if (!table) return {headers: [], rows: [], hasNextPage: false};
+    const text = el => el.innerText.trim();
+    const headers = [...table.querySelectorAll('.oxd-table-header .oxd-table-th')].map(text);
+    const rows = [...table.querySelectorAll('.oxd-table-card')].map(
+        card => [...card.querySelectorAll('.oxd-table-cell')].map(text));
+    const next = document.querySelector(nextPageSelector);
+    return {headers, rows, hasNextPage: !!next && !next.disabled};
+}
+"""
+
 
 class BasePage:
     """Base Page Object with common methods"""
 
+    # Locator registry: attribute name -> selector. Prefer role (role=...) and
+    # label-anchored selectors; label XPath is rewritten to CSS on load.
+    LOCATORS: Dict[str, str] = {}
+
+    # Performance budgets: interaction name (run_until_ready label without the
+    # class prefix) -> Budget; config/test_data.json "performance_budgets" overrides
+    BUDGETS: Dict[str, Budget] = {}
+
     def __init__(self, page: Page):
         self.page = page
         self.timeout = TIMEOUT
+        self._locators: Dict[str, Locator] = {}
+        self._selector_names: Dict[str, str] = {}
+        # Interaction label -> durations in ms, recorded by run_until_ready and measure()
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+
+        for name, selector in self.LOCATORS.items():
+            resolved = rewrite_selector(selector)
+            setattr(self, name, resolved)
+            self._selector_names[resolved] = f"{type(self).__name__}.{name}"
+
+    def locator(self, selector: str) -> Locator:
+        """
+        Get the Locator for selector, built once per page object
+
+        Args:
+            selector: Selector string (usually a registry attribute)
+
+        Returns:
+            Cached Locator
+        """
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = self._locators[selector] = self.page.locator(selector)
+        return locator
 
-    def navigate_to(self, url: str):
-        """Navigate to URL"""
+    def _act(self, selector: str, action: Callable[[Locator], Any]) -> Any:
+        """Run action on the selector's Locator, timing resolution plus action"""
+        locator = self.locator(selector)
+        if not SELECTOR_TIMING:
+            return action(locator)
+
+        start = time.perf_counter()
+        try:
+            return action(locator)
+        finally:
+            name = self._selector_names.get(selector, selector[:80])
+            run_stats.observe("selectors", name, (time.perf_counter() - start) * 1000)
+
+    def navigate_to(self, url: str, ready: Optional[ReadySignals] = None):
+        """
+        Navigate to URL
+
+        Args:
+            url: Target URL
+            ready: Signals to wait for instead of network idle
+        """
         logger.info(f"Navigating to: {url}")
-        self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
+        self.run_until_ready(
+            lambda: self.page.goto(url, wait_until="domcontentloaded"),
+            ready or ReadySignals(),
+            label=f"{type(self).__name__}.navigate_to",
+        )
+
+    def run_until_ready(self, action: Callable[[], None], ready: ReadySignals, label: str = ""):
+        """
+        Run action, then wait until the declared readiness signals are met
+
+        API waiters are registered before the action so fast responses are not
+        missed. Each wait is logged with its duration and the fixed sleep it
+        replaced. When web vitals are enabled for the context, the metrics of
+        the resulting page are recorded as well.
+
+        Args:
+            action: Interaction that triggers the page change (click, goto, ...)
+            ready: Readiness signals of the resulting page
+            label: Name used in logs and run statistics
+        """
+        vitals_before = web_vitals.mark(self.page) if web_vitals.is_installed(self.page) else None
+        start = time.perf_counter()
+
+        with ExitStack() as stack:
+            waiters = [
+                stack.enter_context(self.page.expect_response(
+                    lambda response, fragment=fragment: fragment in response.url,
+                    timeout=READY_API_TIMEOUT,
+                ))
+                for fragment in ready.api
+            ]
+            action()
+            try:
+                stack.close()
+                for waiter in waiters:
+                    waiter.value.finished()
+            except PlaywrightTimeoutError:
+                logger.warning(f"{label}: API response {ready.api} not seen, continuing with DOM signals")
+
+        if ready.route:
+            self.page.wait_for_url(ready.route, wait_until="commit", timeout=self.timeout)
+        self.wait_for_loading_to_disappear()
+        if ready.selector:
+            self.locator(ready.selector).first.wait_for(state="visible", timeout=self.timeout)
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        run_stats.observe("readiness", label, elapsed_ms)
+        self.timings[label].append(elapsed_ms)
+        logger.debug("%s ready in %.0fms (fixed sleep replaced: %sms)",
+                     label, elapsed_ms, ready.replaced_sleep_ms)
+        if web_vitals.is_installed(self.page):
+            web_vitals.capture(self.page, vitals_before, elapsed_ms)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Record the duration of the enclosed block as a sample of interaction name
+
+        For interactions that do not end in run_until_ready. Failed blocks are
+        not recorded.
+
+        Args:
+            name: Interaction name, e.g. "login"
+        """
+        label = f"{type(self).__name__}.{name}"
+        start = time.perf_counter()
+        yield
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        run_stats.observe("readiness", label, elapsed_ms)
+        self.timings[label].append(elapsed_ms)
 
     def click(self, selector: str):
         """Click element"""
-        logger.debug(f"Clicking: {selector}")
-        self.page.locator(selector).click()
+        logger.debug("Clicking: %s", selector)
+        self._act(selector, lambda locator: locator.click())
 
     def fill(self, selector: str, text: str):
         """Fill input field"""
-        logger.debug(f"Filling '{selector}' with: {text}")
-        self.page.locator(selector).fill(text)
+        logger.debug("Filling '%s' with: %s", selector, text)
+        self._act(selector, lambda locator: locator.fill(text))
 
     def clear_and_fill(self, selector: str, text: str):
         """Clear and fill input field"""
-        logger.debug(f"Clearing and filling '{selector}' with: {text}")
-        element = self.page.locator(selector)
-        element.clear()
-        element.fill(text)
+        logger.debug("Clearing and filling '%s' with: %s", selector, text)
+        self._act(selector, lambda locator: (locator.clear(), locator.fill(text)))
 
     def get_text(self, selector: str) -> str:
         """Get text from element"""
-        text = self.page.locator(selector).inner_text()
-        logger.debug(f"Got text from '{selector}': {text}")
+        text = self._act(selector, lambda locator: locator.inner_text())
+        logger.debug("Got text from '%s': %s", selector, text)
         return text
 
     def is_visible(self, selector: str, timeout: int = 5000) -> bool:
         """Check if element is visible"""
         try:
-            self.page.locator(selector).wait_for(timeout=timeout, state="visible")
+            self.locator(selector).wait_for(timeout=timeout, state="visible")
             return True
         except:
             return False
 
     def is_enabled(self, selector: str) -> bool:
         """Check if element is enabled"""
-        return self.page.locator(selector).is_enabled()
+        return self.locator(selector).is_enabled()
 
     def wait_for_element(self, selector: str, state: str = "visible", timeout: int = None):
         """Wait for element with specified state"""
         if timeout is None:
             timeout = self.timeout
-        logger.debug(f"Waiting for '{selector}' to be {state}")
-        self.page.locator(selector).wait_for(timeout=timeout, state=state)
+        logger.debug("Waiting for '%s' to be %s", selector, state)
+        self.locator(selector).wait_for(timeout=timeout, state=state)
 
     def wait_for_url(self, url_pattern: str, timeout: int = None):
         """Wait for URL to match pattern"""
         if timeout is None:
             timeout = self.timeout
-        logger.debug(f"Waiting for URL: {url_pattern}")
+        logger.debug("Waiting for URL: %s", url_pattern)
         self.page.wait_for_url(url_pattern, timeout=timeout)
 
     def get_current_url(self) -> str:
@@ -80,33 +276,50 @@ class BasePage:
 
     def press_key(self, selector: str, key: str):
         """Press key on element"""
-        logger.debug(f"Pressing {key} on: {selector}")
-        self.page.locator(selector).press(key)
+        logger.debug("Pressing %s on: %s", key, selector)
+        self._act(selector, lambda locator: locator.press(key))
 
     def hover(self, selector: str):
         """Hover over element"""
-        logger.debug(f"Hovering: {selector}")
-        self.page.locator(selector).hover()
+        logger.debug("Hovering: %s", selector)
+        self._act(selector, lambda locator: locator.hover())
 
     def select_dropdown(self, selector: str, value: str):
         """Select dropdown option"""
-        logger.debug(f"Selecting '{value}' from: {selector}")
-        self.page.locator(selector).select_option(value)
+        logger.debug("Selecting '%s' from: %s", value, selector)
+        self._act(selector, lambda locator: locator.select_option(value))
 
     def check_checkbox(self, selector: str):
         """Check checkbox"""
-        logger.debug(f"Checking checkbox: {selector}")
-        self.page.locator(selector).check()
+        logger.debug("Checking checkbox: %s", selector)
+        self._act(selector, lambda locator: locator.check())
 
     def uncheck_checkbox(self, selector: str):
         """Uncheck checkbox"""
-        logger.debug(f"Unchecking checkbox: {selector}")
-        self.page.locator(selector).uncheck()
+        logger.debug("Unchecking checkbox: %s", selector)
+        self._act(selector, lambda locator: locator.uncheck())
 
     def scroll_to_element(self, selector: str):
         """Scroll element into view"""
-        logger.debug(f"Scrolling to: {selector}")
-        self.page.locator(selector).scroll_into_view_if_needed()
+        logger.debug("Scrolling to: %s", selector)
+        self.locator(selector).scroll_into_view_if_needed()
+
+    def snapshot_table(self, table_selector: str = ".oxd-table",
+                       next_page_selector: str = ".oxd-pagination-page-item--previous-next:has(.bi-chevron-right)"
+                       ) -> TableSnapshot:
+        """
+        Read the whole rendered table with a single evaluate call
+
+        Args:
+            table_selector: Table container (CSS)
+            next_page_selector: Pagination "next" button (CSS)
+
+        Returns:
+            TableSnapshot with header texts, cell texts per row and paging state
+        """
+        data = self.page.evaluate(_TABLE_SNAPSHOT_JS, [table_selector, next_page_selector])
+        logger.debug("Table snapshot: %s rows", len(data['rows']))
+        return TableSnapshot(headers=data["headers"], rows=data["rows"], has_next_page=data["hasNextPage"])
 
     def take_screenshot(self, name: str):
         """Take screenshot"""
@@ -131,24 +344,24 @@ class BasePage:
         """Assert element is visible"""
         if message is None:
             message = f"Element should be visible: {selector}"
-        expect(self.page.locator(selector)).to_be_visible()
+        expect(self.locator(selector)).to_be_visible()
         logger.info(f"Assertion passed: {message}")
 
     def assert_element_hidden(self, selector: str, message: str = None):
         """Assert element is hidden"""
         if message is None:
             message = f"Element should be hidden: {selector}"
-        expect(self.page.locator(selector)).to_be_hidden()
+        expect(self.locator(selector)).to_be_hidden()
         logger.info(f"Assertion passed: {message}")
 
     def assert_text_equals(self, selector: str, expected_text: str):
         """Assert element text equals expected"""
-        expect(self.page.locator(selector)).to_have_text(expected_text)
+        expect(self.locator(selector)).to_have_text(expected_text)
         logger.info(f"Assertion passed: Text equals '{expected_text}'")
 
     def assert_text_contains(self, selector: str, expected_text: str):
         """Assert element text contains expected"""
-        expect(self.page.locator(selector)).to_contain_text(expected_text)
+        expect(self.locator(selector)).to_contain_text(expected_text)
         logger.info(f"Assertion passed: Text contains '{expected_text}'")
 
     def assert_url_contains(self, expected: str):
@@ -157,7 +370,30 @@ class BasePage:
         assert expected in current_url, f"Expected '{expected}' in URL, got: {current_url}"
         logger.info(f"Assertion passed: URL contains '{expected}'")
 
+    def assert_within_budget(self, name: str, budget: Optional[Budget] = None) -> Dict[str, float]:
+        """
+        Assert that the recorded durations of an interaction are within its budget
+
+        The budget is, in order: the budget argument, the label's entry in the
+        "performance_budgets" test data section, BUDGETS[name].
+
+        Args:
+            name: Interaction name, e.g. "search_by_username"
+            budget: Budget to use instead of the declared one
+
+        Returns:
+            Distribution of the recorded durations
+
+        Raises:
+            BudgetExceeded: The budgeted percentile is over the budget
+        """
+        label = f"{type(self).__name__}.{name}"
+        budget = budget or perf_budget.configured_budgets().get(label) or self.BUDGETS.get(name)
+        if budget is None:
+            raise KeyError(f"No performance budget declared for {label}")
+        return perf_budget.check(label, self.timings.get(label, []), budget)
+
     def assert_count(self, selector: str, expected_count: int):
         """Assert element count"""
-        expect(self.page.locator(selector)).to_have_count(expected_count)
+        expect(self.locator(selector)).to_have_count(expected_count)
         logger.info(f"Assertion passed: Count is {expected_count}")
\ No newline at end of file
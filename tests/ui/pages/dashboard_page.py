@@ -1,8 +1,8 @@
 """
 Dashboard Page Object
 """
-from playwright.sync_api import Page
-from tests.ui.pages.base_page import BasePage
+from tests.ui.pages.base_page import BasePage, ReadySignals
+from utilities.perf_budget import Budget
 from utilities.logger import get_logger
 from config.settings import URLs
 
@@ -12,28 +12,53 @@ logger = get_logger(__name__)
 class DashboardPage(BasePage):
     """Dashboard Page interactions"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        # Locators
-        self.dashboard_title = "h6:has-text('Dashboard')"
-        self.user_dropdown = ".oxd-userdropdown"
-        self.logout_button = "text=Logout"
-
-        # Menu items - using flexible approach
-        self.admin_menu = ".oxd-main-menu-item:has-text('Admin')"
-        self.pim_menu = ".oxd-main-menu-item:has-text('PIM')"
-        self.leave_menu = ".oxd-main-menu-item:has-text('Leave')"
-        self.time_menu = ".oxd-main-menu-item:has-text('Time')"
-        self.recruitment_menu = ".oxd-main-menu-item:has-text('Recruitment')"
-        self.my_info_menu = ".oxd-main-menu-item:has-text('My Info')"
+    READY = ReadySignals(route="**/dashboard/index", api=("/api/v2/dashboard/",),
+                         selector="h6:has-text('Dashboard')")
+
+    # Readiness of the module pages reached from the main menu
+    ADMIN_READY = ReadySignals(route="**/admin/viewSystemUsers", api=("/api/v2/admin/users",),
+                               replaced_sleep_ms=1000)
+    PIM_READY = ReadySignals(route="**/pim/viewEmployeeList", api=("/api/v2/pim/employees",),
+                             replaced_sleep_ms=1000)
+    LEAVE_READY = ReadySignals(route="**/leave/viewLeaveList", api=("/api/v2/leave/",),
+                               replaced_sleep_ms=1000)
+    RECRUITMENT_READY = ReadySignals(route="**/recruitment/viewCandidates",
+                                     api=("/api/v2/recruitment/candidates",), replaced_sleep_ms=1000)
+
+    BUDGETS = {
+        "navigate": Budget(max_ms=2000),
+        "navigate_to_admin": Budget(max_ms=2000),
+        "navigate_to_pim": Budget(max_ms=2000),
+    }
+
+    LOCATORS = {
+        "dashboard_title": "h6:has-text('Dashboard')",
+        "user_dropdown": ".oxd-userdropdown",
+        "user_dropdown_menu": ".oxd-dropdown-menu",
+        "logout_button": "role=menuitem[name='Logout']",
+
+        # Menu items
+        "admin_menu": ".oxd-main-menu-item:has-text('Admin')",
+        "pim_menu": ".oxd-main-menu-item:has-text('PIM')",
+        "leave_menu": ".oxd-main-menu-item:has-text('Leave')",
+        "time_menu": ".oxd-main-menu-item:has-text('Time')",
+        "recruitment_menu": ".oxd-main-menu-item:has-text('Recruitment')",
+        "my_info_menu": ".oxd-main-menu-item:has-text('My Info')",
 
         # Dashboard widgets
-        self.time_at_work_widget = "text=Time at Work"
-        self.quick_launch_widget = ".orangehrm-dashboard-widget"
+        "time_at_work_widget": "text=Time at Work",
+        "quick_launch_widget": ".orangehrm-dashboard-widget",
 
         # First-time login modal
-        self.first_login_modal = "div.modal--show h3:has-text('Welcome to OrangeHRM') OR div.modal--show h3:has-text('Welcome')"
+        "first_login_modal": "div.modal--show h3:has-text('Welcome')",
+        "first_login_modal_close": "div.modal--show button:has-text('×'), div.modal--show button:has-text('Close')",
+    }
+
+    def navigate(self):
+        """Open the dashboard (requires a logged-in context)"""
+        logger.info("Navigating to Dashboard")
+        self.run_until_ready(lambda: self.page.goto(URLs.DASHBOARD, wait_until="domcontentloaded"), self.READY,
+                             label="DashboardPage.navigate")
 
     def handle_first_login_modal(self):
         """Handle the 'Welcome' modal that appears on first login"""
@@ -41,10 +66,10 @@ class DashboardPage(BasePage):
             if self.is_visible(self.first_login_modal, timeout=5000):
                 logger.info("First login modal detected. Closing it.")
                 # Close button is usually the 'x' in the top right
-                close_button = self.page.locator("button:has-text('×'), button:has-text('Close')")
+                close_button = self.locator(self.first_login_modal_close)
                 if close_button.is_visible(timeout=2000):
                     close_button.click()
-                    self.page.wait_for_timeout(1000)  # Give it time to disappear
+                    self.wait_for_element(self.first_login_modal, state="hidden")
                     logger.info("First login modal closed.")
         except Exception as e:
             logger.warning(f"No first login modal found or error handling it: {str(e)}")
@@ -66,37 +91,33 @@ class DashboardPage(BasePage):
         """Logout from application"""
         logger.info("Logging out")
         self.click_user_dropdown()
-        self.page.wait_for_timeout(500)  # Small wait for dropdown
+        self.wait_for_element(self.user_dropdown_menu)
         self.click(self.logout_button)
         self.wait_for_url("**/auth/login")
 
     def navigate_to_admin(self):
         """Navigate to Admin page"""
         logger.info("Navigating to Admin")
-        self.click(self.admin_menu)
-        self.page.wait_for_timeout(1000)  # Wait for page transition
-        self.wait_for_loading_to_disappear()
+        self.run_until_ready(lambda: self.click(self.admin_menu), self.ADMIN_READY,
+                             label="DashboardPage.navigate_to_admin")
 
     def navigate_to_pim(self):
         """Navigate to PIM page"""
         logger.info("Navigating to PIM")
-        self.click(self.pim_menu)
-        self.page.wait_for_timeout(1000)
-        self.wait_for_loading_to_disappear()
+        self.run_until_ready(lambda: self.click(self.pim_menu), self.PIM_READY,
+                             label="DashboardPage.navigate_to_pim")
 
     def navigate_to_leave(self):
         """Navigate to Leave page"""
         logger.info("Navigating to Leave")
-        self.click(self.leave_menu)
-        self.page.wait_for_timeout(1000)
-        self.wait_for_loading_to_disappear()
+        self.run_until_ready(lambda: self.click(self.leave_menu), self.LEAVE_READY,
+                             label="DashboardPage.navigate_to_leave")
 
     def navigate_to_recruitment(self):
         """Navigate to Recruitment"""
         logger.info("Navigating to Recruitment")
-        self.click(self.recruitment_menu)
-        self.page.wait_for_timeout(1000)
-        self.wait_for_loading_to_disappear()
+        self.run_until_ready(lambda: self.click(self.recruitment_menu), self.RECRUITMENT_READY,
+                             label="DashboardPage.navigate_to_recruitment")
 
     # Assertions
     def assert_on_dashboard(self):
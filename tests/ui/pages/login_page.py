@@ -1,8 +1,11 @@
 """
 Login Page Object
 """
-from playwright.sync_api import Page, expect
-from tests.ui.pages.base_page import BasePage
+import time
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from tests.ui.pages.base_page import BasePage, ReadySignals
+from utilities import web_vitals
+from utilities.perf_budget import Budget
 from utilities.logger import get_logger
 from config.settings import URLs
 
@@ -12,22 +15,27 @@ logger = get_logger(__name__)
 class LoginPage(BasePage):
     """Login Page interactions"""
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        # Locators
-        self.username_input = "input[name='username']"
-        self.password_input = "input[name='password']"
-        self.login_button = "button[type='submit']"
-        self.error_message = ".oxd-alert-content-text"
-        self.forgot_password_link = "text=Forgot your password?"
-        self.logo = ".orangehrm-login-branding img"
-        self.login_container = ".orangehrm-login-container"
+    BUDGETS = {
+        "login": Budget(max_ms=1500),
+    }
+
+    LOCATORS = {
+        "username_input": "input[name='username']",
+        "password_input": "input[name='password']",
+        "login_button": "button[type='submit']",
+        "error_message": ".oxd-alert-content-text",
+        "forgot_password_link": "text=Forgot your password?",
+        "logo": ".orangehrm-login-branding img",
+        "login_container": ".orangehrm-login-container",
+        "field_error": ".oxd-input-field-error-message",
+        # Top bar of the page reached after a successful login
+        "logged_in_header": ".oxd-topbar-header",
+    }
 
     def navigate(self):
         """Navigate to login page"""
         logger.info("Navigating to Login page")
-        self.navigate_to(URLs.LOGIN)
+        self.navigate_to(URLs.LOGIN, ReadySignals(selector=self.login_container))
 
     def enter_username(self, username: str):
         """Enter username"""
@@ -56,7 +64,23 @@ class LoginPage(BasePage):
         logger.info(f"Logging in with username: {username}")
         self.enter_username(username)
         self.enter_password(password)
-        self.click_login_button()
+        vitals = web_vitals.is_installed(self.page)
+        before = web_vitals.mark(self.page) if vitals else None
+        start = time.perf_counter()
+        # Click until the landing page or an error shows (budget "login")
+        with self.measure("login"):
+            self.click_login_button()
+            self._wait_for_login_outcome()
+        if vitals and "/auth/login" not in self.page.url:
+            web_vitals.capture(self.page, before, (time.perf_counter() - start) * 1000)
+
+    def _wait_for_login_outcome(self):
+        """Wait until the landing page or a login error is visible"""
+        outcome = self.locator(f"{self.logged_in_header}, {self.error_message}, {self.field_error}").first
+        try:
+            outcome.wait_for(state="visible", timeout=self.timeout)
+        except PlaywrightTimeoutError:
+            logger.warning("Neither the landing page nor a login error appeared after login")
 
     def is_error_displayed(self) -> bool:
         """Check if error message is displayed"""
@@ -6,7 +6,7 @@ from playwright.sync_api import Page
 from tests.ui.pages.dashboard_page import DashboardPage
 from tests.ui.pages.admin_page import AdminPage
 from utilities.logger import get_logger
-from utilities.generate_data import UserDataGenerator
+from utilities.data_registry import data_tag
 
 logger = get_logger(__name__)
 
@@ -88,7 +88,6 @@ class TestAdminCRUD:
 
         # Reset filters
         admin_page.click_reset()
-        authenticated_page.wait_for_timeout(1000)
 
         # Verify filters cleared (more results should appear)
         assert admin_page.get_table_row_count() > 0, "Should show all users after reset"
@@ -113,21 +112,21 @@ class TestAdminCRUD:
 
         logger.info(" TEST PASSED")
 
-    @pytest.mark.skip(reason="Requires valid employee name - may fail due to data constraints")
-    def test_add_new_user(self, authenticated_page: Page):
+    def test_add_new_user(self, authenticated_page: Page, seeded_data, data_pool, data_registry):
         """
-        Test adding a new user (SKIPPED - requires valid employee)
+        Test adding a new user
 
-        Note: This test is skipped because it requires a valid employee name
-        which may not exist in the demo environment.
+        Links the user to the "Test Employee" created by the seeded_data fixture.
         """
-        logger.info(" TEST: Add new user (SKIPPED)")
+        logger.info(" TEST: Add new user")
 
         dashboard = DashboardPage(authenticated_page)
         admin_page = AdminPage(authenticated_page)
 
-        # Generate test data
-        user_data = UserDataGenerator.generate_user()
+        # Generate test data, tagged for cleanup
+        user_data = data_pool.users.take(1)[0]
+        username = f"{data_tag()}_{user_data['username'][:16]}"
+        data_registry.register_username(username)
 
         dashboard.navigate_to_admin()
         admin_page.click_add_button()
@@ -137,7 +136,7 @@ class TestAdminCRUD:
             user_role="Admin",
             employee_name="Test Employee",
             status="Enabled",
-            username=user_data['username'],
+            username=username,
             password="Test@123456"
         )
 
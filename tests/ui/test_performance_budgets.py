@@ -0,0 +1,68 @@
+"""
+Performance Budget Tests
+
+Each test repeats one interaction PERF_BUDGET_SAMPLES times and asserts the
+distribution of its durations against the page object's budget.
+"""
+import pytest
+from playwright.sync_api import Page
+from config.settings import PERF_BUDGET_SAMPLES, TestUsers
+from tests.ui.pages.login_page import LoginPage
+from tests.ui.pages.dashboard_page import DashboardPage
+from tests.ui.pages.admin_page import AdminPage
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@pytest.mark.ui
+@pytest.mark.performance
+class TestPerformanceBudgets:
+    """Performance budget test suite"""
+
+    def test_login_within_budget(self, page: Page):
+        """Test login round trip stays within its budget"""
+        logger.info(" TEST: Login within budget")
+
+        login_page = LoginPage(page)
+        admin = TestUsers.ADMIN
+
+        for _ in range(PERF_BUDGET_SAMPLES):
+            page.context.clear_cookies()
+            login_page.navigate()
+            login_page.login(admin["username"], admin["password"])
+            login_page.assert_url_contains("/dashboard")
+
+        login_page.assert_within_budget("login")
+
+        logger.info(" TEST PASSED")
+
+    def test_dashboard_within_budget(self, authenticated_page: Page):
+        """Test dashboard load stays within its budget"""
+        logger.info(" TEST: Dashboard within budget")
+
+        dashboard = DashboardPage(authenticated_page)
+
+        for _ in range(PERF_BUDGET_SAMPLES):
+            dashboard.navigate()
+
+        dashboard.assert_on_dashboard()
+        dashboard.assert_within_budget("navigate")
+
+        logger.info(" TEST PASSED")
+
+    def test_admin_search_within_budget(self, authenticated_page: Page):
+        """Test System Users search stays within its budget"""
+        logger.info(" TEST: Admin search within budget")
+
+        dashboard = DashboardPage(authenticated_page)
+        admin_page = AdminPage(authenticated_page)
+
+        dashboard.navigate_to_admin()
+        for _ in range(PERF_BUDGET_SAMPLES):
+            admin_page.search_by_username(TestUsers.ADMIN["username"])
+
+        assert admin_page.get_table_row_count() > 0, "Search should find the admin user"
+        admin_page.assert_within_budget("search_by_username")
+
+        logger.info(" TEST PASSED")
@@ -0,0 +1,164 @@
+"""
+API Load Generator Tests
+
+Histograms, scenarios and reports are checked on synthetic data; no requests
+are sent.
+"""
+import csv
+import random
+import pytest
+from utilities import api_load
+from utilities.api_load import EndpointStats, LatencyHistogram, LoadProfile, Request, Scenario
+
+
+def _histogram(values) -> LatencyHistogram:
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    return histogram
+
+
+def _stats(latencies, errors=()) -> EndpointStats:
+    stats = EndpointStats()
+    for value in latencies:
+        stats.requests += 1
+        stats.latency.record(value)
+        stats.service.record(value / 2)
+    for error in errors:
+        stats.errors[error] += 1
+    return stats
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """Latency histogram test suite"""
+
+    @pytest.mark.parametrize("q, expected", [(50, 5000), (90, 9000), (99, 9900), (99.9, 9990)])
+    def test_percentiles_within_bucket_width(self, q, expected):
+        """Test percentiles of 1..10000 ms are accurate to the 1% bucket width"""
+        histogram = _histogram(range(1, 10001))
+
+        assert histogram.percentile(q) == pytest.approx(expected, rel=LatencyHistogram.RESOLUTION)
+
+    def test_extremes(self):
+        """Test the top percentile is the largest sample and an empty histogram reports 0"""
+        histogram = _histogram([0.001, 3.0, 250.0])
+
+        assert histogram.percentile(100) == 250.0
+        assert histogram.percentile(1) <= 2 * LatencyHistogram.LOWEST_MS
+        assert histogram.mean_ms == pytest.approx(253.001 / 3)
+        assert LatencyHistogram().percentile(99) == 0.0
+
+    def test_expected_interval_backfills_missing_requests(self):
+        """Test a 1000 ms response at a 10 ms pace also records the 99 requests not sent meanwhile"""
+        histogram = LatencyHistogram()
+        histogram.record(1000, 10)
+
+        assert histogram.count == 100
+        assert histogram.max_ms == 1000
+        assert histogram.percentile(50) == pytest.approx(500, rel=LatencyHistogram.RESOLUTION)
+
+    def test_response_within_interval_is_not_backfilled(self):
+        """Test responses faster than twice the interval record one sample"""
+        histogram = LatencyHistogram()
+        histogram.record(15, 10)
+        histogram.record(5, 10)
+
+        assert histogram.count == 2
+
+    def test_merge(self):
+        """Test merged histograms equal one histogram of all samples"""
+        first, second = _histogram(range(1, 501)), _histogram(range(501, 1001))
+
+        merged = LatencyHistogram().merge(first).merge(second)
+        combined = _histogram(range(1, 1001))
+
+        assert merged.counts == combined.counts
+        assert (merged.count, merged.max_ms, merged.mean_ms) == (1000, 1000, combined.mean_ms)
+        assert [merged.percentile(q) for q in api_load.PERCENTILES] == \
+            [combined.percentile(q) for q in api_load.PERCENTILES]
+
+
+@pytest.mark.unit
+class TestScenario:
+    """Scenario test suite"""
+
+    def test_pick_follows_weights(self):
+        """Test requests are drawn in proportion to their weights"""
+        scenario = Scenario().add("GET", "/admin/users", weight=3).add("GET", "/pim/employees", weight=1)
+        rng = random.Random(0)
+
+        picks = [scenario.pick(rng).url for _ in range(4000)]
+
+        assert picks.count("/admin/users") / len(picks) == pytest.approx(0.75, abs=0.03)
+
+    def test_task_builds_request_per_pick(self):
+        """Test a task function is called with the rng for every pick"""
+        scenario = Scenario()
+
+        @scenario.task(weight=2)
+        def employee(rng):
+            return Request("GET", f"/pim/employees/{rng.randint(1, 1000)}", name="GET employee")
+
+        requests = {scenario.pick(random.Random(seed)) for seed in range(5)}
+        assert {request.label for request in requests} == {"GET employee"}
+        assert len({request.url for request in requests}) > 1
+
+    def test_label_defaults_to_method_and_api_path(self):
+        """Test unnamed requests are labelled with the path below /api/v2"""
+        request = Request("GET", "http://hrm/web/index.php/api/v2/admin/users")
+
+        assert request.label == "GET /admin/users"
+
+    def test_invalid_scenarios_raise(self):
+        """Test empty scenarios and non-positive weights are rejected"""
+        with pytest.raises(ValueError, match="no requests"):
+            Scenario("empty").pick(random.Random(0))
+        with pytest.raises(ValueError, match="Weight"):
+            Scenario().add("GET", "/admin/users", weight=0)
+
+
+@pytest.mark.unit
+class TestReport:
+    """API load report test suite"""
+
+    def test_summarize(self):
+        """Test rows per label, sorted, with a total row over all labels"""
+        stats = {"list users": _stats(range(1, 101), errors=["503", "503"]),
+                 "list employees": _stats([10, 20])}
+
+        rows = api_load.summarize(stats, elapsed=2)
+
+        assert list(rows) == ["list employees", "list users", "total"]
+        users = rows["list users"]
+        assert (users["requests"], users["errors"], users["error_rate"], users["per_second"]) == (100, 2, 0.02, 50)
+        assert users["error_breakdown"] == {"503": 2}
+        assert users["latency_max"] == 100 and users["service_max"] == 50
+        assert users["latency_p50"] == pytest.approx(50, rel=LatencyHistogram.RESOLUTION)
+        assert rows["total"]["requests"] == 102 and rows["total"]["latency_max"] == 100
+        assert {f"latency_p{q:g}" for q in api_load.PERCENTILES} <= set(users)
+
+    def test_write_csv(self, tmp_path):
+        """Test the CSV has one row per label with rounded numbers and the error breakdown"""
+        stats = {"list users": _stats([1.23456, 2.5], errors=["503", "ClientConnectorError", "503"])}
+        path = tmp_path / "load" / "api_load.csv"
+
+        api_load.write_csv(api_load.summarize(stats, elapsed=3), path)
+
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert [row["request"] for row in rows] == ["list users", "total"]
+        assert rows[0]["requests"] == "2" and rows[0]["latency_max"] == "2.5"
+        assert rows[0]["per_second"] == "0.667"
+        assert rows[0]["error_breakdown"] == "503:2 ClientConnectorError:1"
+
+    @pytest.mark.parametrize("pace_ms", [0.001, 1, -5])
+    def test_tiny_pace_is_rejected(self, pace_ms):
+        """Test closed-loop pacing with an unbounded backfill cost is refused before sending"""
+        with pytest.raises(ValueError, match="pace-ms"):
+            api_load.run(LoadProfile(users=1, pace_ms=pace_ms, duration=1), login=False)
+
+    def test_back_to_back_and_open_loop_pace_accepted(self):
+        """Test pace 0 (closed loop) and any pace in open loop pass the check"""
+        api_load._check_pace(LoadProfile(users=1, pace_ms=0))
+        api_load._check_pace(LoadProfile(rate=100, pace_ms=0.001))
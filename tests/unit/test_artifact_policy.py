@@ -0,0 +1,184 @@
+"""
+Artifact Policy Tests
+
+Policy decisions are checked directly; the on-failure flow runs a small suite
+under a copy of the project conftest in a subprocess, with a fake browser
+context, and checks which traces are kept.
+"""
+import os
+from types import SimpleNamespace
+import pytest
+from config.settings import ROOT_DIR
+from utilities.artifacts import ArtifactPolicy
+
+pytest_plugins = ["pytester"]
+
+INNER_TESTS = '''
+import pytest
+
+
+class FakeTracing:
+    def start(self, **kwargs):
+        pass
+
+    def stop(self, path=None):
+        if path:
+            with open(path, "wb") as f:
+                f.write(b"trace")
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+    def new_page(self):
+        return FakePage(self)
+
+
+class FakePage:
+    video = None
+
+    def __init__(self, context):
+        self.context = context
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def screenshot(self, path, **kwargs):
+        with open(path, "wb") as f:
+            f.write(b"png")
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def context():
+    return FakeContext()
+
+
+def test_passes(page):
+    assert page
+
+
+def test_fails(page):
+    assert False
+'''
+
+
+@pytest.fixture
+def run_suite(pytester, monkeypatch):
+    """Run INNER_TESTS under the project conftest; returns (result, reports dir)"""
+    reports = pytester.path / "reports"
+    monkeypatch.setenv("PYTHONPATH", str(ROOT_DIR))
+    monkeypatch.setenv("REPORTS_DIR", str(reports))
+    monkeypatch.setenv("ARTIFACT_POLICY", "on-failure")
+    monkeypatch.setenv("ARTIFACT_VIDEO", "false")
+    monkeypatch.setenv("STANDIN", "false")
+    monkeypatch.setenv("DATA_POOL", "false")
+    monkeypatch.setenv("ORPHAN_SWEEP", "false")
+    for name in list(os.environ):
+        if name.startswith("PYTEST_XDIST"):
+            monkeypatch.delenv(name)
+
+    def run(*args):
+        pytester.makeconftest((ROOT_DIR / "conftest.py").read_text())
+        pytester.makepyfile(test_inner=INNER_TESTS)
+        # Without pytest-playwright, whose own makereport hook would also set item.rep_call
+        result = pytester.runpytest_subprocess("-p", "no:playwright", "-p", "no:cacheprovider", "-o", "addopts=",
+                                               *args)
+        return result, reports
+
+    return run
+
+
+@pytest.mark.unit
+class TestArtifactPolicy:
+    """Artifact policy test suite"""
+
+    def test_on_failure_keeps_only_failing_traces(self, run_suite):
+        """Test a passing test leaves no trace under on-failure, a failing one does"""
+        result, reports = run_suite()
+        result.assert_outcomes(passed=1, failed=1)
+
+        traces = sorted(path.name for path in (reports / "traces").iterdir())
+        assert traces == ["test_inner.py-test_fails.zip"]
+
+    def test_on_first_retry_requires_rerunfailures(self, run_suite):
+        """Test on-first-retry is refused when no plugin reruns tests"""
+        result, _ = run_suite("-p", "no:rerunfailures", "--artifact-policy", "on-first-retry")
+
+        assert result.ret == pytest.ExitCode.USAGE_ERROR
+        result.stderr.fnmatch_lines(["*on-first-retry needs pytest-rerunfailures*"])
+
+
+def _item(nodeid: str = "tests/ui/test_login.py::TestLogin::test_valid", **attributes):
+    """Stand-in for a pytest item"""
+    return SimpleNamespace(nodeid=nodeid, **attributes)
+
+
+@pytest.mark.unit
+class TestArtifactPolicyModes:
+    """Recording and retention per policy mode"""
+
+    @pytest.mark.parametrize("value, mode, percent", [
+        ("on-failure", "on-failure", 10),
+        (" Sampled:25 ", "sampled", 25),
+        ("sampled:2.5", "sampled", 2.5),
+        ("off", "off", 10),
+    ])
+    def test_parse(self, value, mode, percent):
+        """Test policy strings, with an optional sampling percentage"""
+        policy = ArtifactPolicy.parse(value)
+
+        assert (policy.mode, policy.sample_percent) == (mode, percent)
+
+    def test_parse_rejects_unknown_mode(self):
+        """Test an unknown policy is an error rather than a silent default"""
+        with pytest.raises(ValueError, match="Unknown artifact policy"):
+            ArtifactPolicy.parse("always")
+
+    def test_off_records_and_keeps_nothing(self):
+        """Test off ignores failures"""
+        policy = ArtifactPolicy("off")
+
+        assert not policy.should_record(_item())
+        assert not policy.should_retain(_item(), failed=True)
+
+    def test_on_failure_keeps_failures_only(self):
+        """Test on-failure records every test and keeps the failed ones"""
+        policy = ArtifactPolicy("on-failure")
+
+        assert policy.should_record(_item())
+        assert policy.should_retain(_item(), failed=True)
+        assert not policy.should_retain(_item(), failed=False)
+
+    def test_sampled_is_stable_per_nodeid(self):
+        """Test sampling depends only on the test id and hits about the given share"""
+        policy = ArtifactPolicy("sampled", 25)
+        nodeids = [f"tests/ui/test_pages.py::test_page[{index}]" for index in range(2000)]
+
+        first = [policy.should_record(_item(nodeid)) for nodeid in nodeids]
+        again = [ArtifactPolicy.parse("sampled:25").should_record(_item(nodeid)) for nodeid in nodeids]
+
+        assert first == again
+        assert sum(first) / len(first) == pytest.approx(0.25, abs=0.04)
+        sampled = nodeids[first.index(True)]
+        unsampled = nodeids[first.index(False)]
+        assert policy.should_retain(_item(sampled), failed=False)
+        assert not policy.should_retain(_item(unsampled), failed=False)
+        assert policy.should_retain(_item(unsampled), failed=True)
+
+    def test_sampled_bounds(self):
+        """Test 0% and 100% sampling"""
+        assert not ArtifactPolicy("sampled", 0).should_record(_item())
+        assert ArtifactPolicy("sampled", 100).should_record(_item())
+
+    @pytest.mark.parametrize("execution_count, recorded", [(None, False), (1, False), (2, True), (3, False)])
+    def test_on_first_retry_records_the_first_rerun(self, execution_count, recorded):
+        """Test only the first rerun (execution_count 2 from pytest-rerunfailures) is recorded and kept"""
+        policy = ArtifactPolicy("on-first-retry")
+        item = _item() if execution_count is None else _item(execution_count=execution_count)
+
+        assert policy.should_record(item) == recorded
+        assert policy.should_retain(item, failed=False) == recorded
@@ -0,0 +1,68 @@
+"""
+Authenticated Session Cache Tests
+"""
+import pytest
+from utilities.auth_cache import AuthStateCache
+
+STATE = {
+    "cookies": [{"name": "orangehrm", "value": "abc", "domain": "127.0.0.1", "path": "/"}],
+    "origins": [{"origin": "http://127.0.0.1:8765", "localStorage": [{"name": "theme", "value": "dark"}]}],
+}
+
+
+class FakeContext:
+    """Browser context recording added cookies and init scripts"""
+
+    def __init__(self):
+        self.cookies = []
+        self.init_scripts = []
+
+    def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = AuthStateCache(browser=None, state_dir=tmp_path, via_api=False)
+    cache._states["Admin"] = STATE
+    return cache
+
+
+@pytest.mark.unit
+class TestAuthStateCache:
+    """Authenticated session cache test suite"""
+
+    def test_apply_adds_local_storage_script_once(self, cache):
+        """Test re-applying the same state does not stack init scripts"""
+        context = FakeContext()
+
+        for _ in range(3):
+            cache.apply(context, "Admin")
+
+        assert len(context.cookies) == 3
+        assert len(context.init_scripts) == 1
+        assert '"theme"' in context.init_scripts[0]
+
+    def test_apply_per_context_and_state(self, cache):
+        """Test each context gets its own script, and a changed state adds one"""
+        first, second = FakeContext(), FakeContext()
+        cache.apply(first, "Admin")
+        cache.apply(second, "Admin")
+
+        cache._states["Admin"] = {**STATE, "origins": [{**STATE["origins"][0],
+                                                         "localStorage": [{"name": "theme", "value": "light"}]}]}
+        cache.apply(first, "Admin")
+
+        assert (len(first.init_scripts), len(second.init_scripts)) == (2, 1)
+
+    def test_apply_without_local_storage(self, cache):
+        """Test API login states (cookies only) add no init script"""
+        cache._states["Admin"] = {"cookies": STATE["cookies"], "origins": []}
+        context = FakeContext()
+
+        cache.apply(context, "Admin")
+
+        assert context.init_scripts == []
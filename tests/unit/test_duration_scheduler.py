@@ -0,0 +1,136 @@
+"""
+Duration Scheduler Tests
+
+The scheduler runs against fake xdist nodes that record the test indexes they
+are sent; no workers are started.
+"""
+import json
+from types import SimpleNamespace
+import pytest
+from utilities.duration_scheduler import DurationHistory, DurationScheduling
+
+
+class FakeConfig:
+    """Config with two popen workers (-n 2)"""
+
+    def getvalue(self, name):
+        return ["popen", "popen"] if name == "tx" else None
+
+
+class FakeNode:
+    """Worker node that records the tests sent to it"""
+
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.append(list(indices))
+
+    def shutdown(self):
+        pass
+
+
+def _history(tmp_path, durations: dict) -> DurationHistory:
+    history = DurationHistory(tmp_path / "durations.json")
+    history.durations = dict(durations)
+    return history
+
+
+def _schedule(history: DurationHistory, collection: list, workers: int = 2):
+    """Run the initial distribution; returns the scheduler and its nodes"""
+    sched = DurationScheduling(FakeConfig(), history=history)
+    nodes = [FakeNode(f"gw{index}") for index in range(workers)]
+    for node in nodes:
+        sched.add_node(node)
+        sched.add_node_collection(node, collection)
+    sched.schedule()
+    return sched, nodes
+
+
+@pytest.mark.unit
+class TestDurationHistory:
+    """Duration history test suite"""
+
+    def test_save_smooths_with_previous_runs(self, tmp_path):
+        """Test phases are summed per test and merged as a moving average"""
+        history = _history(tmp_path, {"a": 2.0})
+        history.add("a", 1.0)
+        history.add("a", 3.0)
+        history.add("b", 5.0)
+
+        history.save()
+
+        expected = {"a": 0.5 * 4.0 + 0.5 * 2.0, "b": 5.0}
+        assert history.durations == expected
+        assert json.loads((tmp_path / "durations.json").read_text()) == expected
+        assert DurationHistory(tmp_path / "durations.json").durations == expected
+
+    def test_save_without_results_writes_nothing(self, tmp_path):
+        """Test a run without durations leaves no history file"""
+        _history(tmp_path, {"a": 2.0}).save()
+
+        assert not (tmp_path / "durations.json").exists()
+
+    def test_unknown_test_gets_the_median(self, tmp_path):
+        """Test a test without history is estimated at the median of the known ones"""
+        history = _history(tmp_path, {"a": 1.0, "b": 9.0, "c": 3.0})
+
+        assert history.estimate("b") == 9.0
+        assert history.estimate("new") == 3.0
+
+    def test_empty_history_gets_the_default(self, tmp_path):
+        """Test every test is estimated at DEFAULT_DURATION without history"""
+        assert DurationHistory(tmp_path / "missing.json").estimate("new") == DurationHistory.DEFAULT_DURATION
+
+    def test_unreadable_history_is_ignored(self, tmp_path):
+        """Test a corrupt history file starts an empty history"""
+        path = tmp_path / "durations.json"
+        path.write_text("{not json")
+
+        assert DurationHistory(path).durations == {}
+
+
+@pytest.mark.unit
+class TestDurationScheduling:
+    """Duration-aware scheduling test suite"""
+
+    def test_split_scope_keeps_classes_below_an_even_share(self, tmp_path):
+        """Test a class longer than the total over the workers is split into single tests"""
+        history = _history(tmp_path, {"t.py::Slow::a": 30, "t.py::Slow::b": 30,
+                                      "t.py::Fast::a": 1, "t.py::Fast::b": 1})
+        sched = DurationScheduling(FakeConfig(), history=history)
+        sched.add_node(FakeNode("gw0"))
+        sched.add_node(FakeNode("gw1"))
+        sched.collection = list(history.durations)
+
+        assert sched._split_scope("t.py::Slow::a") == "t.py::Slow::a"
+        assert sched._split_scope("t.py::Fast::a") == "t.py::Fast"
+
+    def test_work_queue_is_longest_first(self, tmp_path):
+        """Test the longest units are handed out first, whatever their test count"""
+        durations = {"a.py::A::1": 1, "a.py::A::2": 1, "a.py::A::3": 1,
+                     "b.py::B::1": 6, "c.py::C::1": 4, "c.py::C::2": 1,
+                     "d.py::D::1": 2, "e.py::E::1": 0.5}
+        collection = list(durations)
+
+        sched, nodes = _schedule(_history(tmp_path, durations), collection)
+
+        first_units = [{collection[index].split("::")[0] for index in node.sent[0]} for node in nodes]
+        assert first_units == [{"b.py"}, {"c.py"}]
+        # Second round: the next longest, while the shortest units stay queued
+        assert [collection[node.sent[1][0]].split("::")[0] for node in nodes] == ["a.py", "d.py"]
+        assert list(sched.workqueue) == ["e.py::E"]
+
+    def test_unknown_tests_are_estimated_at_the_median(self, tmp_path):
+        """Test a new class is ordered by the median estimate of its tests"""
+        durations = {"a.py::A::1": 1, "b.py::B::1": 3, "c.py::C::1": 10}
+        collection = list(durations) + ["new.py::New::1", "new.py::New::2", "new.py::New::3"]
+        history = _history(tmp_path, durations)
+
+        sched, nodes = _schedule(history, collection)
+
+        assert sched._unit_duration({nodeid: False for nodeid in collection[3:]}) == 9
+        assert [collection[node.sent[0][0]].split("::")[0] for node in nodes] == ["c.py", "new.py"]
+        assert list(sched.workqueue) == ["a.py::A"]
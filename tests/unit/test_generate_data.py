@@ -0,0 +1,88 @@
+"""
+Batch Data Generator Tests
+"""
+from datetime import date
+import pytest
+from utilities import generate_data
+from utilities.generate_data import BatchDataGenerator
+
+
+@pytest.fixture
+def fresh_sequence(monkeypatch):
+    """Start the process-wide sequence numbers at zero, as in a new process"""
+    monkeypatch.setattr(BatchDataGenerator, "_sequence", 0)
+
+
+@pytest.mark.unit
+class TestBatchDataGenerator:
+    """Batch data generator test suite"""
+
+    def test_ids_are_unique_across_worker_slots(self, fresh_sequence):
+        """Test employeeId, username and email never collide between two workers"""
+        employees, users = [], []
+        for worker in (0, 1):
+            generator = BatchDataGenerator(seed=7, worker=worker, pool_size=20)
+            employees += generator.employees(1500)
+            users += generator.users(1500)
+
+        for field in ("employeeId", "email"):
+            values = [employee[field] for employee in employees]
+            assert len(set(values)) == len(values), f"Duplicate {field}"
+        usernames = [user["username"] for user in users]
+        assert len(set(usernames)) == len(usernames)
+        assert all(len(employee["employeeId"]) == 10 for employee in employees)
+
+    def test_same_seed_gives_same_data(self, monkeypatch, fresh_sequence):
+        """Test a seeded generator repeats its records, and another slot differs"""
+        def generate(worker: int):
+            monkeypatch.setattr(BatchDataGenerator, "_sequence", 0)
+            generator = BatchDataGenerator(seed=42, worker=worker, pool_size=20)
+            return generator.employees(5), generator.users(5), generator.leave_requests(5)
+
+        assert generate(3) == generate(3)
+        assert generate(3) != generate(4)
+
+    def test_iter_streams_without_count(self, fresh_sequence):
+        """Test the unbounded iterators yield records lazily, one chunk at a time"""
+        generator = BatchDataGenerator(seed=1, worker=0, pool_size=20)
+
+        stream = generator.iter_employees()
+        first = [next(stream) for _ in range(3)]
+
+        assert [employee["employeeId"] for employee in first] == ["0000000000", "0000000001", "0000000002"]
+        assert BatchDataGenerator._sequence == BatchDataGenerator.CHUNK_SIZE
+        leave = next(generator.iter_leave_requests())
+        assert leave["fromDate"] <= leave["toDate"]
+
+    def test_exhausted_id_space_raises(self, monkeypatch, fresh_sequence):
+        """Test records beyond the worker's id space are refused"""
+        monkeypatch.setattr(BatchDataGenerator, "ID_SPACE", 10)
+        generator = BatchDataGenerator(seed=1, worker=0, pool_size=20)
+
+        assert len(generator.employees(10)) == 10
+        with pytest.raises(ValueError, match="exhausted"):
+            generator.employees(1)
+
+    def test_birth_dates_on_leap_day(self, monkeypatch, fresh_sequence):
+        """Test the generator can be built on 29 February"""
+        class LeapDay(date):
+            @classmethod
+            def today(cls):
+                return cls(2028, 2, 29)
+
+        monkeypatch.setattr(generate_data, "date", LeapDay)
+        generator = BatchDataGenerator(seed=1, worker=0, pool_size=20)
+
+        births = [employee["dateOfBirth"] for employee in generator.employees(200)]
+        assert "1963-02-28" <= min(births) and max(births) <= "2010-02-28"
+
+    def test_pool_slot_is_reserved(self, monkeypatch, fresh_sequence):
+        """Test the data pool's slot is usable explicitly but never by an xdist worker"""
+        pool = BatchDataGenerator(seed=1, worker=BatchDataGenerator.POOL_SLOT, pool_size=20)
+        assert pool.employees(1)[0]["employeeId"].startswith("999")
+
+        monkeypatch.setattr(generate_data, "get_worker_index", lambda: BatchDataGenerator.POOL_SLOT)
+        with pytest.raises(ValueError, match="data pool"):
+            BatchDataGenerator(seed=1, pool_size=20)
+        with pytest.raises(ValueError, match="data pool"):
+            BatchDataGenerator.next_employee_id()
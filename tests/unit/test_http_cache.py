@@ -0,0 +1,79 @@
+"""
+HTTP Cache Tests
+
+Responses come from a fake fetch function; no requests are sent.
+"""
+import pytest
+from utilities.http_cache import HTTPCache
+
+
+class FakeResponse:
+    """Response with a status code and headers only"""
+
+    def __init__(self, status_code: int = 200, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class CountingFetch:
+    """Fetch function that returns the given responses in order and records the headers sent"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def __call__(self, headers):
+        self.headers.append(headers)
+        return self.responses.pop(0)
+
+
+URL = "http://hrm/web/index.php/api/v2/pim/employees"
+
+
+@pytest.mark.unit
+class TestHTTPCache:
+    """HTTP cache test suite"""
+
+    def test_key_ignores_param_order(self):
+        """Test the same params in another order give the same key"""
+        assert HTTPCache.key("get", URL, {"limit": 50, "offset": 0}, "admin") == \
+            HTTPCache.key("GET", URL, {"offset": 0, "limit": 50}, "admin")
+
+    def test_key_accepts_list_params(self):
+        """Test list-valued params are hashable keys, and their order is part of the key"""
+        key = HTTPCache.key("GET", URL, {"includeEmployees": ["onlyCurrent", "past"], "limit": 50}, "admin")
+
+        assert hash(key)
+        assert key == HTTPCache.key("GET", URL, {"limit": 50, "includeEmployees": ("onlyCurrent", "past")}, "admin")
+        assert key != HTTPCache.key("GET", URL, {"includeEmployees": ["past", "onlyCurrent"], "limit": 50}, "admin")
+
+    def test_list_params_are_cached(self):
+        """Test a request with list-valued params is fetched once and then served from the cache"""
+        cache = HTTPCache(max_entries=10, ttl=60)
+        fetch = CountingFetch(FakeResponse())
+        key = HTTPCache.key("GET", URL, {"empNumber": [7, 8]}, "admin")
+
+        first = cache.fetch(key, fetch)
+
+        assert cache.fetch(HTTPCache.key("GET", URL, {"empNumber": [7, 8]}, "admin"), fetch) is first
+        assert len(fetch.headers) == 1
+
+    def test_stale_entry_is_revalidated(self):
+        """Test a stale entry is asked for with its ETag and reused on 304"""
+        cache = HTTPCache(max_entries=10, ttl=0)
+        fetch = CountingFetch(FakeResponse(headers={"ETag": '"v1"'}), FakeResponse(304))
+        key = HTTPCache.key("GET", URL, None, "admin")
+
+        first = cache.fetch(key, fetch)
+
+        assert cache.fetch(key, fetch) is first
+        assert fetch.headers == [{}, {"If-None-Match": '"v1"'}]
+
+    def test_invalidate_drops_entries_below_a_prefix(self):
+        """Test a write to a collection drops its cached reads only"""
+        cache = HTTPCache(max_entries=10, ttl=60)
+        for url in (URL, f"{URL}/7", "http://hrm/web/index.php/api/v2/admin/users"):
+            cache.fetch(HTTPCache.key("GET", url, None, "admin"), CountingFetch(FakeResponse()))
+
+        assert cache.invalidate(URL) == 2
+        assert len(cache) == 1
@@ -0,0 +1,162 @@
+"""
+Browser Load Runner Tests
+
+Scheduling and reporting run on synthetic step results; the smoke run drives
+real browsers against the stand-in and is skipped without Chromium.
+"""
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import pytest
+from config.settings import ROOT_DIR
+from utilities import load_runner
+from utilities.load_runner import LoadProfile, Session, Step, StepResult, VirtualUser
+
+
+class FakeContext:
+    """Browser context that only counts cleared cookies"""
+
+    def __init__(self):
+        self.cookies_cleared = 0
+
+    def new_page(self):
+        return None
+
+    def clear_cookies(self):
+        self.cookies_cleared += 1
+
+
+def _fail(session: Session):
+    raise RuntimeError("Timeout 10000ms exceeded.\n=========================== logs ===========================")
+
+
+def _pass(session: Session):
+    pass
+
+
+@pytest.fixture
+def make_user(monkeypatch):
+    """Virtual user with a fake context and the given journey"""
+    monkeypatch.setattr(load_runner, "_new_session", lambda page: Session(None, None, None))
+
+    def make(*journey: Step) -> VirtualUser:
+        return VirtualUser(0, FakeContext(), journey, random.Random(0))
+    return make
+
+
+def _chromium_available() -> bool:
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as playwright:
+            return os.path.exists(playwright.chromium.executable_path)
+    except Exception:
+        return False
+
+
+@pytest.mark.unit
+class TestLoadRunner:
+    """Browser load runner test suite"""
+
+    def test_user_offsets_interleave_browsers(self):
+        """Test every user index is used once and consecutive users land on different browsers"""
+        profile = LoadProfile(processes=2, browsers=2, contexts=3, ramp_up=12)
+
+        offsets = {(process, browser): load_runner._user_offsets(profile, process, browser)
+                   for process in range(2) for browser in range(2)}
+
+        assert offsets[(0, 0)] == [(0, 0.0), (4, 4.0), (8, 8.0)]
+        assert offsets[(1, 1)] == [(3, 3.0), (7, 7.0), (11, 11.0)]
+        indexes = sorted(index for users in offsets.values() for index, _ in users)
+        assert indexes == list(range(profile.users))
+
+    def test_user_offsets_spread_over_ramp_up(self):
+        """Test start offsets span the ramp-up evenly, and all start at once without one"""
+        profile = LoadProfile(processes=1, browsers=1, contexts=4, ramp_up=10)
+        assert [offset for _, offset in load_runner._user_offsets(profile, 0, 0)] == [0.0, 2.5, 5.0, 7.5]
+
+        profile = LoadProfile(processes=1, browsers=2, contexts=2, ramp_up=0)
+        assert all(offset == 0 for _, offset in load_runner._user_offsets(profile, 0, 1))
+
+    def test_run_step_advances_and_wraps(self, make_user):
+        """Test passing steps advance the journey and a completed journey counts as an iteration"""
+        user = make_user(Step("a", _pass), Step("b", _pass))
+
+        results = [user.run_step(0.0) for _ in range(3)]
+
+        assert [(result.step, result.ok) for result in results] == [("a", True), ("b", True), ("a", True)]
+        assert (user.position, user.iterations) == (1, 1)
+        assert user.context.cookies_cleared == 0
+
+    def test_run_step_failure_restarts_journey(self, make_user):
+        """Test a failed step is reported and the user starts over with a cleared session"""
+        user = make_user(Step("a", _pass), Step("b", _fail), Step("c", _pass))
+
+        user.run_step(0.0)
+        failed = user.run_step(0.0)
+
+        assert failed.step == "b" and not failed.ok
+        assert failed.error == "RuntimeError: Timeout 10000ms exceeded."
+        assert (user.position, user.iterations) == (0, 1)
+        assert user.context.cookies_cleared == 1
+        assert user.run_step(0.0).step == "a"
+
+    def test_summarize(self):
+        """Test counts, throughput and percentiles per step, in journey order"""
+        samples = [StepResult("dashboard", 0.5, ms, True) for ms in (100, 200, 300, 400, 500)]
+        samples += [StepResult("login", 0.1, 50, True), StepResult("login", 0.2, 9000, False, "Timeout")]
+        samples += [StepResult("custom", 1.0, 10, True)]
+
+        summary = load_runner.summarize(samples, wall_s=10)
+
+        assert list(summary) == ["login", "dashboard", "custom"]
+        assert summary["login"]["count"] == 1 and summary["login"]["errors"] == 1
+        # Failed steps do not count towards latency
+        assert summary["login"]["max"] == 50
+        dashboard = summary["dashboard"]
+        assert dashboard["per_second"] == 0.5
+        assert (dashboard["p50"], dashboard["p90"], dashboard["max"]) == (300, 460, 500)
+
+    def test_summarize_step_without_successes(self):
+        """Test a step that only failed reports zero latencies"""
+        summary = load_runner.summarize([StepResult("logout", 0, 10, False, "Error")], wall_s=0)
+
+        assert summary["logout"] == {"count": 0, "errors": 1, "per_second": 0.0,
+                                     "p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+
+    def test_timeline(self):
+        """Test steps are bucketed by start time, with errors and p95 per bucket"""
+        samples = [StepResult("login", 1.0, 100, True), StepResult("login", 9.9, 200, True),
+                   StepResult("login", 25.0, 300, False, "Timeout"), StepResult("login", 26.0, 50, True)]
+
+        rows = load_runner.timeline(samples, interval=10)
+
+        assert rows == [
+            {"start_s": 0.0, "completed": 2, "errors": 0, "p95": 195.0},
+            {"start_s": 20.0, "completed": 1, "errors": 1, "p95": 50.0},
+        ]
+
+    def test_standin_smoke_run(self, tmp_path):
+        """Test a short run of one user against the stand-in completes journeys without errors"""
+        if not _chromium_available():
+            pytest.skip("Chromium is not installed (playwright install chromium)")
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        env = {name: value for name, value in os.environ.items() if not name.startswith("PYTEST_XDIST")}
+        env.update(STANDIN_PORT=str(port), PYTHONPATH=str(ROOT_DIR))
+        output = tmp_path / "load.json"
+
+        completed = subprocess.run(
+            [sys.executable, "-m", "utilities.load_runner", "--standin", "--contexts", "1", "--ramp-up", "0",
+             "--duration", "8", "--think-time", "0.1", "--json", str(output)],
+            cwd=ROOT_DIR, env=env, capture_output=True, text=True, timeout=300,
+        )
+
+        assert completed.returncode == 0, completed.stdout + completed.stderr
+        result = json.loads(output.read_text())
+        assert result["steps"]["login"]["count"] >= 1
+        assert result["errors"] == {}
@@ -0,0 +1,91 @@
+"""
+Logger Tests
+
+Records are prepared and worker files merged in tmp_path; the session's own
+log pipeline is not touched.
+"""
+import logging
+import queue
+import sys
+import pytest
+from utilities import logger as logger_module
+from utilities.logger import _DeferredQueueHandler, merge_worker_logs
+
+
+def _record(msg, *args, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("tests", logging.INFO, __file__, 1, msg, args, exc_info)
+
+
+def _line(time: str, message: str) -> str:
+    return f"2026-10-17 10:00:{time} - tests - INFO - test:1 - {message}\n"
+
+
+@pytest.mark.unit
+class TestDeferredQueueHandler:
+    """Deferred queue handler test suite"""
+
+    def test_prepare_renders_the_message_at_call_time(self):
+        """Test arguments are substituted before queueing, so later changes do not show"""
+        users = ["admin"]
+        record = _record("Users: %s", users)
+
+        prepared = _DeferredQueueHandler(queue.SimpleQueue()).prepare(record)
+        users.append("ess")
+
+        assert (prepared.msg, prepared.args) == ("Users: ['admin']", None)
+        assert logging.Formatter("%(levelname)s - %(message)s").format(prepared) == "INFO - Users: ['admin']"
+        # The caller's record is left as it was
+        assert record.args == (users,)
+
+    def test_prepare_keeps_the_traceback_text_only(self):
+        """Test a logged exception is queued as text and still printed by the listener's formatter"""
+        try:
+            raise ValueError("bad page")
+        except ValueError:
+            record = _record("Failed", exc_info=sys.exc_info())
+
+        prepared = _DeferredQueueHandler(queue.SimpleQueue()).prepare(record)
+
+        assert prepared.exc_info is None
+        assert "ValueError: bad page" in prepared.exc_text
+        formatted = logging.Formatter("%(message)s").format(prepared)
+        assert formatted.startswith("Failed\nTraceback") and formatted.endswith("ValueError: bad page")
+
+
+@pytest.mark.unit
+class TestMergeWorkerLogs:
+    """Worker log merge test suite"""
+
+    def test_records_are_merged_in_time_order(self, tmp_path, monkeypatch):
+        """Test records of all workers are interleaved by timestamp, with their continuation lines"""
+        monkeypatch.setattr(logger_module, "flush_logs", lambda: None)
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        (log_dir / "test_execution.gw0.log").write_text(
+            _line("00.100", "first") + _line("00.300", "third") + "Traceback (most recent call last):\n")
+        (log_dir / "test_execution.gw1.log").write_text(_line("00.200", "second") + _line("00.400", "fourth"))
+        log_file = tmp_path / "test_execution.log"
+        log_file.write_text(_line("00.000", "controller"))
+
+        assert merge_worker_logs(log_file, log_dir) == 2
+
+        lines = log_file.read_text().splitlines()
+        assert [line.rsplit(" - ", 1)[1] for line in lines if " - " in line] == \
+            ["controller", "first", "second", "third", "fourth"]
+        assert lines[1].startswith("2026-10-17 10:00:00.100 [gw0] - tests")
+        assert lines[2].startswith("2026-10-17 10:00:00.200 [gw1] - tests")
+        # A continuation line stays with its record
+        assert lines[4] == "Traceback (most recent call last):"
+
+    def test_worker_files_are_deleted(self, tmp_path, monkeypatch):
+        """Test merged worker files are removed and a later merge finds nothing"""
+        monkeypatch.setattr(logger_module, "flush_logs", lambda: None)
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        (log_dir / "test_execution.gw0.log").write_text(_line("00.100", "only"))
+        (log_dir / "other.log").write_text("kept")
+
+        merge_worker_logs(tmp_path / "test_execution.log", log_dir)
+
+        assert sorted(path.name for path in log_dir.iterdir()) == ["other.log"]
+        assert merge_worker_logs(tmp_path / "test_execution.log", log_dir) == 0
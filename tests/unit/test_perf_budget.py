@@ -0,0 +1,134 @@
+"""
+Performance Budget Tests
+
+check() and the configured overrides are tested directly; the reporting of a
+breach runs a small suite under a copy of the project conftest in a
+subprocess.
+"""
+import json
+import os
+import pytest
+from config.settings import ROOT_DIR
+from utilities import perf_budget, test_data_store
+from utilities.perf_budget import Budget, BudgetExceeded
+from utilities.test_data_store import TestDataStore
+
+pytest_plugins = ["pytester"]
+
+INNER_TESTS = '''
+from utilities.perf_budget import Budget, check
+
+
+def test_within_budget():
+    check("Page.fast", [100, 120, 140], Budget(max_ms=500))
+
+
+def test_over_budget():
+    check("Page.slow", [900, 950, 1000], Budget(max_ms=500))
+
+
+def test_fails():
+    assert False
+'''
+
+
+@pytest.fixture
+def run_suite(pytester, monkeypatch):
+    """Run INNER_TESTS under the project conftest with the given options"""
+    monkeypatch.setenv("PYTHONPATH", str(ROOT_DIR))
+    monkeypatch.setenv("REPORTS_DIR", str(pytester.path / "reports"))
+    monkeypatch.setenv("STANDIN", "false")
+    monkeypatch.setenv("ORPHAN_SWEEP", "false")
+    for name in list(os.environ):
+        if name.startswith("PYTEST_XDIST"):
+            monkeypatch.delenv(name)
+
+    def run(*args):
+        pytester.makeconftest((ROOT_DIR / "conftest.py").read_text())
+        pytester.makepyfile(test_inner=INNER_TESTS)
+        return pytester.runpytest_subprocess("-p", "no:playwright", "-p", "no:cacheprovider", "-o", "addopts=",
+                                             "-v", *args)
+
+    return run
+
+
+@pytest.fixture
+def test_data(tmp_path, monkeypatch):
+    """Writes the test data that configured_budgets() reads instead of config/test_data.json"""
+    def write(data: dict):
+        data_file = tmp_path / "test_data.json"
+        data_file.write_text(json.dumps(data))
+        monkeypatch.setattr(test_data_store, "TestDataStore", lambda: TestDataStore(
+            data_file=data_file, sections_dir=tmp_path / "sections", cache_dir=None))
+        monkeypatch.setattr(perf_budget, "_configured", None)
+    return write
+
+
+@pytest.mark.unit
+class TestPerfBudget:
+    """Performance budget test suite"""
+
+    def test_within_budget_returns_the_distribution(self):
+        """Test a percentile under the budget passes and reports the samples"""
+        stats = perf_budget.check("AdminPage.search", [100, 200, 300, 400], Budget(max_ms=400))
+
+        assert stats["n"] == 4
+        assert (stats["min"], stats["max"]) == (100, 400)
+        assert stats["p50"] == 250
+
+    def test_budgeted_percentile_decides(self):
+        """Test one slow sample passes a p50 budget but breaches a p95 budget"""
+        samples = [100, 110, 120, 130, 5000]
+
+        perf_budget.check("LoginPage.login", samples, Budget(max_ms=200, percentile=50))
+        with pytest.raises(BudgetExceeded, match=r"LoginPage.login: p95=\d+ms, budget 200ms"):
+            perf_budget.check("LoginPage.login", samples, Budget(max_ms=200, percentile=95))
+
+    def test_too_few_samples(self):
+        """Test fewer samples than min_samples is an error, not a breach"""
+        with pytest.raises(AssertionError, match="2 samples recorded, the budget needs 3") as excinfo:
+            perf_budget.check("AdminPage.search", [10_000, 20_000], Budget(max_ms=100))
+
+        assert not isinstance(excinfo.value, BudgetExceeded)
+
+    def test_configured_budgets_override_defaults(self, test_data):
+        """Test the performance_budgets section is read as Budgets, with model defaults filled in"""
+        test_data({"performance_budgets": {"AdminPage.search_by_username": {"max_ms": 1500, "percentile": 90},
+                                           "LoginPage.login": {"max_ms": 800, "min_samples": 5}}})
+
+        assert perf_budget.configured_budgets() == {
+            "AdminPage.search_by_username": Budget(max_ms=1500, percentile=90, min_samples=3),
+            "LoginPage.login": Budget(max_ms=800, percentile=75, min_samples=5),
+        }
+
+    def test_configured_budgets_without_section(self, test_data):
+        """Test a data file without the section configures no budgets"""
+        test_data({})
+
+        assert perf_budget.configured_budgets() == {}
+
+    def test_breach_is_reported_as_budget(self, run_suite):
+        """Test a breach shows as BUDGET with its measurement, apart from functional failures"""
+        result = run_suite("--budget-breach", "fail")
+
+        result.stdout.fnmatch_lines(["test_inner.py::test_over_budget BUDGET*", "test_inner.py::test_fails FAILED*"])
+        result.stdout.fnmatch_lines([
+            "*performance budgets exceeded (fail)*",
+            "test_inner.py::test_over_budget: Performance budget exceeded: Page.slow: p75=975ms, budget 500ms*",
+        ])
+        result.stdout.fnmatch_lines(["*1 failed, 1 passed, 1 budget*"])
+
+    @pytest.mark.parametrize("breach, exit_code", [
+        ("warn", pytest.ExitCode.OK),
+        ("fail", pytest.ExitCode.TESTS_FAILED),
+    ])
+    def test_budget_breach_option_decides_the_exit_code(self, run_suite, breach, exit_code):
+        """Test a breach fails the run with --budget-breach fail and only warns with warn"""
+        result = run_suite("--budget-breach", breach, "-k", "not test_fails")
+
+        assert result.ret == exit_code
+        result.stdout.fnmatch_lines([
+            "test_inner.py::test_over_budget BUDGET*",
+            f"*performance budgets exceeded ({breach})*",
+            "*1 passed, 1 deselected, 1 budget*",
+        ])
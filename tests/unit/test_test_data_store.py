@@ -0,0 +1,83 @@
+"""
+Test Data Store Tests
+"""
+import json
+import pytest
+from pydantic import TypeAdapter
+from utilities import test_data_store
+from utilities.test_data_store import Pagination, TestDataStore
+
+
+class _NoValidation(TypeAdapter):
+    """TypeAdapter that fails the test if a section is validated"""
+
+    def validate_python(self, *args, **kwargs):
+        raise AssertionError("Section was validated instead of read from the cache")
+
+
+class _NoAdapter:
+    """Stands in for TypeAdapter and fails the test if one is built"""
+
+    def __init__(self, *args, **kwargs):
+        raise AssertionError("TypeAdapter was built on a cache hit")
+
+
+@pytest.fixture
+def make_store(tmp_path):
+    """Store over a data file written from a dict, caching in tmp_path/cache"""
+    def make(data: dict, **kwargs) -> TestDataStore:
+        data_file = tmp_path / "test_data.json"
+        data_file.write_text(json.dumps(data))
+        kwargs.setdefault("cache_dir", tmp_path / "cache")
+        return TestDataStore(data_file=data_file, sections_dir=tmp_path / "sections", **kwargs)
+    return make
+
+
+@pytest.mark.unit
+class TestTestDataStore:
+    """Test data store test suite"""
+
+    def test_invalid_section_raises(self, make_store):
+        """Test a section that breaks a model validator raises TestDataError"""
+        store = make_store({"pagination": {"default_page_size": 100, "max_page_size": 50}})
+
+        with pytest.raises(test_data_store.TestDataError, match="pagination"):
+            store.pagination
+
+    def test_missing_section_raises(self, make_store):
+        """Test an unknown section raises TestDataError"""
+        store = make_store({})
+
+        with pytest.raises(test_data_store.TestDataError, match="No test data section"):
+            store.section("pagination")
+
+    def test_second_session_reads_the_cache(self, make_store, monkeypatch):
+        """Test a validated section is read back without validating it again"""
+        data = {"pagination": {"default_page_size": 10, "max_page_size": 50}}
+        first = make_store(data).pagination
+
+        monkeypatch.setattr(test_data_store, "TypeAdapter", _NoValidation)
+        cached = make_store(data).pagination
+
+        assert isinstance(cached, Pagination)
+        assert cached == first
+
+    def test_cache_hit_builds_no_adapter(self, make_store, monkeypatch):
+        """Test a cached section is read without building a TypeAdapter for its key"""
+        data = {"pagination": {"default_page_size": 10, "max_page_size": 50}}
+        make_store(data).pagination
+
+        monkeypatch.setattr(test_data_store, "TypeAdapter", _NoAdapter)
+
+        assert make_store(data).pagination.max_page_size == 50
+
+    def test_model_change_invalidates_the_cache(self, make_store, monkeypatch):
+        """Test a change of the model source is a cache miss"""
+        data = {"pagination": {"default_page_size": 10, "max_page_size": 50}}
+        make_store(data).pagination
+
+        monkeypatch.setattr(test_data_store, "_models_fingerprint", lambda: b"changed validators")
+        monkeypatch.setattr(test_data_store, "TypeAdapter", _NoValidation)
+
+        with pytest.raises(AssertionError, match="validated"):
+            make_store(data).pagination
@@ -0,0 +1,140 @@
+"""
+Web Vitals Tests
+
+capture() runs against a fake page returning synthetic _COLLECT_JS results.
+"""
+import pytest
+from utilities import web_vitals
+
+
+def _collected(time_origin: float, url: str = "http://hrm/web/index.php/dashboard/index",
+               load_ms: float = 900, **counters) -> dict:
+    """A _COLLECT_JS result"""
+    return {
+        "url": url,
+        "timeOrigin": time_origin,
+        "navigation": {"ttfb_ms": 80, "dom_content_loaded_ms": 400, "load_ms": load_ms, "transfer_kb": 12.5},
+        "fp_ms": 150, "fcp_ms": 160, "lcp_ms": 700,
+        "cls": counters.get("cls", 0.0),
+        "long_tasks": counters.get("long_tasks", 0),
+        "long_task_ms": counters.get("long_task_ms", 0),
+        "blocking_ms": counters.get("blocking_ms", 0),
+    }
+
+
+class FakePage:
+    """Returns the given evaluate() results in order"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.waited_for = []
+
+    def evaluate(self, script):
+        return self.results.pop(0)
+
+    def wait_for_load_state(self, state):
+        self.waited_for.append(state)
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    """Samples passed to record_sample() instead of being written"""
+    samples = []
+    monkeypatch.setattr(web_vitals, "record_sample", samples.append)
+    return samples
+
+
+@pytest.mark.unit
+class TestWebVitals:
+    """Web vitals test suite"""
+
+    @pytest.mark.parametrize("url, name", [
+        ("http://hrm/web/index.php/auth/login", "login"),
+        ("http://hrm/web/index.php/dashboard/index", "dashboard"),
+        ("http://hrm/web/index.php/admin/viewSystemUsers?sort=asc", "admin"),
+        ("http://hrm/web/index.php/pim/viewEmployeeList", "pim"),
+        ("http://hrm/web/index.php/maintenance/purgeEmployee/", "purgeEmployee"),
+        ("", "other"),
+    ])
+    def test_page_name(self, url, name):
+        """Test URLs map to logical pages, falling back to the last path segment"""
+        assert web_vitals.page_name(url) == name
+
+    def test_capture_full_load(self, recorded):
+        """Test a new document records navigation timing and paints"""
+        page = FakePage(_collected(2000, cls=0.05, long_tasks=1, long_task_ms=80, blocking_ms=30))
+
+        sample = web_vitals.capture(page, _collected(1000), ready_ms=512.34)
+
+        assert recorded == [sample]
+        assert sample["page"] == "dashboard" and sample["kind"] == "load"
+        assert sample["ready_ms"] == 512.3
+        assert (sample["ttfb_ms"], sample["load_ms"], sample["lcp_ms"]) == (80, 900, 700)
+        # Counters of a new document start from zero: taken as they are
+        assert (sample["cls"], sample["blocking_ms"]) == (0.05, 30)
+        assert page.waited_for == []
+
+    def test_capture_waits_for_the_load_event(self, recorded):
+        """Test a page ready before its load event is read again once loaded"""
+        page = FakePage(_collected(2000, load_ms=0), _collected(2000, load_ms=950))
+
+        sample = web_vitals.capture(page, None, ready_ms=300)
+
+        assert page.waited_for == ["load"]
+        assert sample["load_ms"] == 950
+
+    def test_capture_spa_route_change(self, recorded):
+        """Test a route change in the same document records counter deltas only"""
+        before = _collected(1000, cls=0.1, long_tasks=2, long_task_ms=150, blocking_ms=60)
+        after = _collected(1000, url="http://hrm/web/index.php/admin/viewSystemUsers",
+                           cls=0.25, long_tasks=3, long_task_ms=230, blocking_ms=90)
+
+        sample = web_vitals.capture(FakePage(after), before, ready_ms=120)
+
+        assert sample["page"] == "admin" and sample["kind"] == "spa"
+        assert sample["cls"] == pytest.approx(0.15)
+        assert (sample["long_tasks"], sample["long_task_ms"], sample["blocking_ms"]) == (1, 80, 30)
+        assert "ttfb_ms" not in sample and "lcp_ms" not in sample
+
+    def test_capture_unreadable_page(self, recorded):
+        """Test a page that cannot be evaluated records nothing"""
+        class ClosedPage:
+            def evaluate(self, script):
+                raise RuntimeError("Target closed")
+
+        assert web_vitals.capture(ClosedPage(), None, ready_ms=10) is None
+        assert recorded == []
+
+    def test_aggregate(self):
+        """Test percentiles per page and kind, skipping missing metrics"""
+        samples = [{"page": "dashboard", "kind": "load", "ready_ms": ms, "lcp_ms": ms + 100, "cls": 0.0}
+                   for ms in (100, 200, 300, 400, 500)]
+        samples.append({"page": "dashboard", "kind": "spa", "ready_ms": 50, "cls": 0.2, "lcp_ms": None})
+
+        aggregates = web_vitals.aggregate(samples)
+
+        assert list(aggregates) == ["dashboard (load)", "dashboard (spa)"]
+        load = aggregates["dashboard (load)"]
+        assert list(load) == ["ready_ms", "lcp_ms", "cls"]
+        assert load["ready_ms"] == {"n": 5, "p50": 300, "p95": 480, "p99": 496}
+        assert aggregates["dashboard (spa)"] == {
+            "ready_ms": {"n": 1, "p50": 50, "p95": 50, "p99": 50},
+            "cls": {"n": 1, "p50": 0.2, "p95": 0.2, "p99": 0.2},
+        }
+
+    def test_format_lines_and_html(self):
+        """Test the terminal and HTML summaries show every page and metric"""
+        aggregates = {"admin <spa>": {
+            "ready_ms": {"n": 3, "p50": 120.4, "p95": 180.6, "p99": 199.9},
+            "cls": {"n": 3, "p50": 0.01234, "p95": 0.05, "p99": 0.1},
+        }}
+
+        lines = web_vitals.format_lines(aggregates)
+        assert len(lines) == 2
+        assert "n=3" in lines[0] and "p50=    120" in lines[0] and "p99=    200" in lines[0]
+        assert "p50=  0.012" in lines[1]
+
+        table = web_vitals.format_html(aggregates)
+        assert table.count("<tr>") == 3
+        assert "admin &lt;spa&gt;" in table
+        assert "<td>0.012</td>" in table and "<td>181</td>" in table
@@ -1,80 +1,316 @@
 """
 API client for OrangeHRM API testing
 """
+import hashlib
+import logging
+import re
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from utilities import run_stats
+from utilities.data_registry import registry
+from utilities.http_cache import HTTPCache, default_cache
 from utilities.logger import get_logger
-from config.settings import API_BASE_URL, API_TIMEOUT
+from utilities.resilience import RetryPolicy, breaker_for, parse_retry_after
+from config.settings import (
+    API_BASE_URL, API_CACHE, API_MAX_PAGE_SIZE, API_PAGE_PREFETCH, API_PAGE_SIZE, API_TIMEOUT, LOG_API_BODIES, URLs
+)
 
 logger = get_logger(__name__)
 
+# CSRF token as rendered by the login page: <auth-login :token="&quot;...&quot;">
+# or, on older builds, a hidden <input name="_token" value="...">
+CSRF_TOKEN_PATTERNS = [
+    re.compile(r':token="(?:&quot;)?([^"&]+)(?:&quot;)?"'),
+    re.compile(r'name="_token"[^>]*value="([^"]+)"'),
+]
+
+
+def extract_csrf_token(html: str) -> Optional[str]:
+    """
+    Extract the login form CSRF token from login page HTML
+
+    Args:
+        html: Login page markup
+
+    Returns:
+        Token or None if not found
+    """
+    for pattern in CSRF_TOKEN_PATTERNS:
+        match = pattern.search(html)
+        if match:
+            return match.group(1)
+    return None
+
 
 class APIClient:
     """Base API client"""
 
-    def __init__(self, base_url: str = API_BASE_URL):
+    def __init__(self, base_url: str = API_BASE_URL, retry_policy: Optional[RetryPolicy] = None,
+                 cache: Optional[HTTPCache] = None):
+        """
+        Args:
+            base_url: Prefix for endpoints
+            retry_policy: Retries of failed idempotent calls; RetryPolicy() by default
+            cache: Response cache for GET requests; the shared cache if API_CACHE is set
+        """
         self.base_url = base_url
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache if cache is not None else (default_cache() if API_CACHE else None)
         self.session = requests.Session()
         self.session.headers.update({
             "Content-Type": "application/json",
             "Accept": "application/json"
         })
+        # Sessions of the iter_records prefetch threads; requests.Session is not thread-safe
+        self._thread_sessions = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Session of the calling thread: its own copy in a prefetch thread, else self.session"""
+        return getattr(self._thread_sessions, "session", None) or self.session
 
     def _log_request(self, method: str, url: str, **kwargs):
         """Log request details"""
-        logger.info(f"API Request: {method} {url}")
+        logger.info("API Request: %s %s", method, url)
         if 'json' in kwargs:
-            logger.debug(f"Request Body: {kwargs['json']}")
+            logger.debug("Request Body: %s", kwargs['json'])
 
     def _log_response(self, response: requests.Response):
-        """Log response details"""
-        logger.info(f"API Response: {response.status_code}")
+        """Log response details; the body is only decoded when it is logged"""
+        logger.info("API Response: %s", response.status_code)
+        if not (LOG_API_BODIES and logger.isEnabledFor(logging.DEBUG)):
+            return
         try:
-            logger.debug(f"Response Body: {response.json()}")
-        except:
-            logger.debug(f"Response Body: {response.text}")
+            logger.debug("Response Body: %s", response.json())
+        except ValueError:
+            logger.debug("Response Body: %s", response.text)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the host's circuit breaker, retrying per retry_policy
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            **kwargs: Passed to requests (params, json, data, headers, ...)
+
+        Returns:
+            Final response (possibly still an error status once retries are used up)
+
+        Raises:
+            CircuitOpenError: The host's circuit is open
+            requests.ConnectionError, requests.Timeout: Last attempt failed to connect
+        """
+        breaker = breaker_for(url)
+        attempt = 0
+        while True:
+            breaker.check()
+            self._log_request(method, url, **kwargs)
+            try:
+                response = self._session().request(method, url, timeout=API_TIMEOUT, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                breaker.record(None)
+                delay = self.retry_policy.retry_delay(method, attempt)
+                if delay is None or breaker.state == breaker.OPEN:
+                    raise
+                reason = e.__class__.__name__
+            else:
+                self._log_response(response)
+                breaker.record(response.status_code)
+                delay = self.retry_policy.retry_delay(
+                    method, attempt, response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+                if delay is None or breaker.state == breaker.OPEN:
+                    return response
+                reason = str(response.status_code)
+
+            attempt += 1
+            run_stats.incr("api_resilience", "retries")
+            logger.warning(f"API {method} {url} failed ({reason}), retry {attempt} in {delay:.2f}s")
+            time.sleep(delay)
 
     def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
-        """GET request"""
+        """GET request, answered from the cache when one is set (and no extra options are given)"""
         url = f"{self.base_url}{endpoint}"
-        self._log_request("GET", url, params=params)
+        if self.cache is None or kwargs:
+            return self._send("GET", url, params=params, **kwargs)
 
-        response = self.session.get(url, params=params, timeout=API_TIMEOUT, **kwargs)
-        self._log_response(response)
-        return response
+        key = HTTPCache.key("GET", url, params, self._identity())
+        return self.cache.fetch(key, lambda headers: self._send("GET", url, params=params, headers=headers))
 
     def post(self, endpoint: str, json: Optional[Dict] = None, **kwargs) -> requests.Response:
         """POST request"""
-        url = f"{self.base_url}{endpoint}"
-        self._log_request("POST", url, json=json)
-
-        response = self.session.post(url, json=json, timeout=API_TIMEOUT, **kwargs)
-        self._log_response(response)
-        return response
+        return self._write("POST", f"{self.base_url}{endpoint}", json=json, **kwargs)
 
     def put(self, endpoint: str, json: Optional[Dict] = None, **kwargs) -> requests.Response:
         """PUT request"""
-        url = f"{self.base_url}{endpoint}"
-        self._log_request("PUT", url, json=json)
-
-        response = self.session.put(url, json=json, timeout=API_TIMEOUT, **kwargs)
-        self._log_response(response)
-        return response
+        return self._write("PUT", f"{self.base_url}{endpoint}", json=json, **kwargs)
 
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         """DELETE request"""
-        url = f"{self.base_url}{endpoint}"
-        self._log_request("DELETE", url)
+        return self._write("DELETE", f"{self.base_url}{endpoint}", **kwargs)
 
-        response = self.session.delete(url, timeout=API_TIMEOUT, **kwargs)
-        self._log_response(response)
+    def _write(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a write request, register what it created and drop cached reads it changes"""
+        response = self._send(method, url, **kwargs)
+        registry.track(method, url, response.status_code, response.json)
+        if self.cache is not None:
+            # /admin/users/7 changes /admin/users and /admin/users/7
+            self.cache.invalidate(re.sub(r"/\d+$", "", url))
         return response
 
+    def _identity(self) -> str:
+        """Who the request is sent as: the auth header and session cookies"""
+        session = self._session()
+        credentials = session.headers.get("Authorization", "") + ";" + ";".join(
+            f"{cookie.name}={cookie.value}" for cookie in session.cookies)
+        return hashlib.sha256(credentials.encode()).hexdigest()
+
+    def iter_records(self, endpoint: str, params: Optional[Dict] = None, page_size: int = API_PAGE_SIZE,
+                     prefetch: int = API_PAGE_PREFETCH) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the records of a paginated list endpoint (USERS, EMPLOYEES, LEAVE, ...)
+
+        Pages are requested with limit/offset; up to `prefetch` following pages
+        are fetched in the background while the current page is consumed. Each
+        background thread sends them on its own copy of the session, taken with
+        the headers and cookies it has when the iteration starts. Only
+        the pages in flight are held in memory, and leaving the loop early
+        cancels the pages that were not requested yet.
+
+        Args:
+            endpoint: List endpoint, e.g. APIEndpoints.USERS
+            params: Extra query parameters (filters); limit/offset are set here
+            page_size: Records per request, capped at API_MAX_PAGE_SIZE
+            prefetch: Pages requested ahead of the one being consumed (0 disables)
+
+        Yields:
+            Records of the "data" array, in server order
+
+        Raises:
+            requests.HTTPError: A page request failed
+        """
+        limit = max(1, min(page_size, API_MAX_PAGE_SIZE))
+        params = dict(params or {})
+        pending: deque = deque()
+        next_offset = 0
+        total: Optional[int] = None
+
+        def request_pages(ahead: int):
+            nonlocal next_offset
+            # Only one page ahead while the total is unknown
+            ahead = ahead if total is not None else min(ahead, 1)
+            while len(pending) < ahead and (total is None or next_offset < total):
+                pending.append(executor.submit(self._get_page, endpoint, params, limit, next_offset))
+                next_offset += limit
+
+        headers, cookies = self.session.headers.copy(), self.session.cookies.copy()
+
+        def start_page_thread():
+            session = requests.Session()
+            session.headers.update(headers)
+            session.cookies.update(cookies)
+            self._thread_sessions.session = session
+
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 1), thread_name_prefix="api-page",
+                                      initializer=start_page_thread)
+        try:
+            request_pages(1)
+            while pending:
+                waited = time.perf_counter()
+                records, page_total = pending.popleft().result()
+                run_stats.observe("api_pagination", "page_wait_ms", (time.perf_counter() - waited) * 1000)
+                if page_total is not None:
+                    total = page_total
+
+                last_page = len(records) < limit
+                if last_page:
+                    # Anything requested beyond a short page is empty
+                    pending.clear()
+                else:
+                    request_pages(prefetch)
+                yield from records
+                if not last_page and not pending:
+                    request_pages(1)
+        finally:
+            # Also runs when the caller stops iterating (generator closed)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_page(self, endpoint: str, params: Dict, limit: int, offset: int) -> Tuple[List[Dict], Optional[int]]:
+        """Fetch one page; returns its records and meta.total if the server sends it"""
+        response = self.get(endpoint, params={**params, "limit": limit, "offset": offset})
+        response.raise_for_status()
+        body = response.json()
+        run_stats.incr("api_pagination", "pages")
+        total = body.get("meta", {}).get("total") if isinstance(body.get("meta"), dict) else None
+        return body.get("data", []), total
+
     def set_auth_token(self, token: str):
         """Set authorization token"""
         self.session.headers.update({"Authorization": f"Bearer {token}"})
         logger.info("Authorization token set")
 
+    def login(self, username: str, password: str) -> bool:
+        """
+        Log in through the web auth endpoint without a browser
+
+        Fetches the login page for its CSRF token and posts the credentials to
+        the auth validate endpoint. On success the session cookie is kept in
+        self.session for API calls or for handing over to a browser context.
+
+        Args:
+            username: Username
+            password: Password
+
+        Returns:
+            True if the server accepted the credentials
+        """
+        html_headers = {"Accept": "text/html"}
+
+        logger.info(f"API login for username: {username}")
+        response = self._send("GET", URLs.LOGIN, headers=html_headers)
+        if "/auth/login" not in response.url:
+            # The session is already logged in: the login page redirects to the dashboard
+            logger.info(f"API session already logged in: {response.url}")
+            return True
+        token = extract_csrf_token(response.text)
+        if not token:
+            logger.warning("CSRF token not found on login page")
+            return False
+
+        response = self.session.post(
+            URLs.AUTH_VALIDATE,
+            data={"_token": token, "username": username, "password": password},
+            headers={**html_headers, "Content-Type": "application/x-www-form-urlencoded"},
+            timeout=API_TIMEOUT,
+        )
+        success = response.ok and "/auth/login" not in response.url
+        logger.info(f"API login {'succeeded' if success else 'failed'}: {response.url}")
+        return success
+
+    def get_playwright_cookies(self) -> List[Dict[str, Any]]:
+        """
+        Convert session cookies to the format expected by BrowserContext.add_cookies
+
+        Returns:
+            List of Playwright cookie dicts
+        """
+        cookies = []
+        for cookie in self.session.cookies:
+            cookies.append({
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path or "/",
+                "expires": cookie.expires if cookie.expires else -1,
+                "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+                "secure": cookie.secure,
+                "sameSite": "Lax",
+            })
+        return cookies
+
 
 # Test the client
 if __name__ == "__main__":
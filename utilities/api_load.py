@@ -0,0 +1,560 @@
+"""
+API load generator with coordinated-omission-corrected latency histograms
+
+Sends a scenario, a weighted mix of requests against APIEndpoints, to the
+OrangeHRM API with the AsyncAPIClient configuration (base URL, auth header,
+session cookie, timeout) in one of two modes:
+
+    open loop    --rate 2000   requests start on a fixed schedule, whether or
+                               not earlier ones have returned
+    closed loop  --users 50    each user sends its next request when the
+                               previous one returned (paced by --pace-ms)
+
+    python -m utilities.api_load --standin --rate 500 --duration 30
+    python -m utilities.api_load --users 100 --pace-ms 50 --processes 4 --csv reports/api_load.csv
+    python -m utilities.api_load --scenario my_package.scenarios:checkout --rate 1000 --json load.json
+
+Latency is corrected for coordinated omission: in open loop it is measured
+from the time the request was scheduled to start, so queueing behind a
+stalled server counts; in closed loop each response slower than the pacing
+interval also records the requests the user would have sent meanwhile (as
+HdrHistogram's recordValueWithExpectedInterval does). The service time,
+from send to response, is reported next to it.
+
+Scenarios are plain Python:
+
+    def checkout() -> Scenario:
+        scenario = Scenario("checkout")
+        scenario.add("GET", APIEndpoints.USERS, weight=3, params={"limit": 50})
+
+        @scenario.task(weight=1)
+        def employee(rng):
+            return Request("GET", f"{APIEndpoints.EMPLOYEES}/{rng.randint(1, 60)}", name="GET employee")
+        return scenario
+"""
+import argparse
+import asyncio
+import csv
+import importlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+# config.settings fixes the API base URL on import, so the framework is only
+# imported after --standin has been applied to the environment (see main())
+
+# Percentiles in the report and the CSV/JSON output
+PERCENTILES = (50, 90, 95, 99, 99.9)
+# Most requests one closed-loop response may backfill: a response can take up to
+# API_TIMEOUT, so --pace-ms must be at least API_TIMEOUT / MAX_BACKFILL (3 ms at 30 s)
+MAX_BACKFILL = 10_000
+
+
+class Request(NamedTuple):
+    """One API call of a scenario"""
+    method: str
+    # APIEndpoints.* (absolute) or a path appended to the API base URL
+    url: str
+    # Label the call is reported under; "<METHOD> <path>" by default
+    name: str = ""
+    # aiohttp request arguments (params, json, headers, ...)
+    kwargs: Optional[Dict[str, Any]] = None
+
+    @property
+    def label(self) -> str:
+        return self.name or f"{self.method} {urlsplit(self.url).path.split('/api/v2', 1)[-1]}"
+
+
+Task = Callable[[random.Random], Request]
+
+
+class Scenario:
+    """Weighted mix of requests; every request of the run is drawn from it"""
+
+    def __init__(self, name: str = "scenario"):
+        self.name = name
+        self._tasks: List[Task] = []
+        self._weights: List[float] = []
+
+    def add(self, method: str, url: str, weight: float = 1, name: str = "", **kwargs) -> "Scenario":
+        """
+        Add a fixed request
+
+        Args:
+            method: HTTP method
+            url: APIEndpoints.* or a path under the API base URL
+            weight: Relative frequency in the mix
+            name: Label in the report
+            **kwargs: aiohttp request arguments (params, json, ...)
+
+        Returns:
+            The scenario, for chaining
+        """
+        request = Request(method, url, name, kwargs or None)
+        return self._add(lambda rng: request, weight)
+
+    def task(self, weight: float = 1) -> Callable[[Task], Task]:
+        """Decorator adding a function rng -> Request that builds a request per call"""
+        def register(task: Task) -> Task:
+            self._add(task, weight)
+            return task
+        return register
+
+    def _add(self, task: Task, weight: float) -> "Scenario":
+        if weight <= 0:
+            raise ValueError(f"Weight must be positive, got {weight}")
+        self._tasks.append(task)
+        self._weights.append(weight)
+        return self
+
+    def pick(self, rng: random.Random) -> Request:
+        """Next request of the mix"""
+        if not self._tasks:
+            raise ValueError(f"Scenario '{self.name}' has no requests")
+        return rng.choices(self._tasks, self._weights)[0](rng)
+
+
+def read_mix() -> Scenario:
+    """Default scenario: the list endpoints the UI pages load"""
+    from config.settings import APIEndpoints
+
+    scenario = Scenario("read_mix")
+    scenario.add("GET", APIEndpoints.USERS, weight=4, name="list users", params={"limit": 50, "offset": 0})
+    scenario.add("GET", APIEndpoints.EMPLOYEES, weight=3, name="list employees", params={"limit": 50, "offset": 0})
+    scenario.add("GET", APIEndpoints.LEAVE, weight=2, name="list leave requests", params={"limit": 50, "offset": 0})
+    scenario.add("GET", f"{APIEndpoints.BASE}/dashboard/employees/time-at-work", weight=1, name="time at work")
+    return scenario
+
+
+def load_scenario(spec: str) -> Scenario:
+    """
+    Scenario from "module:attribute"; the attribute is a Scenario or returns one
+
+    Args:
+        spec: e.g. "utilities.api_load:read_mix"
+
+    Returns:
+        The scenario
+    """
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected module:attribute, got '{spec}'")
+    target = getattr(importlib.import_module(module_name), attribute)
+    scenario = target() if callable(target) and not isinstance(target, Scenario) else target
+    if not isinstance(scenario, Scenario):
+        raise TypeError(f"{spec} is not a Scenario")
+    return scenario
+
+
+class LatencyHistogram:
+    """
+    Latency histogram with logarithmic buckets (1% wide), mergeable across processes
+
+    Percentiles are accurate to the bucket width, whatever the number of samples.
+    """
+
+    RESOLUTION = 0.01
+    # Values below this (ms) share the first bucket
+    LOWEST_MS = 0.01
+    _LOG_BASE = math.log1p(RESOLUTION)
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, value_ms: float, expected_interval_ms: float = 0.0):
+        """
+        Record one latency
+
+        Args:
+            value_ms: Measured latency
+            expected_interval_ms: Interval between requests when nothing stalls;
+                a larger value also records the requests that would have been
+                sent while waiting (value - interval, value - 2 * interval, ...)
+        """
+        self._add(value_ms)
+        if expected_interval_ms > 0:
+            missing_ms = value_ms - expected_interval_ms
+            while missing_ms >= expected_interval_ms:
+                self._add(missing_ms)
+                missing_ms -= expected_interval_ms
+
+    def _add(self, value_ms: float):
+        bucket = int(math.log(max(value_ms, self.LOWEST_MS) / self.LOWEST_MS) / self._LOG_BASE)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add the samples of other to this histogram"""
+        self.counts.update(other.counts)
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency (ms) at percentile q (0-100), 0 if empty"""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                # Upper edge of the bucket, never above the largest sample
+                return min(self.LOWEST_MS * math.exp((bucket + 1) * self._LOG_BASE), self.max_ms)
+        return self.max_ms
+
+
+class EndpointStats:
+    """Corrected latency, service time and errors of one request label"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.service = LatencyHistogram()
+        self.requests = 0
+        # "503", "ClientConnectorError", ... -> count
+        self.errors: Counter = Counter()
+
+    def merge(self, other: "EndpointStats") -> "EndpointStats":
+        self.latency.merge(other.latency)
+        self.service.merge(other.service)
+        self.requests += other.requests
+        self.errors.update(other.errors)
+        return self
+
+
+@dataclass
+class LoadProfile:
+    """Mode, rate or users, and duration of a run"""
+    # Open loop: requests per second over all processes; 0 selects closed loop
+    rate: float = 0.0
+    # Closed loop: concurrent users over all processes
+    users: int = 10
+    # Closed loop: interval between the request starts of one user (0: back to back)
+    pace_ms: float = 0.0
+    duration: float = 30.0
+    # Open loop: requests in flight per process; later ones wait (and that wait counts)
+    max_in_flight: int = 1000
+    processes: int = 1
+    seed: int = 0
+
+    @property
+    def mode(self) -> str:
+        return "open" if self.rate else "closed"
+
+
+class _Generator:
+    """Runs one process's share of a load profile on its event loop"""
+
+    def __init__(self, profile: LoadProfile, scenario: Scenario, process: int, token: Optional[str], login: bool):
+        from config.settings import API_BASE_URL
+        self.profile = profile
+        self.scenario = scenario
+        self.process = process
+        self.token = token
+        self.login = login
+        self.base_url = API_BASE_URL
+        self.rng = random.Random(profile.seed * 1000 + process)
+        self.stats: Dict[str, EndpointStats] = {}
+        self.client = None
+
+    async def run(self) -> Tuple[Dict[str, EndpointStats], float]:
+        """Send this process's share of the load; returns the stats and the seconds it ran"""
+        from config.settings import TestUsers
+        from utilities.async_api_client import AsyncAPIClient
+
+        in_flight = self.profile.max_in_flight
+        self.client = AsyncAPIClient(base_url=self.base_url, pool_size=in_flight, max_per_host=in_flight)
+        try:
+            if self.token:
+                self.client.set_auth_token(self.token)
+            elif self.login and not await self.client.login(TestUsers.ADMIN["username"], TestUsers.ADMIN["password"]):
+                raise RuntimeError("Admin login failed")
+            started = time.perf_counter()
+            if self.profile.mode == "open":
+                await self._open_loop()
+            else:
+                await self._closed_loop()
+            return self.stats, time.perf_counter() - started
+        finally:
+            await self.client.close()
+
+    async def _open_loop(self):
+        """Start requests at a fixed rate; latency counts from the scheduled start"""
+        loop = asyncio.get_running_loop()
+        interval = self.profile.processes / self.profile.rate
+        slots = asyncio.Semaphore(self.profile.max_in_flight)
+        pending = set()
+        start = loop.time()
+        for index in range(int(self.profile.duration / interval)):
+            scheduled = start + index * interval
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            task = asyncio.create_task(self._send(self.scenario.pick(self.rng), scheduled, slots))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.wait(pending)
+
+    async def _closed_loop(self):
+        """Users send one request at a time, each paced by pace_ms"""
+        users = self.profile.users // self.profile.processes + (
+            1 if self.process < self.profile.users % self.profile.processes else 0)
+        deadline = asyncio.get_running_loop().time() + self.profile.duration
+        await asyncio.gather(*(self._user(deadline) for _ in range(users)))
+
+    async def _user(self, deadline: float):
+        loop = asyncio.get_running_loop()
+        pace = self.profile.pace_ms / 1000
+        # Spread the users' first requests over one pacing interval
+        next_start = loop.time() + self.rng.uniform(0, pace)
+        while next_start < deadline:
+            delay = next_start - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            started = loop.time()
+            await self._send(self.scenario.pick(self.rng), started, None, self.profile.pace_ms)
+            next_start = max(next_start + pace, loop.time()) if pace else loop.time()
+
+    async def _send(self, request: Request, scheduled: float, slots: Optional[asyncio.Semaphore],
+                    expected_interval_ms: float = 0.0):
+        """Send one request and record it under its label"""
+        loop = asyncio.get_running_loop()
+        url = request.url if "://" in request.url else f"{self.base_url}{request.url}"
+        kwargs = dict(request.kwargs or {})
+        kwargs["headers"] = {**self.client.headers, **(kwargs.get("headers") or {})}
+        error = None
+        if slots is not None:
+            await slots.acquire()
+        sent = loop.time()
+        try:
+            async with self.client.session.request(request.method, url, **kwargs) as response:
+                await response.read()
+                if response.status >= 400:
+                    error = str(response.status)
+        except Exception as e:
+            error = type(e).__name__
+        finally:
+            if slots is not None:
+                slots.release()
+        done = loop.time()
+
+        stats = self.stats.get(request.label)
+        if stats is None:
+            stats = self.stats[request.label] = EndpointStats()
+        stats.requests += 1
+        if error:
+            stats.errors[error] += 1
+        stats.latency.record((done - scheduled) * 1000, expected_interval_ms)
+        stats.service.record((done - sent) * 1000)
+
+
+def _run_process(profile: LoadProfile, scenario_spec: str, process: int, token: Optional[str],
+                 login: bool) -> Tuple[Dict[str, EndpointStats], float]:
+    """Entry point of a generator process"""
+    generator = _Generator(profile, load_scenario(scenario_spec), process, token, login)
+    return asyncio.run(generator.run())
+
+
+def _check_pace(profile: LoadProfile):
+    """Reject closed-loop pacing whose coordinated omission backfill would cost more than the requests"""
+    from config.settings import API_TIMEOUT
+
+    if profile.pace_ms < 0:
+        raise ValueError(f"--pace-ms must not be negative, got {profile.pace_ms:g}")
+    min_pace_ms = API_TIMEOUT * 1000 / MAX_BACKFILL
+    if profile.mode == "closed" and 0 < profile.pace_ms < min_pace_ms:
+        raise ValueError(f"--pace-ms {profile.pace_ms:g} is below {min_pace_ms:g} ms: a response taking the "
+                         f"{API_TIMEOUT:g}s timeout would backfill more than {MAX_BACKFILL} requests; "
+                         "use a longer pace or 0 (back to back)")
+
+
+def run(profile: LoadProfile, scenario_spec: str = "utilities.api_load:read_mix", token: Optional[str] = None,
+        login: bool = True) -> Tuple[Dict[str, EndpointStats], float]:
+    """
+    Run a load profile, in spawned processes when profile.processes > 1
+
+    Args:
+        profile: Mode, rate or users, and duration
+        scenario_spec: "module:attribute" of the scenario (imported in every process)
+        token: Bearer token to send; otherwise the processes log in as Admin if login is set
+        login: Log in before sending (the API needs a session)
+
+    Returns:
+        Stats per request label merged over all processes, and the longest process run time in seconds
+
+    Raises:
+        ValueError: pace_ms is so short that slow responses would backfill too many requests
+    """
+    _check_pace(profile)
+    arguments = [(profile, scenario_spec, process, token, login) for process in range(profile.processes)]
+    if profile.processes == 1:
+        results = [_run_process(*arguments[0])]
+    else:
+        # Spawned processes import settings afresh, with the environment of main()
+        with multiprocessing.get_context("spawn").Pool(profile.processes) as pool:
+            results = pool.starmap(_run_process, arguments)
+
+    merged: Dict[str, EndpointStats] = {}
+    for stats, _ in results:
+        for label, endpoint in stats.items():
+            merged.setdefault(label, EndpointStats()).merge(endpoint)
+    return merged, max(elapsed for _, elapsed in results)
+
+
+def summarize(stats: Dict[str, EndpointStats], elapsed: float) -> Dict[str, Dict[str, Any]]:
+    """
+    Report rows per request label plus a "total" row
+
+    Args:
+        stats: Result of run()
+        elapsed: Seconds the run took
+
+    Returns:
+        {label: {"requests", "errors", "error_rate", "per_second", "latency_p50", ..., "service_p99", ...}}
+    """
+    total = EndpointStats()
+    for endpoint in stats.values():
+        total.merge(endpoint)
+
+    rows = {}
+    for label, endpoint in [*sorted(stats.items()), ("total", total)]:
+        row: Dict[str, Any] = {
+            "requests": endpoint.requests,
+            "errors": sum(endpoint.errors.values()),
+            "error_rate": sum(endpoint.errors.values()) / endpoint.requests if endpoint.requests else 0.0,
+            "per_second": endpoint.requests / elapsed if elapsed else 0.0,
+        }
+        for kind in ("latency", "service"):
+            histogram = getattr(endpoint, kind)
+            row[f"{kind}_mean"] = histogram.mean_ms
+            row.update({f"{kind}_p{q:g}": histogram.percentile(q) for q in PERCENTILES})
+            row[f"{kind}_max"] = histogram.max_ms
+        row["error_breakdown"] = dict(endpoint.errors.most_common())
+        rows[label] = row
+    return rows
+
+
+def format_lines(rows: Dict[str, Dict[str, Any]]) -> List[str]:
+    """Table of requests, errors, throughput, corrected latency and service time (ms)"""
+    latency_columns = [f"p{q:g}" for q in PERCENTILES] + ["max"]
+    width = max([len(label) for label in rows] + [8])
+    lines = [f"{'request':<{width}} {'count':>8} {'err %':>6} {'per s':>8} "
+             + " ".join(f"{column:>8}" for column in latency_columns) + f" {'svc p50':>8} {'svc p99':>8}"]
+    for label, row in rows.items():
+        lines.append(f"{label:<{width}} {row['requests']:>8} {row['error_rate'] * 100:>6.2f} {row['per_second']:>8.1f} "
+                     + " ".join(f"{row[f'latency_{column}']:>8.1f}" for column in latency_columns)
+                     + f" {row['service_p50']:>8.1f} {row['service_p99']:>8.1f}")
+    return lines
+
+
+def write_csv(rows: Dict[str, Dict[str, Any]], path: Path):
+    """One line per request label; the error breakdown is a "status:count" list"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    columns = [key for key in next(iter(rows.values())) if key != "error_breakdown"]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(["request", *columns, "error_breakdown"])
+        for label, row in rows.items():
+            breakdown = " ".join(f"{error}:{count}" for error, count in row["error_breakdown"].items())
+            writer.writerow([label, *(round(row[column], 3) if isinstance(row[column], float) else row[column]
+                                      for column in columns), breakdown])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = LoadProfile()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--rate", type=float, help="Open loop: requests per second")
+    mode.add_argument("--users", type=int, help=f"Closed loop: concurrent users (default {defaults.users})")
+    parser.add_argument("--pace-ms", type=float, default=defaults.pace_ms,
+                        help="Closed loop: interval between the requests of a user (0: back to back)")
+    parser.add_argument("--duration", type=float, default=defaults.duration, help="Seconds of load")
+    parser.add_argument("--max-in-flight", type=int, default=defaults.max_in_flight,
+                        help="Open loop: requests in flight per process")
+    parser.add_argument("--processes", type=int, default=defaults.processes, help="Generator processes")
+    parser.add_argument("--scenario", default="utilities.api_load:read_mix", help="module:attribute of the scenario")
+    parser.add_argument("--token", default=os.getenv("API_LOAD_TOKEN"),
+                        help="Bearer token (default $API_LOAD_TOKEN); otherwise log in as Admin")
+    parser.add_argument("--no-login", action="store_true", help="Send requests without a session")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Seed of the request mix")
+    parser.add_argument("--standin", action="store_true", help="Run against a local stand-in server")
+    parser.add_argument("--standin-latency", type=int, default=None, help="Stand-in response delay in ms")
+    parser.add_argument("--csv", type=Path, help="Write the report rows to this CSV file")
+    parser.add_argument("--json", type=Path, help="Write the profile and report rows to this JSON file")
+    args = parser.parse_args(argv)
+
+    if args.standin:
+        os.environ["STANDIN"] = "true"
+    from utilities.logger import get_logger
+    logger = get_logger(__name__)
+
+    profile = LoadProfile(rate=args.rate or 0.0, users=args.users or defaults.users, pace_ms=args.pace_ms,
+                          duration=args.duration, max_in_flight=args.max_in_flight, processes=args.processes,
+                          seed=args.seed)
+    if profile.mode == "closed" and not profile.pace_ms:
+        logger.warning("Closed loop without --pace-ms: latency is not corrected for coordinated omission")
+
+    server = None
+    if args.standin:
+        from config.settings import STANDIN_LATENCY_MS
+        from utilities.standin_server import StandInServer
+        latency = STANDIN_LATENCY_MS if args.standin_latency is None else args.standin_latency
+        server = StandInServer(latency_ms=latency).start()
+
+    target = f"{profile.rate:g} requests/s" if profile.mode == "open" else f"{profile.users} users"
+    logger.info(f"API load ({profile.mode} loop): {target} for {profile.duration:g}s "
+                f"in {profile.processes} processes, scenario {args.scenario}")
+    try:
+        stats, elapsed = run(profile, args.scenario, args.token, not args.no_login)
+    except (RuntimeError, ValueError, TypeError, ImportError) as e:
+        logger.error(f"API load failed: {e}")
+        return 1
+    finally:
+        if server is not None:
+            server.stop()
+
+    if not stats:
+        logger.error("No requests were sent")
+        return 1
+    rows = summarize(stats, elapsed)
+    print(f"{profile.mode} loop, {rows['total']['requests']} requests in {elapsed:.1f}s "
+          "(latency corrected for coordinated omission, ms)")
+    for line in format_lines(rows):
+        print(line)
+
+    if args.csv:
+        write_csv(rows, args.csv)
+        print(f"CSV written to {args.csv}")
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"profile": {**asdict(profile), "mode": profile.mode}, "scenario": args.scenario,
+                       "elapsed_s": elapsed, "requests": rows}, f, indent=2)
+        print(f"JSON written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    # Run the importable module, so scenarios and worker processes see the same classes
+    from utilities import api_load
+    sys.exit(api_load.main())
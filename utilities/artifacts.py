@@ -0,0 +1,261 @@
+"""
+Test artifact policy and cost accounting
+
+Decides per test whether traces, videos and screenshots are recorded and kept,
+discards the artifacts of passing tests without writing them to disk, and
+measures the time and bytes each test spends on artifacts.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+from config.settings import (
+    ARTIFACT_COSTS_DIR, ARTIFACT_POLICY, ARTIFACT_VIDEO, REPORTS_DIR,
+    SCREENSHOTS_DIR, TRACES_DIR, VIDEOS_DIR
+)
+from utilities import run_stats
+from utilities.helpers import get_worker_id
+from utilities.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+
+logger = get_logger(__name__)
+
+# Videos are written by the browser while recording; they live here until the
+# test outcome is known and are then moved to VIDEOS_DIR or deleted.
+VIDEO_STAGING_DIR = REPORTS_DIR / ".video-staging"
+
+
+class ArtifactPolicy:
+    """
+    When to record and keep artifacts
+
+    Modes:
+        off: never record
+        on-failure: record every test, keep artifacts of failed tests only
+        on-first-retry: record only the first rerun (pytest-rerunfailures) and keep it
+        sampled:<N>: record N% of tests (stable per test id), keep them plus any failure
+    """
+
+    MODES = ("off", "on-failure", "on-first-retry", "sampled")
+
+    def __init__(self, mode: str = "on-failure", sample_percent: float = 10):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown artifact policy '{mode}', expected one of: {self.MODES}")
+        self.mode = mode
+        self.sample_percent = sample_percent
+
+    @classmethod
+    def parse(cls, value: str = ARTIFACT_POLICY) -> "ArtifactPolicy":
+        """
+        Build policy from a string such as 'on-failure' or 'sampled:25'
+
+        Args:
+            value: Policy string
+
+        Returns:
+            ArtifactPolicy instance
+        """
+        mode, _, percent = value.strip().lower().partition(":")
+        if percent:
+            return cls(mode, float(percent))
+        return cls(mode)
+
+    def should_record(self, item) -> bool:
+        """Whether artifacts should be captured while the test runs"""
+        if self.mode == "off":
+            return False
+        if self.mode == "on-first-retry":
+            return getattr(item, "execution_count", 1) == 2
+        if self.mode == "sampled":
+            return self._is_sampled(item.nodeid)
+        return True
+
+    def should_retain(self, item, failed: bool) -> bool:
+        """Whether captured artifacts should be written to reports/"""
+        if self.mode == "off":
+            return False
+        if self.mode == "on-failure":
+            return failed
+        return failed or self.should_record(item)
+
+    def _is_sampled(self, nodeid: str) -> bool:
+        """Stable pseudo-random sampling, identical on every worker"""
+        bucket = int(hashlib.sha256(nodeid.encode()).hexdigest()[:8], 16) % 10000
+        return bucket < self.sample_percent * 100
+
+    def __str__(self) -> str:
+        return f"sampled:{self.sample_percent:g}" if self.mode == "sampled" else self.mode
+
+
+class ArtifactRecorder:
+    """Records artifacts for one test according to the policy"""
+
+    def __init__(self, policy: ArtifactPolicy, item, record_video: bool = ARTIFACT_VIDEO):
+        """
+        Args:
+            policy: Artifact policy
+            item: pytest item of the running test
+            record_video: Whether video is part of the recorded artifacts
+        """
+        self.policy = policy
+        self.item = item
+        self.recording = policy.should_record(item)
+        self.record_video = record_video and self.recording
+        self.artifact_bytes = 0
+        self.artifact_ms = 0.0
+        self._retain = False
+        self._contexts: List[BrowserContext] = []
+        self._pages: List[Page] = []
+
+    @property
+    def slug(self) -> str:
+        """File-system friendly test id"""
+        return re.sub(r"[^A-Za-z0-9_.-]+", "-", self.item.nodeid).strip("-")[:200]
+
+    def context_args(self) -> Dict:
+        """Extra new_context() options (video) for contexts created by this test"""
+        if not self.record_video:
+            return {}
+        VIDEO_STAGING_DIR.mkdir(parents=True, exist_ok=True)
+        return {"record_video_dir": str(VIDEO_STAGING_DIR)}
+
+    def attach(self, page: Page):
+        """
+        Start capturing for page and its context
+
+        Args:
+            page: Page used by the test
+        """
+        self._pages.append(page)
+        if not self.recording or page.context in self._contexts:
+            return
+
+        with self._timed():
+            page.context.tracing.start(title=self.item.nodeid, screenshots=True, snapshots=True)
+        self._contexts.append(page.context)
+
+    def capture_screenshot(self, page: Page) -> Optional[Path]:
+        """Screenshot of a failing test, counted in its artifact cost"""
+        if self.policy.mode == "off":
+            return None
+
+        path = SCREENSHOTS_DIR / f"{self.slug}_{time.strftime('%Y%m%d_%H%M%S')}.png"
+        with self._timed():
+            page.screenshot(path=str(path), full_page=True)
+        self._account(path)
+        return path
+
+    def finish(self, failed: bool):
+        """
+        Stop capturing and keep or discard artifacts; must run before pages close
+
+        Args:
+            failed: Whether the test failed
+        """
+        retain = self.recording and self.policy.should_retain(self.item, failed)
+
+        with self._timed():
+            for index, context in enumerate(self._contexts):
+                suffix = "" if len(self._contexts) == 1 else f"-{index + 1}"
+                try:
+                    if retain:
+                        TRACES_DIR.mkdir(parents=True, exist_ok=True)
+                        path = TRACES_DIR / f"{self.slug}{suffix}.zip"
+                        context.tracing.stop(path=str(path))
+                        self._account(path)
+                    else:
+                        # No path: the trace is dropped inside the browser
+                        context.tracing.stop()
+                except Exception as e:
+                    logger.warning(f"Failed to stop tracing: {e}")
+
+        if self.recording:
+            run_stats.incr("artifacts", "retained" if retain else "discarded")
+        self._contexts.clear()
+        self._retain = retain
+
+    def finish_videos(self):
+        """Move or delete videos; only possible after their pages are closed"""
+        if not self.record_video:
+            return
+
+        with self._timed():
+            for index, page in enumerate(self._pages):
+                if not page.video:
+                    continue
+                try:
+                    if self._retain:
+                        VIDEOS_DIR.mkdir(parents=True, exist_ok=True)
+                        path = VIDEOS_DIR / f"{self.slug}-{index + 1}.webm"
+                        shutil.move(page.video.path(), path)
+                        self._account(path)
+                    else:
+                        page.video.delete()
+                except Exception as e:
+                    logger.warning(f"Failed to handle video: {e}")
+
+    def cost(self) -> Dict:
+        """Artifact cost of this test"""
+        return {"artifact_bytes": self.artifact_bytes, "artifact_ms": round(self.artifact_ms, 1)}
+
+    def _account(self, path: Path):
+        """Add a written file to the artifact cost"""
+        if path.exists():
+            size = path.stat().st_size
+            self.artifact_bytes += size
+            run_stats.incr("artifacts", "bytes", size)
+
+    def _timed(self):
+        """Context manager adding elapsed time to the artifact cost"""
+        return _Timer(self)
+
+
+class _Timer:
+    """Adds the duration of a with-block to a recorder's artifact_ms"""
+
+    def __init__(self, recorder: ArtifactRecorder):
+        self.recorder = recorder
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.recorder.artifact_ms += (time.perf_counter() - self.start) * 1000
+        return False
+
+
+def record_test_cost(nodeid: str, wall_ms: float, cost: Dict, costs_dir: Path = ARTIFACT_COSTS_DIR):
+    """
+    Append one test's wall time and artifact cost to this worker's cost file
+
+    Args:
+        nodeid: Test id
+        wall_ms: Setup + call + teardown time in milliseconds
+        cost: Result of ArtifactRecorder.cost()
+        costs_dir: Directory holding the per-worker JSON-lines files
+    """
+    costs_dir.mkdir(parents=True, exist_ok=True)
+    with open(costs_dir / f"{get_worker_id()}.jsonl", 'a', encoding='utf-8') as f:
+        f.write(json.dumps({"nodeid": nodeid, "wall_ms": round(wall_ms, 1), **cost}) + "\n")
+
+
+def load_test_costs(costs_dir: Path = ARTIFACT_COSTS_DIR) -> List[Dict]:
+    """Read the cost records written by all workers"""
+    records = []
+    if costs_dir.exists():
+        for path in sorted(costs_dir.glob("*.jsonl")):
+            with open(path, 'r', encoding='utf-8') as f:
+                records.extend(json.loads(line) for line in f if line.strip())
+    return records
+
+
+def reset_test_costs(costs_dir: Path = ARTIFACT_COSTS_DIR):
+    """Remove cost records of a previous run"""
+    if costs_dir.exists():
+        shutil.rmtree(costs_dir)
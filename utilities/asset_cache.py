@@ -0,0 +1,208 @@
+"""
+Shared on-disk cache for static assets
+
+Serves OrangeHRM's JS bundles, CSS, fonts and images to Playwright routes from
+a content-addressed cache shared by all xdist workers, falling through to the
+network on a miss. The cache is bounded in size and evicts least recently used
+entries.
+"""
+from __future__ import annotations
+import hashlib
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from config.settings import ASSET_CACHE_DIR, ASSET_CACHE_MAX_MB, BASE_URL
+from utilities import run_stats
+from utilities.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Route
+
+logger = get_logger(__name__)
+
+STATIC_ASSET_PATTERN = re.compile(
+    re.escape(BASE_URL.rstrip("/")) + r"/.*\.(?:js|css|woff2?|ttf|eot|png|jpe?g|gif|svg|ico|webp)(?:\?.*)?$",
+    re.IGNORECASE,
+)
+
+# Headers describing the transfer rather than the content are not replayed
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection",
+                    "set-cookie", "date"}
+
+
+class _FileLock:
+    """Exclusive inter-process lock on a file"""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'a+')
+        if fcntl:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        self._file.close()
+        return False
+
+
+class AssetCache:
+    """Content-addressed, size-bounded cache of static responses"""
+
+    def __init__(self, cache_dir: Path = ASSET_CACHE_DIR, max_bytes: int = ASSET_CACHE_MAX_MB * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Cache root shared by all workers
+            max_bytes: Size bound of the stored bodies
+        """
+        self.cache_dir = Path(cache_dir)
+        self.blobs_dir = self.cache_dir / "blobs"
+        self.index_dir = self.cache_dir / "index"
+        self.lock_path = self.cache_dir / ".lock"
+        self.max_bytes = max_bytes
+        self._written_since_eviction = 0
+
+    def install(self, context: BrowserContext):
+        """Route static asset requests of context through the cache"""
+        context.route(STATIC_ASSET_PATTERN, self.handle_route)
+
+    def handle_route(self, route: Route):
+        """Playwright route handler: fulfil from cache or fetch and store"""
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+
+        cached = self.get(request.url)
+        if cached:
+            status, headers, body = cached
+            run_stats.incr("asset_cache", "hits")
+            run_stats.incr("asset_cache", "bytes_saved", len(body))
+            route.fulfill(status=status, headers=headers, body=body)
+            return
+
+        run_stats.incr("asset_cache", "misses")
+        response = route.fetch()
+        body = response.body()
+        cache_control = response.headers.get("cache-control", "")
+        if response.status == 200 and "no-store" not in cache_control:
+            self.put(request.url, response.status, response.headers, body)
+        route.fulfill(response=response, body=body)
+
+    def get(self, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """
+        Look up a cached response
+
+        Args:
+            url: Request URL
+
+        Returns:
+            (status, headers, body) or None on a miss
+        """
+        index_path = self.index_dir / f"{self._url_key(url)}.json"
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            body = (self.blobs_dir / entry["sha256"]).read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+        # Touch the index entry: its mtime is the LRU clock
+        try:
+            os.utime(index_path)
+        except OSError:
+            pass
+        return entry["status"], entry["headers"], body
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """
+        Store a response; body and index are written atomically
+
+        Args:
+            url: Request URL
+            status: HTTP status
+            headers: Response headers
+            body: Response body
+        """
+        digest = hashlib.sha256(body).hexdigest()
+        blob_path = self.blobs_dir / digest
+        if not blob_path.exists():
+            self._write_atomic(blob_path, body)
+            self._written_since_eviction += len(body)
+
+        entry = {
+            "url": url,
+            "sha256": digest,
+            "size": len(body),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+        }
+        self._write_atomic(self.index_dir / f"{self._url_key(url)}.json", json.dumps(entry).encode())
+
+        if self._written_since_eviction > self.max_bytes // 10:
+            self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        self._written_since_eviction = 0
+        with _FileLock(self.lock_path):
+            entries = []
+            for index_path in self.index_dir.glob("*.json"):
+                try:
+                    with open(index_path, 'r', encoding='utf-8') as f:
+                        entry = json.load(f)
+                    entries.append((index_path.stat().st_mtime, index_path, entry))
+                except (OSError, ValueError):
+                    continue
+
+            entries.sort(key=lambda e: e[0], reverse=True)
+            # Several URLs can share one blob; it is deleted with its last reference
+            references = Counter(entry["sha256"] for _, _, entry in entries)
+            total = sum({entry["sha256"]: entry["size"] for _, _, entry in entries}.values())
+            removed = 0
+
+            while entries and total > self.max_bytes:
+                _, index_path, entry = entries.pop()
+                index_path.unlink(missing_ok=True)
+                removed += 1
+                references[entry["sha256"]] -= 1
+                if not references[entry["sha256"]]:
+                    (self.blobs_dir / entry["sha256"]).unlink(missing_ok=True)
+                    total -= entry["size"]
+
+            if removed:
+                run_stats.incr("asset_cache", "evicted", removed)
+                logger.info(f"Asset cache evicted {removed} entries, {total / 1024 / 1024:.1f} MB left")
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        """Index file name for a URL"""
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Write to a temporary file and rename, so readers never see partial data"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
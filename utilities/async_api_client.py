@@ -0,0 +1,330 @@
+"""
+Async API client for concurrent OrangeHRM API calls
+
+AsyncAPIClient mirrors APIClient (get/post/put/delete/set_auth_token/login)
+on top of aiohttp: one pooled keep-alive connector per client, a semaphore
+bounding in-flight requests per host and a gather() helper for fan-out.
+SyncAPIBridge runs a client on a private event loop thread so synchronous
+tests can use it without becoming async.
+"""
+import asyncio
+import json as jsonlib
+import threading
+import time
+from typing import Any, Coroutine, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlsplit
+import aiohttp
+from multidict import CIMultiDict
+from config.settings import (
+    API_BASE_URL, API_KEEPALIVE_TIMEOUT, API_MAX_CONCURRENCY_PER_HOST, API_POOL_SIZE, API_TIMEOUT, URLs
+)
+from utilities import run_stats
+from utilities.api_client import extract_csrf_token
+from utilities.data_registry import registry
+from utilities.logger import get_logger
+from utilities.resilience import RetryPolicy, breaker_for, parse_retry_after
+
+logger = get_logger(__name__)
+
+# A batch call: (method, endpoint) or (method, endpoint, request kwargs)
+Call = Union[Tuple[str, str], Tuple[str, str, Dict[str, Any]]]
+
+
+class APIResponse:
+    """Fully read response, with the requests.Response attributes tests rely on"""
+
+    def __init__(self, method: str, url: str, status_code: int, headers: Dict[str, str],
+                 content: bytes, elapsed_ms: float):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.elapsed_ms = elapsed_ms
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return jsonlib.loads(self.content)
+
+    def __repr__(self) -> str:
+        return f"<APIResponse [{self.status_code}] {self.method} {self.url}>"
+
+
+class AsyncAPIClient:
+    """Async API client with a pooled keep-alive connector and per-host concurrency limit"""
+
+    def __init__(self, base_url: str = API_BASE_URL, pool_size: int = API_POOL_SIZE,
+                 max_per_host: int = API_MAX_CONCURRENCY_PER_HOST,
+                 keepalive_timeout: float = API_KEEPALIVE_TIMEOUT, timeout: float = API_TIMEOUT,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Args:
+            base_url: Prefix for endpoints
+            pool_size: Total number of pooled connections
+            max_per_host: Requests in flight per host (and connections per host)
+            keepalive_timeout: Seconds an idle connection is kept open
+            timeout: Total timeout per request in seconds
+            retry_policy: Retries of failed idempotent calls; RetryPolicy() by default
+        """
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the session and its pooled connections"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def set_auth_token(self, token: str):
+        """Set authorization token"""
+        self.headers["Authorization"] = f"Bearer {token}"
+        logger.info("Authorization token set")
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        Pooled session with this client's cookies, bound to the running loop
+
+        For callers that measure raw requests (see utilities.api_load): they
+        bypass retries, the circuit breaker, the host semaphore and logging,
+        and must send self.headers themselves.
+        """
+        return self._get_session()
+
+    async def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> APIResponse:
+        """GET request"""
+        return await self.request("GET", endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint: str, json: Optional[Dict] = None, **kwargs) -> APIResponse:
+        """POST request"""
+        return await self.request("POST", endpoint, json=json, **kwargs)
+
+    async def put(self, endpoint: str, json: Optional[Dict] = None, **kwargs) -> APIResponse:
+        """PUT request"""
+        return await self.request("PUT", endpoint, json=json, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs) -> APIResponse:
+        """DELETE request"""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def request(self, method: str, endpoint: str, **kwargs) -> APIResponse:
+        """
+        Send a request once a slot for its host is free, retrying per retry_policy
+
+        Args:
+            method: HTTP method
+            endpoint: Path appended to base_url, or an absolute URL
+            **kwargs: Passed to aiohttp (params, json, data, headers, ...)
+
+        Returns:
+            APIResponse
+
+        Raises:
+            CircuitOpenError: The host's circuit is open
+            aiohttp.ClientError, asyncio.TimeoutError: Last attempt failed to connect
+        """
+        url = endpoint if "://" in endpoint else f"{self.base_url}{endpoint}"
+        kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        breaker = breaker_for(url)
+        attempt = 0
+        while True:
+            breaker.check()
+            try:
+                response = await self._send_once(method, url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                breaker.record(None)
+                delay = self.retry_policy.retry_delay(method, attempt)
+                if delay is None or breaker.state == breaker.OPEN:
+                    raise
+                reason = e.__class__.__name__
+            else:
+                breaker.record(response.status_code)
+                delay = self.retry_policy.retry_delay(
+                    method, attempt, response.status_code, parse_retry_after(response.headers.get("Retry-After")))
+                if delay is None or breaker.state == breaker.OPEN:
+                    registry.track(method, url, response.status_code, response.json)
+                    return response
+                reason = str(response.status_code)
+
+            attempt += 1
+            run_stats.incr("api_resilience", "retries")
+            logger.warning("API %s %s failed (%s), retry %s in %.2fs", method, url, reason, attempt, delay)
+            await asyncio.sleep(delay)
+
+    async def _send_once(self, method: str, url: str, **kwargs) -> APIResponse:
+        """Send one request once a slot for its host is free, and read the whole body"""
+        session = self._get_session()
+        semaphore = self._semaphore(url)
+
+        queued = time.perf_counter()
+        async with semaphore:
+            started = time.perf_counter()
+            run_stats.observe("async_api", "queue_wait_ms", (started - queued) * 1000)
+            logger.info("API Request: %s %s", method, url)
+
+            async with session.request(method, url, **kwargs) as response:
+                content = await response.read()
+                elapsed_ms = (time.perf_counter() - started) * 1000
+
+        run_stats.incr("async_api", "requests")
+        logger.info("API Response: %s (%.0fms)", response.status, elapsed_ms)
+        return APIResponse(method, str(response.url), response.status, CIMultiDict(response.headers),
+                           content, elapsed_ms)
+
+    async def gather(self, calls: Iterable[Call], return_exceptions: bool = False) -> List[Any]:
+        """
+        Run many requests concurrently, bounded by the per-host limit
+
+        Args:
+            calls: (method, endpoint) or (method, endpoint, kwargs) tuples
+            return_exceptions: Return exceptions in place of failed responses instead of raising
+
+        Returns:
+            Responses in the order of calls
+        """
+        coroutines = [self.request(call[0], call[1], **(call[2] if len(call) > 2 else {})) for call in calls]
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    async def login(self, username: str, password: str) -> bool:
+        """
+        Log in through the web auth endpoint, keeping the session cookie
+
+        Args:
+            username: Username
+            password: Password
+
+        Returns:
+            True if the server accepted the credentials
+        """
+        html_headers = {"Accept": "text/html"}
+
+        logger.info("API login for username: %s", username)
+        page = await self.get(URLs.LOGIN, headers=html_headers)
+        if "/auth/login" not in page.url:
+            # The session is already logged in: the login page redirects to the dashboard
+            logger.info("API session already logged in: %s", page.url)
+            return True
+        token = extract_csrf_token(page.text)
+        if not token:
+            logger.warning("CSRF token not found on login page")
+            return False
+
+        response = await self.request(
+            "POST",
+            URLs.AUTH_VALIDATE,
+            data={"_token": token, "username": username, "password": password},
+            headers={**html_headers, "Content-Type": "application/x-www-form-urlencoded"},
+        )
+        success = response.ok and "/auth/login" not in response.url
+        logger.info("API login %s: %s", "succeeded" if success else "failed", response.url)
+        return success
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Session bound to the running loop, created on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.max_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                # unsafe: also keep cookies of IP hosts such as the local stand-in
+                cookie_jar=aiohttp.CookieJar(unsafe=True),
+            )
+        return self._session
+
+    def _semaphore(self, url: str) -> asyncio.Semaphore:
+        """Concurrency limit of the URL's host"""
+        host = urlsplit(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._semaphores[host]
+
+
+class SyncAPIBridge:
+    """
+    Blocking facade over AsyncAPIClient for synchronous tests
+
+    The client lives on one event loop thread for the bridge's lifetime, so
+    its connection pool is reused across calls.
+    """
+
+    def __init__(self, client: Optional[AsyncAPIClient] = None, **client_kwargs):
+        """
+        Args:
+            client: Client to run; created from client_kwargs if omitted
+            **client_kwargs: AsyncAPIClient arguments (base_url, pool_size, ...)
+        """
+        self.client = client or AsyncAPIClient(**client_kwargs)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-api-loop", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "SyncAPIBridge":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def run(self, coroutine: Coroutine, timeout: Optional[float] = None) -> Any:
+        """Run a coroutine on the bridge's loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def set_auth_token(self, token: str):
+        """Set authorization token"""
+        self.client.set_auth_token(token)
+
+    def get(self, endpoint: str, params: Optional[Dict] = None, **kwargs) -> APIResponse:
+        """GET request"""
+        return self.run(self.client.get(endpoint, params=params, **kwargs))
+
+    def post(self, endpoint: str, json: Optional[Dict] = None, **kwargs) -> APIResponse:
+        """POST request"""
+        return self.run(self.client.post(endpoint, json=json, **kwargs))
+
+    def put(self, endpoint: str, json: Optional[Dict] = None, **kwargs) -> APIResponse:
+        """PUT request"""
+        return self.run(self.client.put(endpoint, json=json, **kwargs))
+
+    def delete(self, endpoint: str, **kwargs) -> APIResponse:
+        """DELETE request"""
+        return self.run(self.client.delete(endpoint, **kwargs))
+
+    def login(self, username: str, password: str) -> bool:
+        """Log in through the web auth endpoint"""
+        return self.run(self.client.login(username, password))
+
+    def gather(self, calls: Sequence[Call], return_exceptions: bool = False) -> List[Any]:
+        """Run many requests concurrently; see AsyncAPIClient.gather"""
+        return self.run(self.client.gather(calls, return_exceptions=return_exceptions))
+
+    def close(self):
+        """Close the client and stop the loop thread"""
+        if not self._loop.is_running():
+            return
+        self.run(self.client.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -0,0 +1,221 @@
+"""
+Authenticated session cache
+
+Logs in once per role and per worker, stores the Playwright storage state on
+disk and replays it into new browser contexts instead of a UI login per test.
+"""
+from __future__ import annotations
+import json
+import os
+import time
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+from config.settings import (
+    AUTH_STATE_DIR, AUTH_STATE_MAX_AGE, AUTH_VIA_API, BASE_URL, TIMEOUT, TestUsers, URLs
+)
+from utilities.helpers import get_worker_id
+from utilities.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page
+
+logger = get_logger(__name__)
+
+# Roles that can be requested through the auth_role marker
+USERS_BY_ROLE = {
+    TestUsers.ADMIN["role"]: TestUsers.ADMIN,
+    TestUsers.ESS_USER["role"]: TestUsers.ESS_USER,
+}
+
+# Context options that must not leak into the throw-away login context
+_LOGIN_CONTEXT_EXCLUDED_ARGS = ("record_video_dir", "record_video_size", "storage_state")
+
+
+class AuthStateCache:
+    """Per-worker cache of logged-in storage states, keyed by role"""
+
+    def __init__(self, browser: Browser, context_args: Optional[Dict] = None,
+                 state_dir: Path = AUTH_STATE_DIR, max_age: int = AUTH_STATE_MAX_AGE,
+                 via_api: bool = AUTH_VIA_API):
+        """
+        Args:
+            browser: Browser used for the one-off login contexts
+            context_args: Context options (viewport, base_url, ...) for login contexts
+            state_dir: Directory holding the storage state files
+            max_age: Seconds after which a stored state is considered stale
+            via_api: Try the HTTP login before the UI login
+        """
+        self.browser = browser
+        self.context_args = {
+            key: value for key, value in (context_args or {}).items()
+            if key not in _LOGIN_CONTEXT_EXCLUDED_ARGS
+        }
+        self.state_dir = Path(state_dir)
+        self.max_age = max_age
+        self.via_api = via_api
+        self._states: Dict[str, dict] = {}
+        # Local storage init scripts already added to each context
+        self._init_scripts: "weakref.WeakKeyDictionary[BrowserContext, set]" = weakref.WeakKeyDictionary()
+        # How each role was last logged in on this worker: "api" or "ui"
+        self.login_methods: Dict[str, str] = {}
+
+    def state_path(self, role: str) -> Path:
+        """Storage state file for a role on the current worker"""
+        return self.state_dir / f"{get_worker_id()}_{role.lower()}.json"
+
+    def get_state(self, role: str) -> dict:
+        """
+        Get storage state for role, logging in only when nothing valid is cached
+
+        Args:
+            role: Role name (Admin/ESS)
+
+        Returns:
+            Playwright storage state dict
+        """
+        if role in self._states:
+            return self._states[role]
+
+        path = self.state_path(role)
+        if path.exists() and time.time() - path.stat().st_mtime < self.max_age:
+            logger.info(f"Reusing stored session for role: {role}")
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        else:
+            state = self._login(role)
+            self._save(path, state)
+
+        self._states[role] = state
+        return state
+
+    def invalidate(self, role: str):
+        """Forget cached state for role (e.g. after the server expired it)"""
+        self._states.pop(role, None)
+        self.state_path(role).unlink(missing_ok=True)
+        logger.info(f"Invalidated stored session for role: {role}")
+
+    def apply(self, context: BrowserContext, role: str):
+        """
+        Load cached cookies and local storage for role into an existing context
+
+        Args:
+            context: Browser context to authenticate
+            role: Role name (Admin/ESS)
+        """
+        state = self.get_state(role)
+        context.add_cookies(state.get("cookies", []))
+
+        origins = [origin for origin in state.get("origins", []) if origin.get("localStorage")]
+        if not origins:
+            return
+        script = (
+            "(origins => {"
+            "  const entry = origins.find(o => o.origin === window.location.origin);"
+            "  if (entry) entry.localStorage.forEach(i => window.localStorage.setItem(i.name, i.value));"
+            f"}})({json.dumps(origins)})"
+        )
+        # Init scripts cannot be removed: re-authentication with the same state
+        # must not stack another copy that runs on every navigation
+        added = self._init_scripts.setdefault(context, set())
+        if script not in added:
+            context.add_init_script(script)
+            added.add(script)
+
+    def open_authenticated(self, page: Page, role: str) -> Page:
+        """
+        Authenticate page's context from the cache and land on the dashboard
+
+        A redirect back to the login page means the stored session is no longer
+        accepted; the cache is refreshed once and the navigation retried. If a
+        fresh API session is rejected as well, the UI login is used instead.
+
+        Args:
+            page: Page whose context should be authenticated
+            role: Role name (Admin/ESS)
+
+        Returns:
+            The same page, on the dashboard
+        """
+        self.apply(page.context, role)
+        page.goto(URLs.DASHBOARD)
+
+        if "/auth/login" in page.url:
+            logger.info(f"Stored session for role '{role}' rejected, re-authenticating")
+            self.invalidate(role)
+            page.context.clear_cookies()
+            self.apply(page.context, role)
+            page.goto(URLs.DASHBOARD)
+
+        if "/auth/login" in page.url and self.login_methods.get(role) == "api":
+            logger.warning(f"API session for role '{role}' not accepted by browser, using UI login")
+            self.invalidate(role)
+            page.context.clear_cookies()
+            state = self._login(role, via_api=False)
+            self._save(self.state_path(role), state)
+            self._states[role] = state
+            self.apply(page.context, role)
+            page.goto(URLs.DASHBOARD)
+
+        page.wait_for_url("**/dashboard/index", timeout=10000)
+        return page
+
+    def _login(self, role: str, via_api: Optional[bool] = None) -> dict:
+        """Log in for role, preferring the HTTP path and falling back to the UI"""
+        if role not in USERS_BY_ROLE:
+            raise ValueError(f"Unknown role '{role}', expected one of: {list(USERS_BY_ROLE)}")
+        user = USERS_BY_ROLE[role]
+
+        if via_api is None:
+            via_api = self.via_api
+
+        if via_api:
+            try:
+                state = self._login_via_api(user)
+                if state:
+                    self.login_methods[role] = "api"
+                    logger.info(f"Logged in via API for role: {role}")
+                    return state
+                logger.warning(f"API login rejected for role '{role}', falling back to UI")
+            except Exception as e:
+                logger.warning(f"API login failed for role '{role}', falling back to UI: {e}")
+
+        state = self._login_via_ui(user)
+        self.login_methods[role] = "ui"
+        logger.info(f"Logged in via UI for role: {role}")
+        return state
+
+    def _login_via_api(self, user: dict) -> Optional[dict]:
+        """Post credentials over HTTP and build a storage state from the cookies"""
+        from utilities.api_client import APIClient
+
+        client = APIClient(base_url=BASE_URL)
+        try:
+            if not client.login(user["username"], user["password"]):
+                return None
+            return {"cookies": client.get_playwright_cookies(), "origins": []}
+        finally:
+            client.session.close()
+
+    def _login_via_ui(self, user: dict) -> dict:
+        """Log in through the login form in a throw-away context and capture its state"""
+        from tests.ui.pages.login_page import LoginPage
+
+        context = self.browser.new_context(**self.context_args)
+        try:
+            page = context.new_page()
+            page.set_default_timeout(TIMEOUT)
+            page.goto(URLs.LOGIN)
+            LoginPage(page).login(user["username"], user["password"])
+            page.wait_for_url("**/dashboard/index", timeout=10000)
+            return context.storage_state()
+        finally:
+            context.close()
+
+    def _save(self, path: Path, state: dict):
+        """Write state atomically so concurrent readers never see partial files"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,106 @@
+"""
+Browser context pool
+
+Keeps one browser per worker and a set of pre-created contexts that are reset
+between tests, so a test only pays for new_page() instead of a browser launch.
+"""
+from __future__ import annotations
+import time
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from utilities import run_stats
+from utilities.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext
+
+logger = get_logger(__name__)
+
+
+class BrowserContextPool:
+    """Pool of reusable browser contexts created with the same options"""
+
+    def __init__(self, browser: Browser, context_args: Optional[Dict] = None,
+                 size: int = 2, name: str = "context_pool",
+                 setup: Optional[Callable[[BrowserContext], None]] = None):
+        """
+        Args:
+            browser: Browser the contexts are created in
+            context_args: Options passed to browser.new_context()
+            size: Number of contexts kept warm
+            name: Section name used for the run statistics
+            setup: Called once for every new context (routes, init scripts)
+        """
+        self.browser = browser
+        self.context_args = context_args or {}
+        self.setup = setup
+        self.size = size
+        self.name = name
+        self._idle: List[BrowserContext] = []
+
+    def warm_up(self):
+        """Pre-create contexts up to the pool size"""
+        start = time.perf_counter()
+        while len(self._idle) < self.size:
+            self._idle.append(self._create())
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        run_stats.observe(self.name, "warm_up_ms", elapsed_ms)
+        logger.info(f"Warmed up {self.size} contexts for '{self.name}' in {elapsed_ms:.0f}ms")
+
+    def acquire(self) -> BrowserContext:
+        """Take a clean context from the pool, creating one if the pool is empty"""
+        if self._idle:
+            run_stats.incr(self.name, "hits")
+            return self._idle.pop()
+
+        run_stats.incr(self.name, "misses")
+        start = time.perf_counter()
+        context = self._create()
+        run_stats.observe(self.name, "miss_create_ms", (time.perf_counter() - start) * 1000)
+        return context
+
+    def release(self, context: BrowserContext):
+        """
+        Reset context and return it to the pool, or close it if it cannot be reused
+
+        Args:
+            context: Context previously returned by acquire()
+        """
+        if len(self._idle) < self.size and self._reset(context):
+            self._idle.append(context)
+            return
+
+        run_stats.incr(self.name, "recycled")
+        context.close()
+
+    def close(self):
+        """Close all idle contexts"""
+        while self._idle:
+            self._idle.pop().close()
+
+    def _create(self) -> BrowserContext:
+        """Create a new context with the pool's options"""
+        context = self.browser.new_context(**self.context_args)
+        if self.setup:
+            self.setup(context)
+        return context
+
+    def _reset(self, context: BrowserContext) -> bool:
+        """
+        Clear per-test state: pages, cookies, permissions and storage
+
+        Returns:
+            False if the context holds state that cannot be cleared without a page
+        """
+        try:
+            for page in list(context.pages):
+                page.close()
+            context.clear_cookies()
+            context.clear_permissions()
+
+            # Session storage dies with the pages; local storage needs a page on
+            # the origin to be cleared, so such contexts are replaced instead.
+            state = context.storage_state()
+            return not any(origin.get("localStorage") for origin in state.get("origins", []))
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled context: {e}")
+            return False
@@ -0,0 +1,193 @@
+"""
+Pre-generated test data pool shared by all xdist workers
+
+The controlling process generates employees, users and leave requests once
+per run (build_pool) and writes one file per kind to DATA_POOL_DIR. Records
+are JSON padded to a fixed width, so record i starts at i * record_size.
+Workers memory-map the files and each reads its own disjoint slice, decoding
+only the records it takes; they never import Faker.
+"""
+import json
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from config.settings import DATA_POOL, DATA_POOL_DIR, DATA_POOL_RECORDS, DATA_SEED
+from utilities.helpers import get_worker_count, get_worker_index
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+POOL_KINDS = ("employees", "users", "leave_requests")
+# Describes the pool files: records, record size and seed per kind
+MANIFEST = "manifest.json"
+
+
+class PoolExhaustedError(LookupError):
+    """Raised when a worker has taken all records of its slice"""
+
+
+def build_pool(records: int = DATA_POOL_RECORDS, seed: Optional[int] = DATA_SEED,
+               pool_dir: Path = DATA_POOL_DIR) -> bool:
+    """
+    Generate the pool files, unless a pool of the same size and seed exists
+
+    An unseeded pool is generated again on every call, so each run gets new data.
+
+    Args:
+        records: Records per kind
+        seed: DATA_SEED of the generated data
+        pool_dir: Directory of the pool files
+
+    Returns:
+        True if the files were (re)generated
+    """
+    manifest_path = pool_dir / MANIFEST
+    if seed is not None and manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if all(manifest.get(kind, {}).get("records") == records and manifest[kind].get("seed") == seed
+               for kind in POOL_KINDS):
+            logger.info(f"Reusing test data pool in {pool_dir}")
+            return False
+
+    # Faker is only imported by the process that builds the pool
+    from utilities.generate_data import BatchDataGenerator
+
+    started = time.perf_counter()
+    pool_dir.mkdir(parents=True, exist_ok=True)
+    # Own id space, so pool records never collide with what the workers generate themselves
+    generator = BatchDataGenerator(seed=seed, worker=BatchDataGenerator.POOL_SLOT)
+    generated = {
+        "employees": generator.employees(records),
+        "users": generator.users(records),
+        "leave_requests": generator.leave_requests(records),
+    }
+
+    manifest = {}
+    for kind, items in generated.items():
+        encoded = [json.dumps(item, separators=(",", ":")).encode("ascii") for item in items]
+        # Padding plus newline: the file is valid JSON lines as well
+        record_size = max(map(len, encoded), default=0) + 1
+        temp_path = pool_dir / f"{kind}.dat.tmp"
+        with open(temp_path, "wb") as f:
+            for line in encoded:
+                f.write(line.ljust(record_size - 1) + b"\n")
+        os.replace(temp_path, pool_dir / f"{kind}.dat")
+        manifest[kind] = {"records": len(encoded), "record_size": record_size, "seed": seed}
+
+    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    logger.info(f"Generated test data pool of {records} records per kind in "
+                f"{time.perf_counter() - started:.2f}s")
+    return True
+
+
+class PoolSlice:
+    """A worker's share of one pool file, handed out record by record"""
+
+    def __init__(self, kind: str, data: mmap.mmap, record_size: int, start: int, stop: int):
+        self.kind = kind
+        self.start = start
+        self.stop = stop
+        self._data = data
+        self._record_size = record_size
+        self._next = start
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if not -len(self) <= index < len(self):
+            raise IndexError(f"{self.kind} pool slice index {index} out of range")
+        return self._record(self.start + index % len(self))
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self._record(position) for position in range(self.start, self.stop))
+
+    @property
+    def remaining(self) -> int:
+        """Records not taken yet"""
+        return self.stop - self._next
+
+    def take(self, count: int = 1) -> List[Dict[str, Any]]:
+        """
+        Hand out the next records of the slice; each record is handed out once
+
+        Args:
+            count: Number of records
+
+        Returns:
+            Decoded records
+
+        Raises:
+            PoolExhaustedError: Fewer than count records left
+        """
+        with self._lock:
+            first = self._next
+            if first + count > self.stop:
+                raise PoolExhaustedError(
+                    f"Only {self.stop - first} of {count} {self.kind} left in this worker's pool slice, "
+                    f"raise DATA_POOL_RECORDS")
+            self._next += count
+        return [self._record(position) for position in range(first, first + count)]
+
+    def _record(self, position: int) -> Dict[str, Any]:
+        offset = position * self._record_size
+        return json.loads(self._data[offset:offset + self._record_size])
+
+
+class DataPool:
+    """Memory-mapped pool files with this worker's slice of each kind"""
+
+    employees: PoolSlice
+    users: PoolSlice
+    leave_requests: PoolSlice
+
+    def __init__(self, pool_dir: Path = DATA_POOL_DIR, worker: Optional[int] = None,
+                 workers: Optional[int] = None):
+        """
+        Args:
+            pool_dir: Directory written by build_pool
+            worker: Slice to read; the xdist worker number by default
+            workers: Number of slices; the xdist worker count by default
+
+        Raises:
+            FileNotFoundError: No pool has been built in pool_dir
+        """
+        worker = get_worker_index() if worker is None else worker
+        workers = get_worker_count() if workers is None else workers
+        manifest = json.loads((pool_dir / MANIFEST).read_text(encoding="utf-8"))
+
+        self._files, self._maps = [], []
+        for kind in POOL_KINDS:
+            info = manifest[kind]
+            f = open(pool_dir / f"{kind}.dat", "rb")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._files.append(f)
+            self._maps.append(data)
+            per_worker = info["records"] // workers
+            setattr(self, kind, PoolSlice(kind, data, info["record_size"],
+                                          worker * per_worker, (worker + 1) * per_worker))
+
+    def close(self):
+        """Unmap and close the pool files"""
+        for data in self._maps:
+            data.close()
+        for f in self._files:
+            f.close()
+        self._maps, self._files = [], []
+
+
+_worker_pool: Optional[DataPool] = None
+_worker_pool_lock = threading.Lock()
+
+
+def worker_pool() -> Optional[DataPool]:
+    """This process's slice of the pool, or None if DATA_POOL is off or no pool was built"""
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None and DATA_POOL and (DATA_POOL_DIR / MANIFEST).exists():
+            _worker_pool = DataPool()
+        return _worker_pool
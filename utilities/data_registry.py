@@ -0,0 +1,230 @@
+"""
+Registry of test data created during a session, and its cleanup
+
+Every employee, user and leave entitlement created through APIClient or
+AsyncAPIClient is recorded here (UI-created users are registered by
+username). At the end of the session they are removed with OrangeHRM's bulk
+DELETE endpoints, in batches sent in parallel. Leave requests have no bulk
+DELETE in OrangeHRM (only the cancel action): they are not recorded, and go
+with the test employee they were assigned to.
+
+Generated records carry a tag that starts with the run id (usernames start
+with it, employees have it as middle name). The run id encodes its start
+time, so records left behind by crashed runs can be recognised and swept
+once they are older than ORPHAN_MIN_AGE_MINUTES.
+"""
+import os
+import random
+import re
+import string
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+from config.settings import APIEndpoints, CLEANUP_BATCH_SIZE, ORPHAN_MIN_AGE_MINUTES, TEST_DATA_PREFIX
+from utilities import run_stats
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Entity kind -> bulk endpoint, in deletion order (dependents first)
+ENTITY_ENDPOINTS = {
+    "leave_entitlements": APIEndpoints.LEAVE_ENTITLEMENTS,
+    "users": APIEndpoints.USERS,
+    "employees": APIEndpoints.EMPLOYEES,
+}
+# Field holding the record id in API responses
+ID_FIELDS = {"leave_entitlements": "id", "users": "id", "employees": "empNumber"}
+
+_BASE36 = string.digits + string.ascii_lowercase
+# Run start in minutes since the epoch, as five base-36 digits (until 2084)
+_TIMESTAMP_DIGITS = 5
+
+
+# A whole middle name, or a username prefix followed by "_"
+_TAGGED = re.compile(rf"^{re.escape(TEST_DATA_PREFIX)}([0-9a-z]{{{_TIMESTAMP_DIGITS}}})[0-9a-z]{{2}}\d*(?:_|$)")
+
+
+def _base36(number: int) -> str:
+    digits = ""
+    while number:
+        number, remainder = divmod(number, 36)
+        digits = _BASE36[remainder] + digits
+    return digits.rjust(_TIMESTAMP_DIGITS, "0")
+
+
+def current_run_id() -> str:
+    """
+    Id of this test run: TEST_DATA_PREFIX, start minute and two random characters
+
+    Created by the first process that asks (the xdist controller) and passed
+    to the workers through the TEST_RUN_ID environment variable.
+    """
+    run_id = os.environ.get("TEST_RUN_ID")
+    if not run_id:
+        suffix = "".join(random.choices(_BASE36, k=2))
+        run_id = os.environ["TEST_RUN_ID"] = f"{TEST_DATA_PREFIX}{_base36(int(time.time() // 60))}{suffix}"
+    return run_id
+
+
+def data_tag() -> str:
+    """Tag for records created by this process: run id plus xdist worker number"""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "")
+    return current_run_id() + "".join(filter(str.isdigit, worker))
+
+
+def run_started_at(tagged: str) -> Optional[float]:
+    """
+    Start time of the run that created a tagged value
+
+    Args:
+        tagged: Username or middle name that may start with a data tag
+
+    Returns:
+        Epoch seconds, or None if the value is not tagged
+    """
+    match = _TAGGED.match(tagged)
+    return int(match.group(1), 36) * 60.0 if match else None
+
+
+class DataRegistry:
+    """Thread-safe record of the entities created in this process"""
+
+    def __init__(self):
+        self._ids: Dict[str, set] = {kind: set() for kind in ENTITY_ENDPOINTS}
+        self._usernames: set = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(ids) for ids in self._ids.values()) + len(self._usernames)
+
+    def register(self, kind: str, record_id: int):
+        """
+        Record a created entity
+
+        Args:
+            kind: "employees", "users" or "leave_entitlements"
+            record_id: Its id (empNumber for employees)
+        """
+        if kind not in self._ids:
+            raise ValueError(f"Unknown entity kind '{kind}', expected one of: {list(self._ids)}")
+        with self._lock:
+            self._ids[kind].add(record_id)
+
+    def register_username(self, username: str):
+        """Record a user created without seeing its id (e.g. through the UI)"""
+        with self._lock:
+            self._usernames.add(username)
+
+    def track(self, method: str, url: str, status_code: int, body: Callable[[], Any]):
+        """
+        Register the entity created by an API call, if it created one
+
+        Args:
+            method: HTTP method of the call
+            url: Request URL
+            status_code: Response status
+            body: Returns the decoded response body
+        """
+        if method.upper() != "POST" or status_code != 200:
+            return
+        path = _path(url)
+        for kind, endpoint in ENTITY_ENDPOINTS.items():
+            if path == _path(endpoint):
+                try:
+                    record_id = body()["data"][ID_FIELDS[kind]]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning(f"Created {kind} not registered, no id in response of {url}")
+                    return
+                self.register(kind, record_id)
+                return
+
+    def cleanup(self, api, lookup_client=None, batch_size: int = CLEANUP_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Delete all registered entities
+
+        Args:
+            api: Logged-in SyncAPIBridge used for the parallel bulk deletes
+            lookup_client: Logged-in APIClient to resolve registered usernames
+            batch_size: Ids per bulk DELETE request
+
+        Returns:
+            Number of deleted records per kind
+        """
+        with self._lock:
+            ids = {kind: sorted(kind_ids) for kind, kind_ids in self._ids.items()}
+            usernames = sorted(self._usernames)
+            for kind_ids in self._ids.values():
+                kind_ids.clear()
+            self._usernames.clear()
+
+        if usernames and lookup_client is not None:
+            ids["users"] += [user["id"] for username in usernames
+                             for user in lookup_client.iter_records(APIEndpoints.USERS, {"username": username})]
+
+        deleted = {kind: self._delete(api, kind, kind_ids, batch_size) for kind, kind_ids in ids.items()}
+        logger.info(f"Test data cleanup: {deleted}")
+        return deleted
+
+    def sweep_orphans(self, api, lookup_client, min_age_minutes: float = ORPHAN_MIN_AGE_MINUTES,
+                      batch_size: int = CLEANUP_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Delete tagged users and employees left behind by earlier runs
+
+        Args:
+            api: Logged-in SyncAPIBridge used for the parallel bulk deletes
+            lookup_client: Logged-in APIClient used to list users and employees
+            min_age_minutes: Only runs started at least this long ago are swept
+            batch_size: Ids per bulk DELETE request
+
+        Returns:
+            Number of deleted records per kind
+        """
+        cutoff = time.time() - min_age_minutes * 60
+        current = current_run_id()
+
+        def orphaned(tagged: str) -> bool:
+            started = run_started_at(tagged or "")
+            return started is not None and started < cutoff and not tagged.startswith(current)
+
+        orphans = {
+            "users": [user["id"] for user in lookup_client.iter_records(APIEndpoints.USERS)
+                      if orphaned(user.get("userName"))],
+            "employees": [employee["empNumber"] for employee in lookup_client.iter_records(APIEndpoints.EMPLOYEES)
+                          if orphaned(employee.get("middleName"))],
+        }
+        deleted = {kind: self._delete(api, kind, kind_ids, batch_size, stat="orphans")
+                   for kind, kind_ids in orphans.items()}
+        if any(deleted.values()):
+            logger.info(f"Swept orphaned test data of earlier runs: {deleted}")
+        return deleted
+
+    @staticmethod
+    def _delete(api, kind: str, ids: List[int], batch_size: int, stat: str = "deleted") -> int:
+        """Bulk-delete ids in batches sent concurrently; returns the number deleted"""
+        if not ids:
+            return 0
+        batches = [ids[start:start + batch_size] for start in range(0, len(ids), batch_size)]
+        responses = api.gather([("DELETE", ENTITY_ENDPOINTS[kind], {"json": {"ids": batch}}) for batch in batches],
+                               return_exceptions=True)
+
+        deleted = 0
+        for batch, response in zip(batches, responses):
+            status = getattr(response, "status_code", None)
+            if status == 200:
+                deleted += len(response.json().get("data") or batch)
+            elif status != 404:
+                # 404: already gone (e.g. removed together with their employee)
+                run_stats.incr("data_cleanup", "failed_batches")
+                logger.warning(f"Deleting {len(batch)} {kind} failed: {status or repr(response)}")
+        run_stats.incr("data_cleanup", f"{kind}_{stat}", deleted)
+        return deleted
+
+
+def _path(url: str) -> str:
+    return "/" + "/".join(part for part in urlsplit(url).path.split("/") if part)
+
+
+# Process-wide registry fed by the API clients
+registry = DataRegistry()
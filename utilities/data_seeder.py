@@ -0,0 +1,234 @@
+"""
+Bulk test data seeding through the OrangeHRM API
+
+DataSeeder turns the payloads of utilities.generate_data into records:
+employees first, then system users and leave requests linked to them. Leave
+is assigned by the admin, against entitlements granted for it first. Each
+stage is one concurrent batch on the async client, bounded by SEED_CONCURRENCY
+requests in flight, so a data set of a few dozen records takes seconds.
+"""
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence
+from config.settings import APIEndpoints, SEED_CONCURRENCY, TestUsers
+from utilities import run_stats
+from utilities.async_api_client import APIResponse, SyncAPIBridge
+from utilities.data_registry import data_tag
+from utilities.data_pool import worker_pool
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Generated role names -> OrangeHRM userRoleId
+USER_ROLE_IDS = {"Admin": 1, "ESS": 2}
+
+
+class SeedingError(Exception):
+    """Raised when records of a seeding stage could not be created"""
+
+    def __init__(self, message: str, created: Optional[List[Dict[str, Any]]] = None):
+        super().__init__(message)
+        # Records of the failed stage that were created anyway
+        self.created = created or []
+
+
+@dataclass
+class SeededData:
+    """Records created by one seeding run, as returned by the API"""
+    tag: str
+    employees: List[Dict[str, Any]] = field(default_factory=list)
+    users: List[Dict[str, Any]] = field(default_factory=list)
+    leave_requests: List[Dict[str, Any]] = field(default_factory=list)
+    # Username -> password of the created users
+    passwords: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def employee_numbers(self) -> List[int]:
+        return [employee["empNumber"] for employee in self.employees]
+
+    @property
+    def user_ids(self) -> List[int]:
+        return [user["id"] for user in self.users]
+
+    @property
+    def leave_request_ids(self) -> List[int]:
+        return [request["id"] for request in self.leave_requests]
+
+
+class DataSeeder:
+    """Creates employees, linked system users and leave requests in parallel"""
+
+    def __init__(self, api: Optional[SyncAPIBridge] = None, tag: Optional[str] = None):
+        """
+        Args:
+            api: Logged-in client; a new one logged in as Admin if omitted
+            tag: Username prefix and employee middle name; this process's data_tag() by default
+        """
+        self.tag = tag or data_tag()
+        self._owns_api = api is None
+        self.api = api or SyncAPIBridge(max_per_host=SEED_CONCURRENCY)
+        if self._owns_api:
+            admin = TestUsers.ADMIN
+            if not self.api.login(admin["username"], admin["password"]):
+                raise SeedingError("Admin login failed, cannot seed test data")
+
+    def seed(self, employees: int, users: int = 0, leave_requests: int = 0,
+             extra_employees: Sequence[Dict[str, str]] = ()) -> SeededData:
+        """
+        Create a data set
+
+        Users and leave requests are spread over the created employees. Created
+        records are also tracked by the data registry, which deletes them at the
+        end of the session.
+
+        Args:
+            employees: Number of generated employees
+            users: Number of system users linked to them
+            leave_requests: Number of leave requests for them
+            extra_employees: Additional fixed employee payloads (firstName, lastName, ...)
+
+        Returns:
+            SeededData with the created records
+
+        Raises:
+            SeedingError: A record could not be created
+        """
+        data = SeededData(tag=self.tag)
+        payloads = [self._employee_payload(employee) for employee in self._generated("employees", employees)]
+        payloads += [self._employee_payload(employee) for employee in extra_employees]
+        try:
+            data.employees = self._create("employees", APIEndpoints.EMPLOYEES, payloads)
+            if data.employees:
+                self._seed_dependents(data, users, leave_requests)
+        except Exception as e:
+            # Do not leave half a data set behind
+            if not data.employees and isinstance(e, SeedingError):
+                data.employees = e.created
+            self.delete(data)
+            raise
+
+        logger.info(f"Seeded {self.tag}: {len(data.employees)} employees, {len(data.users)} users, "
+                    f"{len(data.leave_requests)} leave requests")
+        return data
+
+    def _seed_dependents(self, data: SeededData, users: int, leave_requests: int):
+        """Create users and leave requests for the seeded employees"""
+        user_payloads = []
+        for index, generated in enumerate(self._generated("users", users)):
+            username = f"{self.tag}_{generated['username'][:16]}{index}"
+            data.passwords[username] = generated["password"]
+            user_payloads.append({
+                "username": username,
+                "password": generated["password"],
+                "status": generated["status"] == "Enabled",
+                "userRoleId": USER_ROLE_IDS[generated["userRole"]],
+                "empNumber": data.employee_numbers[index % len(data.employees)],
+            })
+        data.users = self._create("users", APIEndpoints.USERS, user_payloads)
+
+        if leave_requests:
+            leave_types = self.api.get(f"{APIEndpoints.BASE}/leave/leave-types").json()["data"]
+            if not leave_types:
+                raise SeedingError("No leave types are defined, cannot seed leave requests")
+            payloads = [
+                self._leave_payload(index, generated, leave_types, data.employee_numbers[index % len(data.employees)])
+                for index, generated in enumerate(self._generated("leave_requests", leave_requests))
+            ]
+            # Assigned leave is booked against entitlements, so grant them first
+            self._create("leave_entitlements", APIEndpoints.LEAVE_ENTITLEMENTS, self._entitlement_payloads(payloads))
+            data.leave_requests = self._create("leave_requests", APIEndpoints.LEAVE_ASSIGN, payloads)
+
+    def delete(self, data: SeededData):
+        """Delete seeded records; deleting the employees also removes their users and leave"""
+        if data.employees:
+            self.api.delete(APIEndpoints.EMPLOYEES, json={"ids": data.employee_numbers})
+            logger.info(f"Deleted {len(data.employees)} seeded employees of {data.tag}")
+
+    def close(self):
+        """Close the client if the seeder created it"""
+        if self._owns_api:
+            self.api.close()
+
+    def _create(self, kind: str, endpoint: str, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """POST all payloads concurrently and return the created records in order"""
+        if not payloads:
+            return []
+        responses = self.api.gather([("POST", endpoint, {"json": payload}) for payload in payloads],
+                                    return_exceptions=True)
+
+        created, failures = [], []
+        for payload, response in zip(payloads, responses):
+            if isinstance(response, APIResponse) and response.status_code == 200:
+                created.append(response.json()["data"])
+            else:
+                failures.append(self._describe_failure(response))
+        run_stats.incr("data_seeding", kind, len(created))
+
+        if failures:
+            raise SeedingError(f"{len(failures)} of {len(payloads)} {kind} not created: {failures[:3]}", created)
+        return created
+
+    @staticmethod
+    def _generated(kind: str, count: int) -> List[Dict[str, Any]]:
+        """Generated records from this worker's data pool, or generated now without a pool"""
+        if not count:
+            return []
+        pool = worker_pool()
+        if pool is not None:
+            return getattr(pool, kind).take(count)
+        from utilities.generate_data import default_generator
+        return getattr(default_generator(), kind)(count)
+
+    def _employee_payload(self, generated: Dict[str, str]) -> Dict[str, Any]:
+        return {
+            "firstName": generated["firstName"],
+            # Marks the employee as test data of this run (see data_registry)
+            "middleName": self.tag,
+            "lastName": generated["lastName"],
+            "empPicture": None,
+        }
+
+    @staticmethod
+    def _leave_payload(index: int, generated: Dict[str, str], leave_types: List[Dict[str, Any]],
+                       emp_number: int) -> Dict[str, Any]:
+        """Payload of POST /leave/employees/leave-requests (leave assigned by an admin)"""
+        by_name = {leave_type["name"]: leave_type["id"] for leave_type in leave_types}
+        # Generated names (e.g. "Sick Leave") are used when the instance defines them
+        leave_type_id = by_name.get(generated["leaveType"], leave_types[index % len(leave_types)]["id"])
+        from_date, to_date = date.fromisoformat(generated["fromDate"]), date.fromisoformat(generated["toDate"])
+        # Stay within the leave period (calendar year) of the first day
+        to_date = min(to_date, date(from_date.year, 12, 31))
+        payload = {
+            "empNumber": emp_number,
+            "leaveTypeId": leave_type_id,
+            "fromDate": from_date.isoformat(),
+            "toDate": to_date.isoformat(),
+            "comment": generated["comment"],
+        }
+        if from_date == to_date:
+            payload["duration"] = {"type": "half_day_morning" if generated["duration"] == "Half Day" else "full_day"}
+        else:
+            payload["partialOption"] = ""
+        return payload
+
+    @staticmethod
+    def _entitlement_payloads(leave_payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """One entitlement per employee, leave type and year, covering the days of its leave requests"""
+        days: Dict[tuple, int] = {}
+        for payload in leave_payloads:
+            from_date, to_date = date.fromisoformat(payload["fromDate"]), date.fromisoformat(payload["toDate"])
+            key = (payload["empNumber"], payload["leaveTypeId"], from_date.year)
+            days[key] = days.get(key, 0) + (to_date - from_date).days + 1
+        return [{
+            "empNumber": emp_number,
+            "leaveTypeId": leave_type_id,
+            "fromDate": date(year, 1, 1).isoformat(),
+            "toDate": date(year, 12, 31).isoformat(),
+            "entitlement": str(count),
+        } for (emp_number, leave_type_id, year), count in days.items()]
+
+    @staticmethod
+    def _describe_failure(response: Any) -> str:
+        if isinstance(response, APIResponse):
+            return f"{response.status_code} {response.text[:200]}"
+        return repr(response)
@@ -0,0 +1,121 @@
+"""
+Duration-aware test distribution for pytest-xdist
+
+Keeps a history of per-test durations and hands work to xdist workers longest
+first (LPT), so the slow UI classes are spread over the workers instead of
+piling up on one while the API tests finish in seconds.
+"""
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable
+from xdist.scheduler import LoadScopeScheduling
+from config.settings import DURATIONS_FILE
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DurationHistory:
+    """Per-test durations in seconds, smoothed over runs"""
+
+    # Weight of the latest run in the moving average
+    SMOOTHING = 0.5
+    # Estimate for tests without history when nothing is known yet
+    DEFAULT_DURATION = 1.0
+
+    def __init__(self, path: Path = DURATIONS_FILE):
+        self.path = Path(path)
+        self.durations: Dict[str, float] = {}
+        self._current: Dict[str, float] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.durations = json.load(f)
+            except ValueError:
+                logger.warning(f"Ignoring unreadable duration history: {self.path}")
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration of a test; unknown tests get the median"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return self._median()
+
+    def add(self, nodeid: str, seconds: float):
+        """Add the duration of one phase (setup/call/teardown) of the current run"""
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        """Merge the current run into the history and write it"""
+        if not self._current:
+            return
+        for nodeid, seconds in self._current.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = seconds if previous is None else (
+                self.SMOOTHING * seconds + (1 - self.SMOOTHING) * previous)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.durations.items())), f, indent=1)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved durations of {len(self._current)} tests to {self.path}")
+
+    def _median(self) -> float:
+        if not self.durations:
+            return self.DEFAULT_DURATION
+        values = sorted(self.durations.values())
+        return values[len(values) // 2]
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    Longest-processing-time-first scheduling over class/module work units
+
+    A class (or module of plain functions) stays on one worker so its
+    class-scoped fixtures are set up once, unless its estimated duration
+    exceeds an even share of the run; then its tests are distributed
+    individually.
+    """
+
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+        self._split_scopes = None
+        self._ordered = False
+
+    def _split_scope(self, nodeid: str) -> str:
+        if self._split_scopes is None:
+            self._split_scopes = self._scopes_to_split(self.collection)
+        scope = nodeid.rsplit("::", 1)[0]
+        return nodeid if scope in self._split_scopes else scope
+
+    def _assign_work_unit(self, node) -> None:
+        # The first assignment sees the complete work queue: order it longest first
+        if not self._ordered:
+            units = sorted(self.workqueue.items(), key=lambda item: self._unit_duration(item[1]),
+                           reverse=True)
+            self.workqueue.clear()
+            self.workqueue.update(units)
+            self._ordered = True
+            self.log(f"LPT order, estimated makespan >= {self._lower_bound():.1f}s")
+        super()._assign_work_unit(node)
+
+    def _scopes_to_split(self, nodeids: Iterable[str]) -> set:
+        """Scopes whose total duration is larger than an even share of the run"""
+        totals: Dict[str, float] = {}
+        for nodeid in nodeids:
+            scope = nodeid.rsplit("::", 1)[0]
+            totals[scope] = totals.get(scope, 0.0) + self.history.estimate(nodeid)
+        share = sum(totals.values()) / max(len(self.nodes), 1)
+        return {scope for scope, total in totals.items() if total > share}
+
+    def _unit_duration(self, work_unit: Dict[str, bool]) -> float:
+        return sum(self.history.estimate(nodeid) for nodeid in work_unit)
+
+    def _lower_bound(self) -> float:
+        """Makespan lower bound: total work over workers, or the longest unit"""
+        durations = [self._unit_duration(unit) for unit in self.workqueue.values()]
+        if not durations:
+            return 0.0
+        return max(sum(durations) / max(len(self.nodes), 1), max(durations))
@@ -1,9 +1,18 @@
 """
 Test data generator using Faker
+
+The per-record generators below call Faker for every field and suit a handful
+of records. BatchDataGenerator produces large, collision-free data sets for
+seeding and load runs.
 """
 from faker import Faker
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
 import random
+import re
+import threading
+from config.settings import DATA_POOL_SIZE, DATA_SEED
+from utilities.helpers import get_worker_index
 
 fake = Faker()
 
@@ -18,7 +27,7 @@ class EmployeeDataGenerator:
             "firstName": fake.first_name(),
             "middleName": fake.first_name(),
             "lastName": fake.last_name(),
-            "employeeId": f"EMP{random.randint(1000, 9999)}",
+            "employeeId": BatchDataGenerator.next_employee_id(),
             "email": fake.email(),
             "phone": fake.phone_number()[:15],
             "dateOfBirth": fake.date_of_birth(minimum_age=18, maximum_age=65).strftime("%Y-%m-%d"),
@@ -30,7 +39,7 @@ class EmployeeDataGenerator:
     @staticmethod
     def generate_multiple_employees(count: int = 5):
         """Generate multiple employees"""
-        return [EmployeeDataGenerator.generate_employee() for _ in range(count)]
+        return default_generator().employees(count)
 
 
 class UserDataGenerator:
@@ -74,6 +83,224 @@ class LeaveDataGenerator:
         }
 
 
+class BatchDataGenerator:
+    """
+    Generate large data sets quickly, with unique ids across xdist workers
+
+    Faker fills pools of names, phone numbers, passwords and sentences once;
+    records are then assembled from chunk-wise random.choices over the pools.
+    employeeId, username and email end in a sequence number from the worker's
+    own id space (worker slot + 7 digits), so they never collide within a run.
+    With a seed, a fresh process repeats its data for the same worker slot;
+    other slots draw different records from the same pools.
+    """
+
+    # Sequence numbers per worker, and records drawn from the pools at a time
+    ID_SPACE = 10 ** 7
+    CHUNK_SIZE = 1000
+    # Slot of the shared data pool (utilities/data_pool.py); xdist workers use 0..998
+    POOL_SLOT = 999
+
+    # Next sequence number, shared by all generators of the process
+    _sequence = 0
+    _sequence_lock = threading.Lock()
+
+    def __init__(self, seed: Optional[int] = DATA_SEED, worker: Optional[int] = None,
+                 pool_size: int = DATA_POOL_SIZE):
+        """
+        Args:
+            seed: Seed for reproducible data; random when None
+            worker: Id space to draw from; the xdist worker number by default
+            pool_size: Values generated per pool
+
+        Raises:
+            ValueError: The slot is out of range, or an xdist worker would use POOL_SLOT
+        """
+        self.worker = self._slot(worker)
+        self.seed = seed
+        # Workers sharing a seed still make different choices
+        self._rng = random.Random(None if seed is None else f"{seed}-{self.worker}")
+
+        faker = Faker()
+        if seed is not None:
+            faker.seed_instance(seed)
+        # (display name, lowercase ascii slug for usernames and emails)
+        self._first_names = self._name_pool(faker.first_name, pool_size)
+        self._last_names = self._name_pool(faker.last_name, pool_size)
+        self._domains = sorted({faker.free_email_domain() for _ in range(20)})
+        self._phones = [faker.phone_number()[:15] for _ in range(pool_size)]
+        self._passwords = [faker.password(length=12) for _ in range(pool_size)]
+        self._sentences = [faker.sentence() for _ in range(pool_size)]
+
+        today = date.today()
+        oldest, youngest = _years_before(today, 65), _years_before(today, 18)
+        self._birth_dates = [(oldest + timedelta(days=day)).strftime("%Y-%m-%d")
+                             for day in range((youngest - oldest).days + 1)]
+        # Leave starts 1-30 days ahead and lasts 1-10 days
+        self._leave_dates = [(today + timedelta(days=day)).strftime("%Y-%m-%d") for day in range(41)]
+
+    @staticmethod
+    def _name_pool(generate, size: int) -> List[tuple]:
+        names = {generate() for _ in range(size)}
+        return sorted((name, re.sub(r"[^a-z]", "", name.lower())[:12] or "user") for name in names)
+
+    @classmethod
+    def _reserve(cls, count: int) -> int:
+        """Reserve count sequence numbers and return the first"""
+        with cls._sequence_lock:
+            start = cls._sequence
+            if start + count > cls.ID_SPACE:
+                raise ValueError(f"Id space of {cls.ID_SPACE} records per worker exhausted")
+            cls._sequence += count
+        return start
+
+    @classmethod
+    def next_employee_id(cls, worker: Optional[int] = None) -> str:
+        """A single unique employeeId (10 characters, the OrangeHRM maximum)"""
+        return f"{cls._slot(worker):03d}{cls._reserve(1):07d}"
+
+    @classmethod
+    def _slot(cls, worker: Optional[int]) -> int:
+        """Id space of an explicit slot, or of this xdist worker"""
+        if worker is None:
+            worker = get_worker_index()
+            if worker >= cls.POOL_SLOT:
+                raise ValueError(f"xdist worker {worker} would use the data pool's id space, "
+                                 f"at most {cls.POOL_SLOT} workers are supported")
+        if not 0 <= worker < 1000:
+            raise ValueError(f"Worker slot must be in 0..999, got {worker}")
+        return worker
+
+    def _chunks(self, count: Optional[int]) -> Iterator[tuple]:
+        """(first sequence number, size) of consecutive chunks; endless when count is None"""
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = self.CHUNK_SIZE if remaining is None else min(self.CHUNK_SIZE, remaining)
+            yield self._reserve(size), size
+            if remaining is not None:
+                remaining -= size
+
+    def iter_employees(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream employee records (same fields as EmployeeDataGenerator.generate_employee)
+
+        Args:
+            count: Number of records; unbounded when None
+
+        Yields:
+            Employee data with unique employeeId and email
+        """
+        rng = self._rng
+        for start, size in self._chunks(count):
+            firsts = rng.choices(self._first_names, k=size)
+            middles = rng.choices(self._first_names, k=size)
+            lasts = rng.choices(self._last_names, k=size)
+            domains = rng.choices(self._domains, k=size)
+            phones = rng.choices(self._phones, k=size)
+            births = rng.choices(self._birth_dates, k=size)
+            nationalities = rng.choices(["Egyptian", "American", "British", "Canadian"], k=size)
+            marital = rng.choices(["Single", "Married", "Divorced"], k=size)
+            genders = rng.choices(["Male", "Female"], k=size)
+            for i in range(size):
+                uid = f"{self.worker:03d}{start + i:07d}"
+                first, last = firsts[i], lasts[i]
+                yield {
+                    "firstName": first[0],
+                    "middleName": middles[i][0],
+                    "lastName": last[0],
+                    "employeeId": uid,
+                    "email": f"{first[1]}.{last[1]}.{uid}@{domains[i]}",
+                    "phone": phones[i],
+                    "dateOfBirth": births[i],
+                    "nationality": nationalities[i],
+                    "maritalStatus": marital[i],
+                    "gender": genders[i],
+                }
+
+    def iter_users(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream user records (same fields as UserDataGenerator.generate_user)
+
+        Args:
+            count: Number of records; unbounded when None
+
+        Yields:
+            User data with a unique username of at most 36 characters
+        """
+        rng = self._rng
+        for start, size in self._chunks(count):
+            firsts = rng.choices(self._first_names, k=size)
+            lasts = rng.choices(self._last_names, k=size)
+            passwords = rng.choices(self._passwords, k=size)
+            roles = rng.choices(["Admin", "ESS"], k=size)
+            statuses = rng.choices(["Enabled", "Disabled"], k=size)
+            for i in range(size):
+                first, last = firsts[i], lasts[i]
+                yield {
+                    "username": f"{first[1]}.{last[1]}.{self.worker:03d}{start + i:07d}",
+                    "password": passwords[i],
+                    "employeeName": f"{first[0]} {last[0]}",
+                    "userRole": roles[i],
+                    "status": statuses[i],
+                }
+
+    def iter_leave_requests(self, count: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream leave requests (same fields as LeaveDataGenerator.generate_leave_request)
+
+        Args:
+            count: Number of records; unbounded when None
+        """
+        rng = self._rng
+        for _, size in self._chunks(count):
+            starts = rng.choices(range(1, 31), k=size)
+            lengths = rng.choices(range(1, 11), k=size)
+            leave_types = rng.choices(["Casual Leave", "Sick Leave", "Annual Leave"], k=size)
+            comments = rng.choices(self._sentences, k=size)
+            durations = rng.choices(["Full Day", "Half Day"], k=size)
+            for i in range(size):
+                yield {
+                    "leaveType": leave_types[i],
+                    "fromDate": self._leave_dates[starts[i]],
+                    "toDate": self._leave_dates[starts[i] + lengths[i]],
+                    "comment": comments[i],
+                    "duration": durations[i],
+                }
+
+    def employees(self, count: int) -> List[Dict[str, Any]]:
+        """Generate count employee records"""
+        return list(self.iter_employees(count))
+
+    def users(self, count: int) -> List[Dict[str, Any]]:
+        """Generate count user records"""
+        return list(self.iter_users(count))
+
+    def leave_requests(self, count: int) -> List[Dict[str, Any]]:
+        """Generate count leave requests"""
+        return list(self.iter_leave_requests(count))
+
+
+def _years_before(day: date, years: int) -> date:
+    """Same day and month years earlier; 29 February becomes the 28th in common years"""
+    try:
+        return day.replace(year=day.year - years)
+    except ValueError:
+        return day.replace(year=day.year - years, day=28)
+
+
+_default_generator: Optional[BatchDataGenerator] = None
+_default_generator_lock = threading.Lock()
+
+
+def default_generator() -> BatchDataGenerator:
+    """Process-wide batch generator (pools are built on first use)"""
+    global _default_generator
+    with _default_generator_lock:
+        if _default_generator is None:
+            _default_generator = BatchDataGenerator()
+        return _default_generator
+
+
 # Test the generators
 if __name__ == "__main__":
     print("Employee Data:")
@@ -1,14 +1,18 @@
 """
 Helper utilities for common operations
 """
+from __future__ import annotations
+import os
 import time
 import random
 import string
 from datetime import datetime, timedelta
-from typing import Optional
-from playwright.sync_api import Page, expect
+from typing import TYPE_CHECKING, Optional
 from utilities.logger import get_logger
 
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
 logger = get_logger(__name__)
 
 
@@ -24,7 +28,7 @@ def wait_for_element(page: Page, selector: str, timeout: int = 10000, state: str
     """
     try:
         page.wait_for_selector(selector, timeout=timeout, state=state)
-        logger.debug(f"Element found: {selector}")
+        logger.debug("Element found: %s", selector)
         return True
     except Exception as e:
         logger.error(f"Element not found: {selector} - {e}")
@@ -44,7 +48,7 @@ def safe_click(page: Page, selector: str, timeout: int = 5000):
         element = page.locator(selector)
         element.wait_for(timeout=timeout, state="visible")
         element.click()
-        logger.debug(f"Clicked: {selector}")
+        logger.debug("Clicked: %s", selector)
         return True
     except Exception as e:
         logger.error(f"Failed to click: {selector} - {e}")
@@ -66,7 +70,7 @@ def safe_fill(page: Page, selector: str, text: str, timeout: int = 5000):
         element.wait_for(timeout=timeout, state="visible")
         element.clear()
         element.fill(text)
-        logger.debug(f"Filled '{selector}' with: {text}")
+        logger.debug("Filled '%s' with: %s", selector, text)
         return True
     except Exception as e:
         logger.error(f"Failed to fill: {selector} - {e}")
@@ -89,7 +93,7 @@ def get_text(page: Page, selector: str, timeout: int = 5000) -> Optional[str]:
         element = page.locator(selector)
         element.wait_for(timeout=timeout, state="visible")
         text = element.inner_text()
-        logger.debug(f"Got text from '{selector}': {text}")
+        logger.debug("Got text from '%s': %s", selector, text)
         return text
     except Exception as e:
         logger.error(f"Failed to get text from: {selector} - {e}")
@@ -127,7 +131,7 @@ def scroll_to_element(page: Page, selector: str):
     try:
         element = page.locator(selector)
         element.scroll_into_view_if_needed()
-        logger.debug(f"Scrolled to: {selector}")
+        logger.debug("Scrolled to: %s", selector)
     except Exception as e:
         logger.error(f"Failed to scroll to: {selector} - {e}")
 
@@ -163,6 +167,22 @@ def generate_random_email() -> str:
     return f"test_{generate_random_string(8)}@example.com"
 
 
+def get_worker_id() -> str:
+    """Return the xdist worker id, or 'master' when not running distributed"""
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def get_worker_index() -> int:
+    """Return the xdist worker number (gw3 -> 3), or 0 when not running distributed"""
+    digits = "".join(filter(str.isdigit, os.getenv("PYTEST_XDIST_WORKER", "")))
+    return int(digits) if digits else 0
+
+
+def get_worker_count() -> int:
+    """Return the number of xdist workers, or 1 when not running distributed"""
+    return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
 def get_current_timestamp() -> str:
     """Get current timestamp as string"""
     return datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -170,7 +190,7 @@ def get_current_timestamp() -> str:
 
 def wait(seconds: int):
     """Wait for specified seconds"""
-    logger.debug(f"Waiting for {seconds} seconds")
+    logger.debug("Waiting for %s seconds", seconds)
     time.sleep(seconds)
 
 
@@ -183,5 +203,6 @@ def assert_url_contains(page: Page, expected: str):
 
 def assert_text_visible(page: Page, text: str):
     """Assert text is visible on page"""
+    from playwright.sync_api import expect
     expect(page.locator(f"text={text}")).to_be_visible()
     logger.info(f"Text assertion passed: '{text}' is visible")
\ No newline at end of file
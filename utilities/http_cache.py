@@ -0,0 +1,169 @@
+"""
+HTTP response cache for APIClient GET requests (opt-in)
+
+Responses are kept per method, URL, query parameters and auth identity for
+API_CACHE_TTL seconds, in an LRU of API_CACHE_MAX_ENTRIES entries. A stale
+entry with an ETag or Last-Modified is revalidated with a conditional request
+and reused on 304. Concurrent identical requests are coalesced: one thread
+fetches, the others wait for its response.
+
+The cache is meant for reference data that tests read over and over (roles,
+employee lists, dashboard widgets); it deliberately ignores Cache-Control
+no-store, which OrangeHRM sends on every API response.
+"""
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Optional, Tuple
+from config.settings import API_CACHE_MAX_ENTRIES, API_CACHE_TTL
+from utilities import run_stats
+from utilities.logger import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger(__name__)
+
+# Sends the request with the given extra (conditional) headers
+Fetch = Callable[[Dict[str, str]], "requests.Response"]
+
+
+class _Entry:
+    """A cached response and its validators"""
+
+    def __init__(self, url: str, response: requests.Response):
+        self.url = url
+        self.response = response
+        self.etag = response.headers.get("ETag")
+        self.last_modified = response.headers.get("Last-Modified")
+        self.stored_at = time.monotonic()
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """Thread-safe LRU cache of successful GET responses with single-flight fetching"""
+
+    def __init__(self, max_entries: int = API_CACHE_MAX_ENTRIES, ttl: float = API_CACHE_TTL):
+        """
+        Args:
+            max_entries: Responses kept before the least recently used is evicted
+            ttl: Seconds a response is served without asking the server
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Dict], identity: str) -> Tuple:
+        """Cache key of a request; list-valued params (?a=1&a=2) keep their order"""
+        items = ((name, tuple(value) if isinstance(value, (list, tuple)) else value)
+                 for name, value in (params or {}).items())
+        return method.upper(), url, tuple(sorted(items)), identity
+
+    def fetch(self, key: Tuple, fetch: Fetch) -> requests.Response:
+        """
+        Return the cached response for key, or fetch it (once for all concurrent callers)
+
+        Args:
+            key: Key from HTTPCache.key
+            fetch: Sends the request with the given conditional headers
+
+        Returns:
+            Cached, revalidated or freshly fetched response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry.stored_at < self.ttl:
+                self._entries.move_to_end(key)
+                run_stats.incr("http_cache", "hits")
+                return entry.response
+
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = Future()
+
+        if not leader:
+            run_stats.incr("http_cache", "coalesced")
+            return flight.result()
+
+        try:
+            response = self._refresh(key, entry, fetch)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def invalidate(self, url_prefix: str) -> int:
+        """
+        Drop every entry whose URL starts with url_prefix (e.g. after a write)
+
+        Returns:
+            Number of dropped entries
+        """
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if entry.url.startswith(url_prefix)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _refresh(self, key: Tuple, entry: Optional[_Entry], fetch: Fetch) -> requests.Response:
+        """Revalidate a stale entry or fetch the response, and store it"""
+        response = fetch(entry.validators() if entry else {})
+
+        if response.status_code == 304 and entry is not None:
+            run_stats.incr("http_cache", "revalidated")
+            with self._lock:
+                entry.stored_at = time.monotonic()
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return entry.response
+
+        run_stats.incr("http_cache", "misses")
+        if response.status_code == 200:
+            with self._lock:
+                self._entries[key] = _Entry(key[1], response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    run_stats.incr("http_cache", "evictions")
+        return response
+
+
+_default_cache: Optional[HTTPCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache() -> HTTPCache:
+    """Process-wide cache shared by API clients created with API_CACHE=true"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = HTTPCache()
+            logger.info(f"API response cache enabled (ttl {_default_cache.ttl:g}s, "
+                        f"{_default_cache.max_entries} entries)")
+        return _default_cache
@@ -0,0 +1,419 @@
+"""
+Browser load runner: virtual users driving the page objects
+
+Each virtual user is a browser context that loops through a journey built
+from LoginPage, DashboardPage and AdminPage (login -> dashboard -> admin
+search -> logout), with a think time between steps. The runner starts
+--processes processes with --browsers browsers each and --contexts users per
+browser, starts the users evenly over --ramp-up seconds and reports
+throughput and latency percentiles per journey step:
+
+    python -m utilities.load_runner --standin --processes 2 --browsers 2 --contexts 5 --duration 60
+    python -m utilities.load_runner --processes 4 --ramp-up 60 --duration 300 --json reports/load.json
+
+The sync Playwright API runs one call at a time per thread, so the users of
+one browser take turns: whichever user's next step is due runs while the
+others think. Steps of different browsers and processes run in parallel.
+Keep the think time well above the step latency, or add browsers instead of
+contexts, so users are not delayed by their neighbours.
+
+--standin serves a local stand-in (see utilities.standin_server) and points
+the browser processes at it.
+"""
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# config.settings fixes BASE_URL on import, so the framework is imported only
+# after --standin has been applied to the environment (see main())
+
+# Seconds the browser processes get to launch and reach the start barrier
+STARTUP_TIMEOUT = 120
+
+
+@dataclass
+class LoadProfile:
+    """Shape of a load run"""
+    processes: int = 1
+    browsers: int = 1
+    contexts: int = 5
+    ramp_up: float = 10.0
+    duration: float = 60.0
+    # Journeys per user; 0 runs until the duration is over
+    iterations: int = 0
+    think_time: float = 1.0
+    seed: int = 0
+
+    @property
+    def users(self) -> int:
+        return self.processes * self.browsers * self.contexts
+
+
+class StepResult(NamedTuple):
+    """Outcome of one journey step of one user"""
+    step: str
+    # Seconds since the start of the run
+    started: float
+    elapsed_ms: float
+    ok: bool
+    error: str = ""
+
+
+class Session(NamedTuple):
+    """Page objects of one virtual user"""
+    login: Any
+    dashboard: Any
+    admin: Any
+
+
+class Step(NamedTuple):
+    """Named journey step"""
+    name: str
+    run: Callable[[Session], None]
+
+
+def _login(session: Session):
+    from config.settings import TestUsers
+    session.login.navigate()
+    session.login.login(TestUsers.ADMIN["username"], TestUsers.ADMIN["password"])
+    session.login.wait_for_url("**/dashboard/index")
+
+
+def _dashboard(session: Session):
+    session.dashboard.navigate()
+
+
+def _admin_search(session: Session):
+    from config.settings import TestUsers
+    session.dashboard.navigate_to_admin()
+    session.admin.search_by_username(TestUsers.ADMIN["username"])
+
+
+def _logout(session: Session):
+    session.dashboard.logout()
+
+
+# login -> dashboard -> admin search -> logout
+DEFAULT_JOURNEY: Tuple[Step, ...] = (
+    Step("login", _login),
+    Step("dashboard", _dashboard),
+    Step("admin_search", _admin_search),
+    Step("logout", _logout),
+)
+
+
+def _describe(error: Exception) -> str:
+    """Exception type and the first line of its message (Playwright errors span many lines)"""
+    message = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {message[0][:200]}" if message else type(error).__name__
+
+
+def _new_session(page) -> Session:
+    from tests.ui.pages.admin_page import AdminPage
+    from tests.ui.pages.dashboard_page import DashboardPage
+    from tests.ui.pages.login_page import LoginPage
+    return Session(login=LoginPage(page), dashboard=DashboardPage(page), admin=AdminPage(page))
+
+
+class VirtualUser:
+    """One browser context looping through the journey"""
+
+    def __init__(self, index: int, context, journey: Sequence[Step], rng: random.Random):
+        self.index = index
+        self.context = context
+        self.session = _new_session(context.new_page())
+        self.journey = journey
+        self.rng = rng
+        self.position = 0
+        self.iterations = 0
+
+    def think_time(self, mean: float) -> float:
+        """Think time with +/-50% jitter, so users do not move in lockstep"""
+        return mean * self.rng.uniform(0.5, 1.5)
+
+    def run_step(self, run_start: float) -> StepResult:
+        """Run the next step; a failed step restarts the journey with a new session"""
+        step = self.journey[self.position]
+        started = time.perf_counter()
+        try:
+            step.run(self.session)
+        except Exception as e:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.context.clear_cookies()
+            self.position = 0
+            self.iterations += 1
+            return StepResult(step.name, started - run_start, elapsed_ms, False, _describe(e))
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.position += 1
+        if self.position == len(self.journey):
+            self.position = 0
+            self.iterations += 1
+        return StepResult(step.name, started - run_start, elapsed_ms, True)
+
+
+def _user_offsets(profile: LoadProfile, process: int, browser: int) -> List[Tuple[int, float]]:
+    """(global user index, start offset in seconds) of the users of one browser"""
+    browsers_total = profile.processes * profile.browsers
+    slot = process * profile.browsers + browser
+    offsets = []
+    for context in range(profile.contexts):
+        # Interleaved, so the first users are spread over all browsers
+        index = context * browsers_total + slot
+        offsets.append((index, profile.ramp_up * index / profile.users))
+    return offsets
+
+
+def _run_browser(profile: LoadProfile, process: int, browser_index: int, barrier, results: "queue.Queue",
+                 journey: Sequence[Step] = DEFAULT_JOURNEY):
+    """Launch one browser, wait for the start barrier and schedule its users until the run ends"""
+    from playwright.sync_api import sync_playwright
+    from config.settings import BROWSER, HEADLESS, TIMEOUT, VIEWPORT_HEIGHT, VIEWPORT_WIDTH
+
+    samples: List[StepResult] = []
+    try:
+        with sync_playwright() as playwright:
+            browser = getattr(playwright, BROWSER).launch(headless=HEADLESS)
+            users = []
+            for index, offset in _user_offsets(profile, process, browser_index):
+                context = browser.new_context(viewport={"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT})
+                context.set_default_timeout(TIMEOUT)
+                users.append((offset, VirtualUser(index, context, journey, random.Random(profile.seed + index))))
+
+            barrier.wait(timeout=STARTUP_TIMEOUT)
+            run_start = time.perf_counter()
+            deadline = run_start + profile.duration
+            # (due time, user index, user): the user whose next step is due first runs next
+            due = [(run_start + offset, user.index, user) for offset, user in users]
+            heapq.heapify(due)
+            while due:
+                at, index, user = heapq.heappop(due)
+                if at >= deadline:
+                    continue
+                time.sleep(max(0.0, at - time.perf_counter()))
+                samples.append(user.run_step(run_start))
+                if profile.iterations and user.iterations >= profile.iterations:
+                    continue
+                heapq.heappush(due, (time.perf_counter() + user.think_time(profile.think_time), index, user))
+            browser.close()
+    except Exception as e:
+        barrier.abort()
+        results.put(("error", f"process {process} browser {browser_index}: {_describe(e)}"))
+        return
+    results.put(("samples", [tuple(sample) for sample in samples]))
+
+
+def _run_process(profile: LoadProfile, process: int, barrier, results):
+    """Browser process: one thread per browser, each with its own Playwright instance"""
+    threads = [threading.Thread(target=_run_browser, args=(profile, process, browser, barrier, results),
+                                name=f"browser-{process}-{browser}")
+               for browser in range(profile.browsers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run(profile: LoadProfile) -> Tuple[List[StepResult], float]:
+    """
+    Run the load profile in browser processes
+
+    Args:
+        profile: Users, ramp-up and duration of the run
+
+    Returns:
+        All step results and the wall time of the run in seconds
+
+    Raises:
+        RuntimeError: A browser could not be launched or a process did not report
+    """
+    # Spawned processes import settings afresh, with the environment of main()
+    ctx = multiprocessing.get_context("spawn")
+    barrier = ctx.Barrier(profile.processes * profile.browsers + 1)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=_run_process, args=(profile, process, barrier, results),
+                             name=f"load-{process}", daemon=True)
+                 for process in range(profile.processes)]
+    for process in processes:
+        process.start()
+
+    samples: List[StepResult] = []
+    errors: List[str] = []
+    try:
+        barrier.wait(timeout=STARTUP_TIMEOUT)
+    except threading.BrokenBarrierError:
+        errors.append("browsers did not start")
+    started = time.perf_counter()
+
+    reports = profile.processes * profile.browsers
+    timeout = STARTUP_TIMEOUT + profile.duration + 60
+    for _ in range(reports):
+        try:
+            kind, payload = results.get(timeout=timeout)
+        except queue.Empty:
+            errors.append("a browser process did not report")
+            break
+        if kind == "error":
+            errors.append(payload)
+        else:
+            samples.extend(StepResult(*sample) for sample in payload)
+    wall_s = time.perf_counter() - started
+
+    for process in processes:
+        process.join(timeout=10)
+    if errors:
+        raise RuntimeError("; ".join(dict.fromkeys(errors)))
+    return samples, wall_s
+
+
+def summarize(samples: Sequence[StepResult], wall_s: float,
+              steps: Sequence[str] = tuple(step.name for step in DEFAULT_JOURNEY)) -> Dict[str, Dict[str, float]]:
+    """
+    Throughput and latency percentiles per step
+
+    Args:
+        samples: Step results of the run
+        wall_s: Duration of the run in seconds
+        steps: Step names in journey order (others follow alphabetically)
+
+    Returns:
+        {step: {"count", "errors", "per_second", "p50", "p90", "p95", "p99", "max"}}
+    """
+    from utilities.run_stats import percentile
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    for sample in samples:
+        if sample.ok:
+            latencies[sample.step].append(sample.elapsed_ms)
+        else:
+            errors[sample.step] += 1
+
+    names = [name for name in steps if name in latencies or name in errors]
+    names += sorted((set(latencies) | set(errors)) - set(names))
+    summary = {}
+    for name in names:
+        values = latencies.get(name, [])
+        summary[name] = {
+            "count": len(values),
+            "errors": errors.get(name, 0),
+            "per_second": len(values) / wall_s if wall_s else 0.0,
+            **{f"p{q}": percentile(values, q) if values else 0.0 for q in (50, 90, 95, 99)},
+            "max": max(values) if values else 0.0,
+        }
+    return summary
+
+
+def timeline(samples: Sequence[StepResult], interval: float = 10.0) -> List[Dict[str, float]]:
+    """Completed steps, errors and p95 latency per interval since the start of the run"""
+    from utilities.run_stats import percentile
+
+    buckets: Dict[int, List[StepResult]] = defaultdict(list)
+    for sample in samples:
+        buckets[int(sample.started // interval)].append(sample)
+    rows = []
+    for bucket in sorted(buckets):
+        values = [sample.elapsed_ms for sample in buckets[bucket] if sample.ok]
+        rows.append({
+            "start_s": bucket * interval,
+            "completed": len(values),
+            "errors": len(buckets[bucket]) - len(values),
+            "p95": percentile(values, 95) if values else 0.0,
+        })
+    return rows
+
+
+def format_lines(summary: Dict[str, Dict[str, float]]) -> List[str]:
+    """One line per step: count, errors, throughput and latency percentiles in ms"""
+    lines = [f"{'step':<14} {'ok':>6} {'errors':>6} {'per s':>7} "
+             + " ".join(f"{column:>7}" for column in ("p50", "p90", "p95", "p99", "max"))]
+    for name, stats in summary.items():
+        lines.append(f"{name:<14} {stats['count']:>6} {stats['errors']:>6} {stats['per_second']:>7.2f} "
+                     + " ".join(f"{stats[column]:>7.0f}" for column in ("p50", "p90", "p95", "p99", "max")))
+    return lines
+
+
+def _error_counts(samples: Sequence[StepResult]) -> Dict[str, int]:
+    counts: Dict[str, int] = defaultdict(int)
+    for sample in samples:
+        if not sample.ok:
+            counts[f"{sample.step}: {sample.error}"] += 1
+    return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    defaults = LoadProfile()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=defaults.processes, help="Browser processes")
+    parser.add_argument("--browsers", type=int, default=defaults.browsers, help="Browsers per process")
+    parser.add_argument("--contexts", type=int, default=defaults.contexts, help="Virtual users per browser")
+    parser.add_argument("--ramp-up", type=float, default=defaults.ramp_up,
+                        help="Seconds over which the users are started")
+    parser.add_argument("--duration", type=float, default=defaults.duration, help="Seconds of the whole run")
+    parser.add_argument("--iterations", type=int, default=defaults.iterations,
+                        help="Journeys per user (0: until the duration is over)")
+    parser.add_argument("--think-time", type=float, default=defaults.think_time,
+                        help="Mean seconds between the steps of a user")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Seed of the think time jitter")
+    parser.add_argument("--standin", action="store_true", help="Run against a local stand-in server")
+    parser.add_argument("--standin-latency", type=int, default=None, help="Stand-in response delay in ms")
+    parser.add_argument("--interval", type=float, default=10.0, help="Seconds per timeline row")
+    parser.add_argument("--json", type=Path, help="Write the summary, timeline and errors to this file")
+    args = parser.parse_args(argv)
+
+    if args.standin:
+        os.environ["STANDIN"] = "true"
+    from utilities.logger import get_logger
+    logger = get_logger(__name__)
+
+    profile = LoadProfile(processes=args.processes, browsers=args.browsers, contexts=args.contexts,
+                          ramp_up=args.ramp_up, duration=args.duration, iterations=args.iterations,
+                          think_time=args.think_time, seed=args.seed)
+    server = None
+    if args.standin:
+        from config.settings import STANDIN_LATENCY_MS
+        from utilities.standin_server import StandInServer
+        latency = STANDIN_LATENCY_MS if args.standin_latency is None else args.standin_latency
+        server = StandInServer(latency_ms=latency).start()
+
+    logger.info(f"Load run: {profile.users} users ({profile.processes} processes x {profile.browsers} browsers "
+                f"x {profile.contexts} contexts), ramp-up {profile.ramp_up:g}s, duration {profile.duration:g}s")
+    try:
+        samples, wall_s = run(profile)
+    except RuntimeError as e:
+        logger.error(f"Load run failed: {e}")
+        return 1
+    finally:
+        if server is not None:
+            server.stop()
+
+    summary = summarize(samples, wall_s)
+    print(f"{profile.users} users, {len(samples)} steps in {wall_s:.1f}s")
+    for line in format_lines(summary):
+        print(line)
+    errors = _error_counts(samples)
+    for error, count in list(errors.items())[:10]:
+        print(f"  {count:>5} x {error}")
+
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"profile": asdict(profile), "wall_s": wall_s, "steps": summary,
+                       "timeline": timeline(samples, args.interval), "errors": errors}, f, indent=2)
+        print(f"Results written to {args.json}")
+    return 1 if not samples else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
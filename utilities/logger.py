@@ -1,34 +1,77 @@
 """
 Logging utility for the framework
+
+All module loggers of a process share one QueueHandler: a log call only puts
+the record on a queue, and a QueueListener thread formats it and writes it to
+the console and the log file. Under xdist each worker writes its own file in
+reports/logs/, and the controlling process merges them into test_execution.log
+at the end of the session (see merge_worker_logs).
 """
+import atexit
+import copy
+import heapq
 import logging
+import os
+import queue
+import re
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from datetime import datetime
-from config.settings import LOG_LEVEL, LOG_FILE
+from typing import Iterator, List, Optional, Tuple
+from config.settings import LOG_LEVEL, LOG_FILE, LOG_DIR
 
+# Timestamp prefix of a file log line; lines without one continue the previous record
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3} ")
 
-def get_logger(name: str) -> logging.Logger:
-    """
-    Create and configure logger
+# Renders tracebacks before records are queued
+_TRACEBACK_FORMATTER = logging.Formatter()
 
-    Args:
-        name: Logger name (usually __name__ from calling module)
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
 
-    Returns:
-        Configured logger instance
+
+class _DeferredQueueHandler(QueueHandler):
     """
-    logger = logging.getLogger(name)
+    Queue handler that leaves the line formatting to the listener thread
 
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
+    As in QueueHandler, the message is rendered in the calling thread, so
+    mutable arguments are captured at call time and no traceback frames are
+    kept alive on the queue. Unlike it, the handler's formatter is not applied
+    here: only the %-substitution and the traceback text, which the listener's
+    formatters append to the line.
+    """
 
-    logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = (self.formatter or _TRACEBACK_FORMATTER).formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates the log directory and file with the first record"""
+
+    def __init__(self, filename: Path):
+        super().__init__(filename, mode='a', encoding='utf-8', delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+def _worker_log_file(worker_id: str) -> Path:
+    return LOG_DIR / f"test_execution.{worker_id}.log"
+
+
+def _start_pipeline() -> QueueHandler:
+    """Create the process's queue handler and start its listener"""
+    global _queue_handler, _listener
 
-    # Create formatters
     detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+        '%(asctime)s.%(msecs)03d - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
 
@@ -40,18 +83,106 @@ def get_logger(name: str) -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(simple_formatter)
-    logger.addHandler(console_handler)
 
-    # File handler
-    LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(LOG_FILE, mode='a', encoding='utf-8')
+    # File handler: xdist workers write their own file, merged at session end
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER")
+    log_file = _worker_log_file(worker_id) if worker_id else LOG_FILE
+    file_handler = _LazyFileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
 
+    _queue_handler = _DeferredQueueHandler(queue.SimpleQueue())
+    _listener = QueueListener(_queue_handler.queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_stop_pipeline)
+    return _queue_handler
+
+
+def _stop_pipeline():
+    """Write out queued records and close the handlers"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Create and configure logger
+
+    Args:
+        name: Logger name (usually __name__ from calling module)
+
+    Returns:
+        Configured logger instance
+    """
+    logger = logging.getLogger(name)
+
+    # Avoid duplicate handlers
+    if logger.handlers:
+        return logger
+
+    logger.setLevel(getattr(logging, LOG_LEVEL.upper()))
+    logger.addHandler(_queue_handler or _start_pipeline())
     return logger
 
 
+def flush_logs():
+    """Block until every record logged so far has been written"""
+    if _listener is None:
+        return
+    # stop() drains the queue and joins the listener thread; start it again for later records
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+    _listener.start()
+
+
+def _read_records(path: Path, prefix: str) -> Iterator[Tuple[str, str]]:
+    """(timestamp, text) of each record in a log file, continuation lines included"""
+    record: List[str] = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if _TIMESTAMP.match(line) and record:
+                yield record[0][:23], "".join(record)
+                record = []
+            record.append(line if record else f"{line[:23]} [{prefix}]{line[23:]}")
+    if record:
+        yield record[0][:23], "".join(record)
+
+
+def merge_worker_logs(log_file: Path = LOG_FILE, log_dir: Path = LOG_DIR) -> int:
+    """
+    Append the records of all worker log files to log_file in time order
+
+    Each merged line is tagged with its worker id and the worker files are removed.
+
+    Args:
+        log_file: Combined log file
+        log_dir: Directory of the per-worker files
+
+    Returns:
+        Number of merged worker files
+    """
+    worker_files = sorted(log_dir.glob("test_execution.*.log"))
+    if not worker_files:
+        return 0
+
+    flush_logs()
+    streams = [_read_records(path, path.suffixes[0].lstrip('.')) for path in worker_files]
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, 'a', encoding='utf-8') as out:
+        for _, text in heapq.merge(*streams, key=lambda record: record[0]):
+            out.write(text)
+
+    for path in worker_files:
+        path.unlink()
+    return len(worker_files)
+
+
 def log_test_start(test_name: str):
     """Log test start"""
     logger = get_logger(__name__)
@@ -75,4 +206,4 @@ if __name__ == "__main__":
     logger.info("Info message")
     logger.warning("Warning message")
     logger.error("Error message")
-    logger.critical("Critical message")
\ No newline at end of file
+    logger.critical("Critical message")
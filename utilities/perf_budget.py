@@ -0,0 +1,93 @@
+"""
+Performance budgets for page object interactions
+
+A budget caps a percentile of the durations recorded for one interaction,
+e.g. "p75 of AdminPage.search_by_username within 800 ms over at least 3
+samples", so a single slow sample does not fail the build. Page objects
+declare budgets in BUDGETS; the "performance_budgets" section of
+config/test_data.json overrides them per label for a given deployment.
+
+A breach raises BudgetExceeded. The test report shows it as "budget", not as
+a functional failure, and --budget-breach=warn keeps it from failing the run.
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence
+from utilities import run_stats
+from utilities.logger import get_logger
+from utilities.run_stats import percentile
+
+logger = get_logger(__name__)
+
+
+class Budget(NamedTuple):
+    """Upper bound for a percentile of an interaction's durations"""
+    max_ms: float
+    percentile: float = 75
+    min_samples: int = 3
+
+
+class BudgetExceeded(AssertionError):
+    """Raised when the budgeted percentile of the samples is over the budget"""
+
+
+def distribution(samples: Sequence[float]) -> Dict[str, float]:
+    """n, min, p50, p75, p95 and max of samples in milliseconds"""
+    return {
+        "n": len(samples),
+        "min": min(samples),
+        "p50": percentile(samples, 50),
+        "p75": percentile(samples, 75),
+        "p95": percentile(samples, 95),
+        "max": max(samples),
+    }
+
+
+def format_distribution(stats: Dict[str, float]) -> str:
+    return f"n={stats['n']} " + " ".join(f"{key}={stats[key]:.0f}ms" for key in ("min", "p50", "p75", "p95", "max"))
+
+
+_configured: Optional[Dict[str, Budget]] = None
+
+
+def configured_budgets() -> Dict[str, Budget]:
+    """Budgets of the "performance_budgets" test data section, by label (read once)"""
+    global _configured
+    if _configured is None:
+        from utilities.test_data_store import TestDataError, TestDataStore
+        try:
+            section = TestDataStore().section("performance_budgets")
+        except TestDataError:
+            section = {}
+        _configured = {label: Budget(**config.model_dump()) for label, config in section.items()}
+    return _configured
+
+
+def check(label: str, samples: List[float], budget: Budget) -> Dict[str, float]:
+    """
+    Assert that the budgeted percentile of samples is within the budget
+
+    Args:
+        label: Interaction, e.g. "AdminPage.search_by_username"
+        samples: Recorded durations in milliseconds
+        budget: Budget to check against
+
+    Returns:
+        Distribution of the samples
+
+    Raises:
+        AssertionError: Fewer than budget.min_samples samples were recorded
+        BudgetExceeded: The budgeted percentile is over budget.max_ms
+    """
+    if len(samples) < budget.min_samples:
+        raise AssertionError(f"{label}: {len(samples)} samples recorded, the budget needs {budget.min_samples}")
+
+    stats = distribution(samples)
+    measured = percentile(samples, budget.percentile)
+    run_stats.incr("perf_budgets", "checked")
+    summary = (f"{label}: p{budget.percentile:g}={measured:.0f}ms, budget {budget.max_ms:.0f}ms "
+               f"({format_distribution(stats)})")
+    if measured > budget.max_ms:
+        run_stats.incr("perf_budgets", "exceeded")
+        raise BudgetExceeded(f"Performance budget exceeded: {summary}")
+
+    logger.info(f"Within performance budget: {summary}")
+    return stats
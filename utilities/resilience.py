@@ -0,0 +1,201 @@
+"""
+Retries and circuit breaking for the API clients
+
+RetryPolicy decides whether and when a failed call is repeated: idempotent
+methods only, on connection errors and 429/502/503/504, with jittered
+exponential backoff or the server's Retry-After. A CircuitBreaker per host
+fails calls fast once the backend keeps failing, instead of every test waiting
+for API_TIMEOUT, and lets one probe through after API_BREAKER_RESET_TIMEOUT.
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from config.settings import (
+    API_BREAKER_RESET_TIMEOUT, API_BREAKER_THRESHOLD, API_RETRY_BACKOFF_BASE, API_RETRY_BACKOFF_MAX,
+    API_RETRY_COUNT, API_TIMEOUT
+)
+from utilities import run_stats
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Methods that are safe to send twice
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Responses worth retrying
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+# Responses that count as the backend being down (429 only means "slow down")
+FAILURE_STATUSES = frozenset({502, 503, 504})
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value, delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent or unparsable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """When to repeat a failed API call, and how long to wait first"""
+
+    def __init__(self, retries: int = API_RETRY_COUNT, backoff_base: float = API_RETRY_BACKOFF_BASE,
+                 backoff_max: float = API_RETRY_BACKOFF_MAX, max_retry_after: float = API_TIMEOUT):
+        """
+        Args:
+            retries: Retries after the first attempt (0 disables retrying)
+            backoff_base: Backoff cap of the first retry in seconds, doubled per retry
+            backoff_max: Upper bound of the backoff cap in seconds
+            max_retry_after: Longest Retry-After honoured; longer waits are not retried
+        """
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    def retry_delay(self, method: str, attempt: int, status: Optional[int] = None,
+                    retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Delay before retrying a failed attempt
+
+        Args:
+            method: HTTP method of the call
+            attempt: Number of retries already made
+            status: Response status, or None for a connection error or timeout
+            retry_after: Parsed Retry-After header of the response
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up
+        """
+        if method.upper() not in IDEMPOTENT_METHODS or attempt >= self.retries:
+            return None
+        if status is not None and status not in RETRYABLE_STATUSES:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_retry_after else None
+        # "Full jitter": spreads the retries of parallel workers
+        return random.uniform(0, min(self.backoff_base * 2 ** attempt, self.backoff_max))
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: closed -> open after `threshold` consecutive failures,
+    half-open (one probe) after `reset_timeout`, closed again on success
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, host: str, threshold: int = API_BREAKER_THRESHOLD,
+                 reset_timeout: float = API_BREAKER_RESET_TIMEOUT):
+        """
+        Args:
+            host: Host the breaker guards (for logging)
+            threshold: Consecutive failures that open the circuit (0 disables the breaker)
+            reset_timeout: Seconds the circuit stays open before a probe is let through
+        """
+        self.host = host
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        """
+        Raise CircuitOpenError unless a request may be sent now
+
+        Raises:
+            CircuitOpenError: The circuit is open, or half-open with a probe in flight
+        """
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            if self.state == self.CLOSED:
+                return
+
+        run_stats.incr("api_resilience", "fast_failures")
+        raise CircuitOpenError(f"Circuit open for {self.host} after {self.failures} consecutive failures")
+
+    def record(self, status: Optional[int]):
+        """
+        Record the outcome of a request
+
+        Args:
+            status: Response status, or None for a connection error or timeout
+        """
+        if status is None or status in FAILURE_STATUSES:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        """Close the circuit"""
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit closed for {self.host}")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self):
+        """Count a failure and open the circuit at the threshold or on a failed probe"""
+        with self._lock:
+            self.failures += 1
+            tripped = self.threshold > 0 and (
+                self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.threshold))
+            if tripped:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+        if tripped:
+            run_stats.incr("api_resilience", "breaker_trips")
+            logger.warning(f"Circuit opened for {self.host} after {self.failures} consecutive failures, "
+                           f"failing fast for {self.reset_timeout:g}s")
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def breaker_for(url: str) -> CircuitBreaker:
+    """Shared circuit breaker of the URL's host (one per host and process)"""
+    host = urlsplit(url).netloc
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def reset_breakers():
+    """Forget all breaker state (e.g. after restarting a server)"""
+    with _breakers_lock:
+        _breakers.clear()
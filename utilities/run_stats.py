@@ -0,0 +1,161 @@
+"""
+Run statistics shown in the session summary
+
+Every process (xdist worker or the main pytest process) collects counters in
+memory and writes them to reports/stats/<worker>.json when its session ends.
+The controlling process merges all files for the terminal summary and the
+HTML report.
+"""
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+from config.settings import STATS_DIR
+from utilities.helpers import get_worker_id
+
+# section -> key -> summed value
+_counters: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+# section -> key -> {"count", "total", "max"}
+_observations: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+
+
+def incr(section: str, key: str, amount: float = 1):
+    """
+    Add to a counter
+
+    Args:
+        section: Summary section (e.g. "mobile_context_pool")
+        key: Counter name within the section
+        amount: Value to add
+    """
+    _counters[section][key] += amount
+
+
+def observe(section: str, key: str, value: float):
+    """
+    Record one sample of a measurement (count, total and max are kept)
+
+    Args:
+        section: Summary section
+        key: Measurement name within the section
+        value: Sample value
+    """
+    stats = _observations[section].setdefault(key, {"count": 0, "total": 0.0, "max": 0.0})
+    stats["count"] += 1
+    stats["total"] += value
+    stats["max"] = max(stats["max"], value)
+
+
+def snapshot() -> dict:
+    """Return this process's statistics as plain dicts"""
+    return {
+        "counters": {section: dict(values) for section, values in _counters.items()},
+        "observations": {section: dict(values) for section, values in _observations.items()},
+    }
+
+
+def dump(stats_dir: Path = STATS_DIR):
+    """Write this process's statistics to <stats_dir>/<worker>.json"""
+    data = snapshot()
+    if not data["counters"] and not data["observations"]:
+        return
+    stats_dir.mkdir(parents=True, exist_ok=True)
+    with open(stats_dir / f"{get_worker_id()}.json", 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def reset(stats_dir: Path = STATS_DIR):
+    """Remove statistics left over from a previous run"""
+    if stats_dir.exists():
+        for path in stats_dir.glob("*.json"):
+            path.unlink()
+
+
+def merge_all(stats_dir: Path = STATS_DIR) -> dict:
+    """
+    Merge the statistics written by all processes of this run
+
+    Returns:
+        Dict with merged "counters" and "observations"
+    """
+    merged = {"counters": defaultdict(lambda: defaultdict(float)),
+              "observations": defaultdict(dict)}
+    paths = sorted(stats_dir.glob("*.json")) if stats_dir.exists() else []
+
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for section, values in data.get("counters", {}).items():
+            for key, value in values.items():
+                merged["counters"][section][key] += value
+        for section, values in data.get("observations", {}).items():
+            for key, stats in values.items():
+                target = merged["observations"][section].setdefault(
+                    key, {"count": 0, "total": 0.0, "max": 0.0})
+                target["count"] += stats["count"]
+                target["total"] += stats["total"]
+                target["max"] = max(target["max"], stats["max"])
+
+    return merged
+
+
+def format_summary(merged: dict, exclude: Tuple[str, ...] = ()) -> List[str]:
+    """
+    Format merged statistics as one line per section
+
+    Args:
+        merged: Result of merge_all()
+        exclude: Sections reported separately
+
+    Returns:
+        Summary lines, empty if nothing was recorded
+    """
+    lines = []
+    sections = sorted((set(merged["counters"]) | set(merged["observations"])) - set(exclude))
+    for section in sections:
+        counters = merged["counters"].get(section, {})
+        parts = [f"{key}={_format_number(value)}" for key, value in sorted(counters.items())]
+        lookups = counters.get("hits", 0) + counters.get("misses", 0)
+        if lookups:
+            parts.append(f"hit_ratio={counters.get('hits', 0) / lookups:.0%}")
+        for key, stats in sorted(merged["observations"].get(section, {}).items()):
+            average = stats["total"] / stats["count"] if stats["count"] else 0
+            parts.append(f"{key}(n={stats['count']} avg={_format_number(average)} "
+                         f"max={_format_number(stats['max'])})")
+        lines.append(f"{section}: {' '.join(parts)}")
+    return lines
+
+
+def slowest(merged: dict, section: str, limit: int = 10) -> List[str]:
+    """
+    Format the observations of a section with the highest average, slowest first
+
+    Args:
+        merged: Result of merge_all()
+        section: Section holding millisecond observations
+        limit: Maximum number of lines
+
+    Returns:
+        Lines of "avg max n name"
+    """
+    observations = merged["observations"].get(section, {})
+    ranked = sorted(observations.items(), key=lambda item: item[1]["total"] / item[1]["count"], reverse=True)
+    return [
+        f"{stats['total'] / stats['count']:8.0f} ms avg {stats['max']:8.0f} ms max "
+        f"{stats['count']:5d}x  {name}"
+        for name, stats in ranked[:limit]
+    ]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """q-th percentile (0-100) of values, interpolating linearly between the closest ranks"""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _format_number(value: float) -> str:
+    """Print integers without decimals and floats with one"""
+    return str(int(value)) if float(value).is_integer() else f"{value:.1f}"
@@ -0,0 +1,468 @@
+"""
+In-memory dataset of the local OrangeHRM stand-in
+
+Holds employees, system users, leave requests, candidates and web sessions,
+and serializes them in the shapes returned by OrangeHRM's /api/v2 endpoints.
+The dataset is generated deterministically, so every stand-in starts from the
+same state.
+"""
+import itertools
+import secrets
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from config.settings import TestUsers
+
+USER_ROLES = {1: "Admin", 2: "ESS"}
+LEAVE_TYPES = {1: "CAN - Personal", 2: "CAN - Vacation", 3: "CAN - Bereavement", 4: "CAN - FMLA"}
+LEAVE_STATUSES = ("Pending Approval", "Scheduled", "Taken", "Rejected", "Cancelled")
+
+_FIRST_NAMES = ("Paul", "Linda", "Peter", "Odis", "Russel", "Rebecca", "Charlie", "Garry", "Lisa",
+                "Joe", "Anthony", "Dominic", "Fiona", "Hannah", "Kevin", "Nina", "Orlando", "Sara")
+_LAST_NAMES = ("Collings", "Anderson", "Mac", "Adalwin", "Hamilton", "Harmony", "Carter", "White",
+               "Andrews", "Root", "Nolan", "Chase", "Grace", "Flores", "Mathews", "Patel", "Diaz")
+_VACANCIES = ("Senior QA Lead", "Software Engineer", "Payroll Administrator", "Sales Representative")
+
+
+class StandInData:
+    """Thread-safe in-memory store behind the stand-in's pages and API"""
+
+    def __init__(self, employees: int = 60, leave_requests: int = 30, candidates: int = 12):
+        """
+        Args:
+            employees: Number of generated employees; all but a few get a system user
+            leave_requests: Number of generated leave requests
+            candidates: Number of generated recruitment candidates
+        """
+        self._lock = threading.RLock()
+        self._ids = itertools.count(1)
+        self.employees: Dict[int, dict] = {}
+        self.users: Dict[int, dict] = {}
+        self.leave_requests: Dict[int, dict] = {}
+        self.leave_entitlements: Dict[int, dict] = {}
+        self.candidates: Dict[int, dict] = {}
+        self.sessions: Dict[str, dict] = {}
+        self._seed(employees, leave_requests, candidates)
+
+    # Sessions
+
+    def new_session(self) -> Tuple[str, dict]:
+        """Create an anonymous web session with its own CSRF token"""
+        session_id = secrets.token_hex(16)
+        session = {"csrf_token": secrets.token_urlsafe(24), "user_id": None, "flash": None}
+        with self._lock:
+            self.sessions[session_id] = session
+        return session_id, session
+
+    def get_session(self, session_id: Optional[str]) -> Optional[dict]:
+        """Session for a cookie value, or None"""
+        return self.sessions.get(session_id) if session_id else None
+
+    def end_session(self, session_id: Optional[str]):
+        """Forget a session (logout)"""
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    def authenticate(self, username: str, password: str) -> Optional[dict]:
+        """
+        Check credentials the way OrangeHRM does
+
+        Args:
+            username: Username (case-sensitive)
+            password: Password
+
+        Returns:
+            The enabled user with these credentials, or None
+        """
+        with self._lock:
+            for user in self.users.values():
+                if user["userName"] == username and user["password"] == password and user["status"]:
+                    return user
+        return None
+
+    def session_user(self, session: Optional[dict]) -> Optional[dict]:
+        """User logged in to a session, or None"""
+        if not session or session["user_id"] is None:
+            return None
+        return self.users.get(session["user_id"])
+
+    # System users
+
+    def list_users(self, username: str = "", user_role_id: Optional[int] = None,
+                   emp_number: Optional[int] = None, status: Optional[bool] = None,
+                   limit: int = 50, offset: int = 0) -> Tuple[List[dict], int]:
+        """
+        Filter and page system users (username matches exactly, ignoring case)
+
+        Returns:
+            (serialized page of users, total number of matches)
+        """
+        with self._lock:
+            users = [
+                user for user in self.users.values()
+                if (not username or user["userName"].lower() == username.lower())
+                and (user_role_id is None or user["userRoleId"] == user_role_id)
+                and (emp_number is None or user["empNumber"] == emp_number)
+                and (status is None or user["status"] == status)
+            ]
+            return [self.serialize_user(user) for user in _page(users, limit, offset)], len(users)
+
+    def get_user(self, user_id: int) -> Optional[dict]:
+        """Serialized user, or None"""
+        with self._lock:
+            user = self.users.get(user_id)
+            return self.serialize_user(user) if user else None
+
+    def save_user(self, payload: dict, user_id: Optional[int] = None) -> Tuple[Optional[dict], Dict[str, str]]:
+        """
+        Create a user, or update user_id; the password is optional on update
+
+        Args:
+            payload: username, password, status, userRoleId, empNumber
+            user_id: Existing user to update
+
+        Returns:
+            (serialized user or None, invalid parameters with their messages)
+        """
+        with self._lock:
+            existing = self.users.get(user_id) if user_id is not None else None
+            errors = {}
+            username = str(payload.get("username", "")).strip()
+            if len(username) < 5:
+                errors["username"] = "Should have at least 5 characters"
+            elif any(user["userName"].lower() == username.lower() and user is not existing
+                     for user in self.users.values()):
+                errors["username"] = "Already exists"
+            if payload.get("userRoleId") not in USER_ROLES:
+                errors["userRoleId"] = "Invalid user role"
+            if payload.get("empNumber") not in self.employees:
+                errors["empNumber"] = "Invalid employee"
+            password = payload.get("password")
+            if (existing is None or password) and len(str(password or "")) < 7:
+                errors["password"] = "Should have at least 7 characters"
+            if errors:
+                return None, errors
+
+            user = existing or {"id": next(self._ids)}
+            user.update({
+                "userName": username,
+                "password": password or user.get("password"),
+                "status": bool(payload.get("status", True)),
+                "userRoleId": payload["userRoleId"],
+                "empNumber": payload["empNumber"],
+            })
+            self.users[user["id"]] = user
+            return self.serialize_user(user), {}
+
+    def delete_users(self, ids: Iterable[int]) -> List[int]:
+        """Delete users by id; returns the ids that existed"""
+        with self._lock:
+            return [user_id for user_id in ids if self.users.pop(user_id, None)]
+
+    # Employees
+
+    def list_employees(self, name_or_id: str = "", limit: int = 50, offset: int = 0) -> Tuple[List[dict], int]:
+        """
+        Filter and page employees by a substring of their name (with or without
+        middle name) or employee id
+
+        Returns:
+            (serialized page of employees, total number of matches)
+        """
+        query = name_or_id.strip().lower()
+        with self._lock:
+            employees = [
+                employee for employee in self.employees.values()
+                if not query or query in _full_name(employee).lower() or query in employee["employeeId"].lower()
+                or query in f"{employee['firstName']} {employee['lastName']}".lower()
+            ]
+            return [dict(employee) for employee in _page(employees, limit, offset)], len(employees)
+
+    def get_employee(self, emp_number: int) -> Optional[dict]:
+        """Serialized employee, or None"""
+        with self._lock:
+            employee = self.employees.get(emp_number)
+            return dict(employee) if employee else None
+
+    def create_employee(self, payload: dict) -> Tuple[Optional[dict], Dict[str, str]]:
+        """
+        Create an employee
+
+        Args:
+            payload: firstName, middleName, lastName and optionally employeeId
+
+        Returns:
+            (serialized employee or None, invalid parameters with their messages)
+        """
+        with self._lock:
+            errors = {}
+            for field in ("firstName", "lastName"):
+                if not str(payload.get(field, "")).strip():
+                    errors[field] = "Required"
+            emp_number = next(self._ids)
+            employee_id = str(payload.get("employeeId") or f"{emp_number:04d}")
+            if any(employee["employeeId"] == employee_id for employee in self.employees.values()):
+                errors["employeeId"] = "Employee Id already exists"
+            if errors:
+                return None, errors
+
+            employee = self._add_employee(emp_number, payload["firstName"], payload.get("middleName") or "",
+                                          payload["lastName"], employee_id)
+            return dict(employee), {}
+
+    def delete_employees(self, emp_numbers: Iterable[int]) -> List[int]:
+        """Delete employees with their system users, leave requests and entitlements"""
+        with self._lock:
+            deleted = [emp_number for emp_number in emp_numbers if self.employees.pop(emp_number, None)]
+            for store in (self.users, self.leave_requests, self.leave_entitlements):
+                for record_id in [key for key, record in store.items() if record["empNumber"] in deleted]:
+                    del store[record_id]
+            return deleted
+
+    # Leave
+
+    def list_leave_requests(self, limit: int = 50, offset: int = 0,
+                            emp_number: Optional[int] = None) -> Tuple[List[dict], int]:
+        """
+        Page leave requests, newest first
+
+        Returns:
+            (serialized page of leave requests, total number of matches)
+        """
+        with self._lock:
+            requests = sorted(
+                (request for request in self.leave_requests.values()
+                 if emp_number is None or request["empNumber"] == emp_number),
+                key=lambda request: request["fromDate"], reverse=True,
+            )
+            return [self.serialize_leave_request(request) for request in _page(requests, limit, offset)], len(requests)
+
+    def create_leave_request(self, payload: dict) -> Tuple[Optional[dict], Dict[str, str]]:
+        """
+        Create a leave request
+
+        Args:
+            payload: empNumber, leaveTypeId, fromDate, toDate (YYYY-MM-DD), comment
+
+        Returns:
+            (serialized leave request or None, invalid parameters with their messages)
+        """
+        with self._lock:
+            from_date, to_date, errors = self._leave_dates(payload)
+            if errors:
+                return None, errors
+
+            request = self._add_leave_request(next(self._ids), payload["empNumber"], payload["leaveTypeId"],
+                                              from_date, to_date, "Pending Approval", payload.get("comment"))
+            return self.serialize_leave_request(request), {}
+
+    def assign_leave(self, payload: dict) -> Tuple[Optional[dict], Dict[str, str]]:
+        """
+        Assign leave to an employee, booked against their entitlements
+
+        Args:
+            payload: empNumber, leaveTypeId, fromDate, toDate (YYYY-MM-DD), comment
+
+        Returns:
+            (serialized leave request or None, invalid parameters with their messages)
+        """
+        with self._lock:
+            from_date, to_date, errors = self._leave_dates(payload)
+            if not errors:
+                days = (to_date - from_date).days + 1
+                if days > self._leave_balance(payload["empNumber"], payload["leaveTypeId"], from_date, to_date):
+                    errors["leaveTypeId"] = "Balance not sufficient"
+            if errors:
+                return None, errors
+
+            request = self._add_leave_request(next(self._ids), payload["empNumber"], payload["leaveTypeId"],
+                                              from_date, to_date, "Scheduled", payload.get("comment"))
+            return self.serialize_leave_request(request), {}
+
+    def create_leave_entitlement(self, payload: dict) -> Tuple[Optional[dict], Dict[str, str]]:
+        """
+        Entitle an employee to days of one leave type within a period
+
+        Args:
+            payload: empNumber, leaveTypeId, fromDate, toDate (YYYY-MM-DD), entitlement (days)
+
+        Returns:
+            (entitlement or None, invalid parameters with their messages)
+        """
+        with self._lock:
+            from_date, to_date, errors = self._leave_dates(payload)
+            try:
+                days = float(payload.get("entitlement"))
+                if days <= 0:
+                    raise ValueError(days)
+            except (TypeError, ValueError):
+                errors["entitlement"] = "Should be a positive number"
+            if errors:
+                return None, errors
+
+            entitlement = {"id": next(self._ids), "empNumber": payload["empNumber"],
+                           "leaveTypeId": payload["leaveTypeId"], "fromDate": from_date.isoformat(),
+                           "toDate": to_date.isoformat(), "entitlement": days}
+            self.leave_entitlements[entitlement["id"]] = entitlement
+            return dict(entitlement), {}
+
+    def delete_leave_entitlements(self, ids: Iterable[int]) -> List[int]:
+        """Delete leave entitlements by id; returns the ids that existed"""
+        with self._lock:
+            return [entitlement_id for entitlement_id in ids if self.leave_entitlements.pop(entitlement_id, None)]
+
+    # Recruitment
+
+    def list_candidates(self, limit: int = 50, offset: int = 0) -> Tuple[List[dict], int]:
+        """Page recruitment candidates"""
+        with self._lock:
+            candidates = list(self.candidates.values())
+            return [dict(candidate) for candidate in _page(candidates, limit, offset)], len(candidates)
+
+    # Serialization
+
+    def serialize_user(self, user: dict) -> dict:
+        """User in the shape of GET /api/v2/admin/users"""
+        employee = self.employees.get(user["empNumber"], {})
+        return {
+            "id": user["id"],
+            "userName": user["userName"],
+            "deleted": False,
+            "status": user["status"],
+            "employee": {key: employee.get(key) for key in
+                         ("empNumber", "employeeId", "firstName", "middleName", "lastName", "terminationId")},
+            "userRole": {"id": user["userRoleId"], "name": USER_ROLES[user["userRoleId"]],
+                         "displayName": USER_ROLES[user["userRoleId"]]},
+        }
+
+    def serialize_leave_request(self, request: dict) -> dict:
+        """Leave request in the shape of GET /api/v2/leave/leave-requests"""
+        employee = self.employees.get(request["empNumber"], {})
+        days = (date.fromisoformat(request["toDate"]) - date.fromisoformat(request["fromDate"])).days + 1
+        return {
+            "id": request["id"],
+            "employee": {key: employee.get(key) for key in
+                         ("empNumber", "employeeId", "firstName", "middleName", "lastName", "terminationId")},
+            "leaveType": {"id": request["leaveTypeId"], "name": LEAVE_TYPES[request["leaveTypeId"]], "deleted": False},
+            "dates": {"fromDate": request["fromDate"], "toDate": request["toDate"]},
+            "numberOfDays": float(days),
+            "leaveBreakdown": [{"id": 1, "name": request["status"], "lengthDays": float(days)}],
+            "lastComment": {"comment": request["comment"]} if request["comment"] else None,
+        }
+
+    # Seed data
+
+    def _seed(self, employees: int, leave_requests: int, candidates: int):
+        """Generate the initial dataset; the same arguments always give the same data"""
+        names = itertools.product(_LAST_NAMES, _FIRST_NAMES)
+        for _ in range(max(employees, 7)):
+            last_name, first_name = next(names)
+            emp_number = next(self._ids)
+            self._add_employee(emp_number, first_name, "", last_name, f"{emp_number:04d}")
+
+        emp_numbers = list(self.employees)
+        self._add_user(TestUsers.ADMIN["username"], TestUsers.ADMIN["password"], 1, emp_numbers[0])
+        self._add_user(TestUsers.ESS_USER["username"], TestUsers.ESS_USER["password"], 2, emp_numbers[1])
+        # Most employees have a user, some of them disabled; the last few have none
+        for position, emp_number in enumerate(emp_numbers[2:-5], start=2):
+            employee = self.employees[emp_number]
+            username = f"{employee['firstName']}.{employee['lastName']}".lower()
+            self._add_user(username, "Secret#123", 1 if position % 7 == 0 else 2, emp_number,
+                           status=position % 11 != 0)
+
+        start = date(2026, 1, 5)
+        for index in range(leave_requests):
+            from_date = start + timedelta(days=3 * index)
+            self._add_leave_request(next(self._ids), emp_numbers[index % len(emp_numbers)],
+                                    1 + index % len(LEAVE_TYPES), from_date, from_date + timedelta(days=index % 3),
+                                    LEAVE_STATUSES[index % len(LEAVE_STATUSES)], None)
+
+        for index in range(candidates):
+            first_name = _FIRST_NAMES[(index * 5) % len(_FIRST_NAMES)]
+            last_name = _LAST_NAMES[(index * 3) % len(_LAST_NAMES)]
+            candidate_id = next(self._ids)
+            self.candidates[candidate_id] = {
+                "id": candidate_id,
+                "firstName": first_name,
+                "middleName": "",
+                "lastName": last_name,
+                "email": f"{first_name}.{last_name}@example.com".lower(),
+                "dateOfApplication": (start + timedelta(days=index)).isoformat(),
+                "vacancy": {"id": 1 + index % len(_VACANCIES), "name": _VACANCIES[index % len(_VACANCIES)]},
+                "status": {"id": 1, "label": "Application Initiated"},
+            }
+
+    def _add_employee(self, emp_number: int, first_name: str, middle_name: str, last_name: str,
+                      employee_id: str) -> dict:
+        employee = {
+            "empNumber": emp_number,
+            "employeeId": employee_id,
+            "firstName": first_name,
+            "middleName": middle_name,
+            "lastName": last_name,
+            "terminationId": None,
+        }
+        self.employees[emp_number] = employee
+        return employee
+
+    def _add_user(self, username: str, password: str, user_role_id: int, emp_number: int,
+                  status: bool = True) -> dict:
+        user = {"id": next(self._ids), "userName": username, "password": password, "status": status,
+                "userRoleId": user_role_id, "empNumber": emp_number}
+        self.users[user["id"]] = user
+        return user
+
+    def _leave_dates(self, payload: dict) -> Tuple[Optional[date], Optional[date], Dict[str, str]]:
+        """Validated employee, leave type and date range of a leave payload"""
+        errors = {}
+        from_date = to_date = None
+        if payload.get("empNumber") not in self.employees:
+            errors["empNumber"] = "Invalid employee"
+        if payload.get("leaveTypeId") not in LEAVE_TYPES:
+            errors["leaveTypeId"] = "Invalid leave type"
+        try:
+            from_date = date.fromisoformat(payload.get("fromDate", ""))
+            to_date = date.fromisoformat(payload.get("toDate") or payload.get("fromDate", ""))
+            if to_date < from_date:
+                errors["toDate"] = "To date should be after from date"
+        except (TypeError, ValueError):
+            errors["fromDate"] = "Should be a valid date in yyyy-mm-dd format"
+        return from_date, to_date, errors
+
+    def _leave_balance(self, emp_number: int, leave_type_id: int, from_date: date, to_date: date) -> float:
+        """Days left in the entitlements covering a date range, after scheduled and taken leave"""
+        def span(record: dict) -> Tuple[date, date]:
+            return date.fromisoformat(record["fromDate"]), date.fromisoformat(record["toDate"])
+
+        def of_employee(record: dict) -> bool:
+            return record["empNumber"] == emp_number and record["leaveTypeId"] == leave_type_id
+
+        periods = [span(entitlement) for entitlement in self.leave_entitlements.values()
+                   if of_employee(entitlement) and span(entitlement)[0] <= from_date and to_date <= span(entitlement)[1]]
+        entitled = sum(entitlement["entitlement"] for entitlement in self.leave_entitlements.values()
+                       if of_employee(entitlement) and span(entitlement) in periods)
+        used = 0
+        for request in self.leave_requests.values():
+            start, end = span(request)
+            if of_employee(request) and request["status"] in ("Scheduled", "Taken") \
+                    and any(period[0] <= start and end <= period[1] for period in periods):
+                used += (end - start).days + 1
+        return entitled - used
+
+    def _add_leave_request(self, request_id: int, emp_number: int, leave_type_id: int, from_date: date,
+                           to_date: date, status: str, comment: Optional[str]) -> dict:
+        request = {"id": request_id, "empNumber": emp_number, "leaveTypeId": leave_type_id,
+                   "fromDate": from_date.isoformat(), "toDate": to_date.isoformat(),
+                   "status": status, "comment": comment}
+        self.leave_requests[request_id] = request
+        return request
+
+
+def _full_name(employee: dict) -> str:
+    """First, middle and last name joined by single spaces"""
+    return " ".join(part for part in (employee["firstName"], employee["middleName"], employee["lastName"]) if part)
+
+
+def _page(records: List[dict], limit: int, offset: int) -> List[dict]:
+    """Slice one page; limit 0 returns everything from offset like the OrangeHRM API"""
+    return records[offset:offset + limit] if limit else records[offset:]
@@ -0,0 +1,1347 @@
+"""
+Local OrangeHRM stand-in server
+
+Serves the login, dashboard, admin, PIM, leave and recruitment pages with the
+DOM classes the page objects rely on, plus the /web/index.php/api/v2
+endpoints, backed by StandInData. Pages load their data through the API like
+the real application, so readiness signals behave the same. Responses can be
+delayed by a configurable latency to model a remote server.
+
+Enable with STANDIN=true: BASE_URL then points at the stand-in and every
+xdist worker starts its own server (see the standin_server fixture).
+"""
+import hashlib
+import hmac
+import html
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from config.settings import (
+    STANDIN_HOST, STANDIN_LATENCY_JITTER_MS, STANDIN_LATENCY_MS, STANDIN_PORT
+)
+from utilities.logger import get_logger
+from utilities.standin_data import LEAVE_TYPES, USER_ROLES, StandInData
+
+logger = get_logger(__name__)
+
+SESSION_COOKIE = "orangehrm"
+WEB_PREFIX = "/web/index.php"
+API_PREFIX = f"{WEB_PREFIX}/api/v2"
+
+# Main menu: (label, path, roles that see it)
+_MENU = (
+    ("Admin", "/admin/viewSystemUsers", ("Admin",)),
+    ("PIM", "/pim/viewEmployeeList", ("Admin",)),
+    ("Leave", "/leave/viewLeaveList", ("Admin", "ESS")),
+    ("Time", "/time/viewEmployeeTimesheet", ("Admin", "ESS")),
+    ("Recruitment", "/recruitment/viewCandidates", ("Admin",)),
+    ("My Info", "/pim/viewMyDetails", ("Admin", "ESS")),
+    ("Dashboard", "/dashboard/index", ("Admin", "ESS")),
+)
+
+
+class StandInServer:
+    """OrangeHRM stand-in running on a background thread"""
+
+    def __init__(self, host: str = STANDIN_HOST, port: int = STANDIN_PORT,
+                 latency_ms: float = STANDIN_LATENCY_MS, jitter_ms: float = STANDIN_LATENCY_JITTER_MS,
+                 data: Optional[StandInData] = None):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            latency_ms: Delay added to every response
+            jitter_ms: Random extra delay, uniform in [0, jitter_ms]
+            data: Dataset to serve; a fresh StandInData by default
+        """
+        self.host = host
+        self.port = port
+        self.data = data or StandInData()
+        self.request_counts: Counter = Counter()
+        self._lock = threading.Lock()
+        self._faults: List[Tuple[int, Optional[float]]] = []
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.set_latency(latency_ms, jitter_ms)
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, with a trailing slash"""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self) -> "StandInServer":
+        """Start serving on a daemon thread"""
+        self._httpd = _HTTPServer((self.host, self.port), _Handler)
+        self._httpd.standin = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        logger.info(f"OrangeHRM stand-in listening on {self.url} (latency {self.latency_ms:g}ms "
+                    f"+ up to {self.jitter_ms:g}ms jitter)")
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket"""
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+            logger.info(f"OrangeHRM stand-in stopped after {sum(self.request_counts.values())} requests")
+
+    def set_latency(self, latency_ms: float, jitter_ms: float = 0):
+        """
+        Change the injected latency, also while running
+
+        Args:
+            latency_ms: Delay added to every response
+            jitter_ms: Random extra delay, uniform in [0, jitter_ms]
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+
+    def inject_faults(self, count: int, status: int = 503, retry_after: Optional[float] = None):
+        """
+        Answer the next API requests with an error instead of handling them
+
+        Args:
+            count: Number of API requests to fail
+            status: Status to answer with (e.g. 502, 503, 429)
+            retry_after: Retry-After header value in seconds, if any
+        """
+        with self._lock:
+            self._faults.extend([(status, retry_after)] * count)
+
+    def take_fault(self) -> Optional[Tuple[int, Optional[float]]]:
+        """Next injected fault as (status, retry_after), or None"""
+        with self._lock:
+            return self._faults.pop(0) if self._faults else None
+
+    def reset_data(self):
+        """Replace the dataset with a freshly generated one (sessions are dropped)"""
+        self.data = StandInData()
+
+    def delay(self):
+        """Sleep for the configured latency"""
+        delay_ms = self.latency_ms + (random.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def count(self, kind: str):
+        """Count a served request by kind (page, api, static)"""
+        with self._lock:
+            self.request_counts[kind] += 1
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    """Threaded server with a backlog large enough for parallel browsers"""
+    daemon_threads = True
+    request_queue_size = 128
+    standin: StandInServer
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routes requests to pages, static assets and API endpoints"""
+
+    protocol_version = "HTTP/1.1"
+    server: _HTTPServer
+
+    # (method, path pattern, handler name); API routes require a logged-in session
+    PAGE_ROUTES = [
+        ("GET", r"/(?:web/index\.php/?)?", "_redirect_to_login"),
+        ("GET", r"/web/index\.php/auth/login", "_login_page"),
+        ("POST", r"/web/index\.php/auth/validate", "_validate_login"),
+        ("GET", r"/web/index\.php/auth/logout", "_logout"),
+        ("GET", r"/web/index\.php/auth/requestPasswordResetCode", "_password_reset_page"),
+    ]
+    API_ROUTES = [
+        ("POST", r"/auth/login", "_api_login"),
+        ("GET", r"/dashboard/employees/time-at-work", "_api_time_at_work"),
+        ("GET", r"/admin/users", "_api_list_users"),
+        ("POST", r"/admin/users", "_api_create_user"),
+        ("DELETE", r"/admin/users", "_api_delete_users"),
+        ("GET", r"/admin/users/(?P<id>\d+)", "_api_get_user"),
+        ("PUT", r"/admin/users/(?P<id>\d+)", "_api_update_user"),
+        ("GET", r"/pim/employees", "_api_list_employees"),
+        ("POST", r"/pim/employees", "_api_create_employee"),
+        ("DELETE", r"/pim/employees", "_api_delete_employees"),
+        ("GET", r"/pim/employees/(?P<id>\d+)", "_api_get_employee"),
+        ("GET", r"/leave/leave-types", "_api_leave_types"),
+        ("GET", r"/leave/leave-requests", "_api_list_leave_requests"),
+        ("POST", r"/leave/leave-requests", "_api_create_leave_request"),
+        ("POST", r"/leave/employees/leave-requests", "_api_assign_leave"),
+        ("POST", r"/leave/leave-entitlements", "_api_create_leave_entitlement"),
+        ("DELETE", r"/leave/leave-entitlements", "_api_delete_leave_entitlements"),
+        ("GET", r"/recruitment/candidates", "_api_list_candidates"),
+    ]
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("stand-in: %s %s", self.address_string(), format % args)
+
+    @property
+    def standin(self) -> StandInServer:
+        return self.server.standin
+
+    @property
+    def data(self) -> StandInData:
+        return self.server.standin.data
+
+    # Dispatch
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        # Clients joining BASE_URL and an absolute path produce '//web/...'
+        path = re.sub(r"/{2,}", "/", url.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self.body = self._read_body()
+        self.session_id = self._session_cookie()
+        self.session = self.data.get_session(self.session_id)
+        self.user = self.data.session_user(self.session)
+        self.set_cookies: List[str] = []
+        self.standin.delay()
+
+        try:
+            if path.startswith(API_PREFIX + "/"):
+                self.standin.count("api")
+                fault = self.standin.take_fault()
+                if fault:
+                    self._send_fault(*fault)
+                else:
+                    self._dispatch_api(method, path[len(API_PREFIX):])
+            elif path in _STATIC_ASSETS:
+                self.standin.count("static")
+                self._send_static(path)
+            elif path == "/favicon.ico":
+                self._send(HTTPStatus.NO_CONTENT, b"", "image/x-icon")
+            else:
+                self.standin.count("page")
+                self._dispatch_page(method, path)
+        except Exception as e:
+            logger.error(f"stand-in: {method} {self.path} failed: {e}")
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR,
+                            {"error": {"status": "500", "message": "Unexpected Error Occurred"}})
+
+    def _dispatch_page(self, method: str, path: str):
+        for route_method, pattern, handler in self.PAGE_ROUTES:
+            if route_method == method and re.fullmatch(pattern, path):
+                getattr(self, handler)()
+                return
+
+        page = _PAGES.get(path[len(WEB_PREFIX):]) or _match_edit_page(path[len(WEB_PREFIX):])
+        if method != "GET" or not path.startswith(WEB_PREFIX) or page is None:
+            self._send_html(HTTPStatus.NOT_FOUND, _document("Not Found", "<h1>404 Not Found</h1>"))
+        elif not self.user:
+            self._redirect(f"{WEB_PREFIX}/auth/login")
+        else:
+            module, body_id, body, roles = page
+            if _role(self.user) not in roles:
+                self._redirect(f"{WEB_PREFIX}/dashboard/index")
+            else:
+                self._send_html(HTTPStatus.OK, _layout(module, body_id, body, self.user, self.data))
+
+    def _dispatch_api(self, method: str, path: str):
+        allowed = []
+        for route_method, pattern, handler in self.API_ROUTES:
+            match = re.fullmatch(pattern, path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed.append(route_method)
+                continue
+            if handler != "_api_login" and not self.user:
+                self._api_error(HTTPStatus.UNAUTHORIZED, "Session expired")
+            elif path.startswith(("/admin/", "/pim/", "/recruitment/")) and _role(self.user) != "Admin" \
+                    and not (handler == "_api_list_employees" and method == "GET"):
+                self._api_error(HTTPStatus.FORBIDDEN, "Unauthorized")
+            else:
+                getattr(self, handler)(**{key: int(value) for key, value in match.groupdict().items()})
+            return
+
+        if allowed:
+            self._api_error(HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+        else:
+            self._api_error(HTTPStatus.NOT_FOUND, "Invalid Path")
+
+    # Web pages and authentication
+
+    def _redirect_to_login(self):
+        self._redirect(f"{WEB_PREFIX}/auth/login")
+
+    def _login_page(self):
+        if self.user:
+            self._redirect(f"{WEB_PREFIX}/dashboard/index")
+            return
+        if not self.session:
+            self.session_id, self.session = self.data.new_session()
+            self._set_session_cookie(self.session_id)
+        flash, self.session["flash"] = self.session["flash"], None
+        self._send_html(HTTPStatus.OK, _login_document(self.session["csrf_token"], flash))
+
+    def _validate_login(self):
+        form = {key: values[-1] for key, values in parse_qs(self.body.decode("utf-8", "replace")).items()}
+        if not self.session or not hmac.compare_digest(form.get("_token", ""), self.session["csrf_token"]):
+            self.session_id, self.session = self.data.new_session()
+            self._set_session_cookie(self.session_id)
+            self.session["flash"] = "CSRF token validation failed"
+            self._redirect(f"{WEB_PREFIX}/auth/login")
+            return
+
+        user = self.data.authenticate(form.get("username", ""), form.get("password", ""))
+        if not user:
+            self.session["flash"] = "Invalid credentials"
+            self._redirect(f"{WEB_PREFIX}/auth/login")
+            return
+
+        # A new session id on login, as OrangeHRM does
+        self.data.end_session(self.session_id)
+        self.session_id, self.session = self.data.new_session()
+        self.session["user_id"] = user["id"]
+        self._set_session_cookie(self.session_id)
+        self._redirect(f"{WEB_PREFIX}/dashboard/index")
+
+    def _logout(self):
+        self.data.end_session(self.session_id)
+        self.set_cookies.append(f"{SESSION_COOKIE}=; Path=/; Max-Age=0; HttpOnly; SameSite=Lax")
+        self._redirect(f"{WEB_PREFIX}/auth/login")
+
+    def _password_reset_page(self):
+        body = ('<div class="orangehrm-forgot-password-container"><div class="orangehrm-card-container">'
+                '<h6 class="oxd-text oxd-text--h6 orangehrm-forgot-password-title">Reset Password</h6>'
+                '<p class="oxd-text oxd-text--p">Please enter your username to identify your account '
+                'to reset your password</p></div></div>')
+        self._send_html(HTTPStatus.OK, _document("OrangeHRM", body, "password-reset"))
+
+    # API
+
+    def _api_login(self):
+        payload = self._json_body()
+        user = self.data.authenticate(str(payload.get("username", "")), str(payload.get("password", "")))
+        if not user:
+            self._api_error(HTTPStatus.UNAUTHORIZED, "Invalid credentials")
+            return
+        self.data.end_session(self.session_id)
+        self.session_id, self.session = self.data.new_session()
+        self.session["user_id"] = user["id"]
+        self._set_session_cookie(self.session_id)
+        self._send_json(HTTPStatus.OK, {"data": self.data.serialize_user(user), "meta": [], "rels": []})
+
+    def _api_time_at_work(self):
+        self._send_json(HTTPStatus.OK, {
+            "data": [{"workDay": {"day": day}, "totalTime": {"hours": 0, "minutes": 0}}
+                     for day in ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")],
+            "meta": {"lastAction": {"state": "PUNCHED OUT"}, "currentDay": {"totalTime": {"hours": 0, "minutes": 0}},
+                     "currentWeek": {"totalTime": {"hours": 0, "minutes": 0}}},
+            "rels": [],
+        })
+
+    def _api_list_users(self):
+        users, total = self.data.list_users(
+            username=self.query.get("username", ""),
+            user_role_id=self._int_query("userRoleId"),
+            emp_number=self._int_query("empNumber"),
+            status=None if self._int_query("status") is None else bool(self._int_query("status")),
+            **self._paging(),
+        )
+        self._send_list(users, total)
+
+    def _api_get_user(self, id: int):
+        self._send_record(self.data.get_user(id))
+
+    def _api_create_user(self):
+        user, errors = self.data.save_user(self._json_body())
+        self._send_saved(user, errors)
+
+    def _api_update_user(self, id: int):
+        if self.data.get_user(id) is None:
+            self._api_error(HTTPStatus.NOT_FOUND, "Record Not Found")
+            return
+        user, errors = self.data.save_user(self._json_body(), user_id=id)
+        self._send_saved(user, errors)
+
+    def _api_delete_users(self):
+        self._send_deleted(self.data.delete_users(self._ids_body()))
+
+    def _api_list_employees(self):
+        employees, total = self.data.list_employees(self.query.get("nameOrId", ""), **self._paging())
+        self._send_list(employees, total)
+
+    def _api_get_employee(self, id: int):
+        self._send_record(self.data.get_employee(id))
+
+    def _api_create_employee(self):
+        employee, errors = self.data.create_employee(self._json_body())
+        self._send_saved(employee, errors)
+
+    def _api_delete_employees(self):
+        self._send_deleted(self.data.delete_employees(self._ids_body()))
+
+    def _api_leave_types(self):
+        leave_types = [{"id": type_id, "name": name, "deleted": False} for type_id, name in LEAVE_TYPES.items()]
+        self._send_list(leave_types, len(leave_types))
+
+    def _api_list_leave_requests(self):
+        # Employees only see their own requests
+        own = None if _role(self.user) == "Admin" else self.user["empNumber"]
+        requests, total = self.data.list_leave_requests(emp_number=self._int_query("empNumber") or own,
+                                                        **self._paging())
+        self._send_list(requests, total)
+
+    def _api_create_leave_request(self):
+        payload = self._json_body()
+        if _role(self.user) != "Admin" or "empNumber" not in payload:
+            payload["empNumber"] = self.user["empNumber"]
+        request, errors = self.data.create_leave_request(payload)
+        self._send_saved(request, errors)
+
+    def _api_assign_leave(self):
+        if _role(self.user) != "Admin":
+            self._api_error(HTTPStatus.FORBIDDEN, "Unauthorized")
+            return
+        request, errors = self.data.assign_leave(self._json_body())
+        self._send_saved(request, errors)
+
+    def _api_create_leave_entitlement(self):
+        if _role(self.user) != "Admin":
+            self._api_error(HTTPStatus.FORBIDDEN, "Unauthorized")
+            return
+        entitlement, errors = self.data.create_leave_entitlement(self._json_body())
+        self._send_saved(entitlement, errors)
+
+    def _api_delete_leave_entitlements(self):
+        if _role(self.user) != "Admin":
+            self._api_error(HTTPStatus.FORBIDDEN, "Unauthorized")
+            return
+        self._send_deleted(self.data.delete_leave_entitlements(self._ids_body()))
+
+    def _api_list_candidates(self):
+        candidates, total = self.data.list_candidates(**self._paging())
+        self._send_list(candidates, total)
+
+    # Request helpers
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _json_body(self) -> dict:
+        try:
+            payload = json.loads(self.body or b"{}")
+        except ValueError:
+            payload = None
+        return payload if isinstance(payload, dict) else {}
+
+    def _ids_body(self) -> List[int]:
+        ids = self._json_body().get("ids", [])
+        return [int(record_id) for record_id in ids if str(record_id).isdigit()]
+
+    def _int_query(self, name: str) -> Optional[int]:
+        value = self.query.get(name, "")
+        return int(value) if value.lstrip("-").isdigit() else None
+
+    def _paging(self) -> Dict[str, int]:
+        return {"limit": max(self._int_query("limit") if self._int_query("limit") is not None else 50, 0),
+                "offset": max(self._int_query("offset") or 0, 0)}
+
+    def _session_cookie(self) -> Optional[str]:
+        cookie = SimpleCookie()
+        try:
+            cookie.load(self.headers.get("Cookie", ""))
+        except Exception:
+            return None
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _set_session_cookie(self, session_id: str):
+        self.set_cookies.append(f"{SESSION_COOKIE}={session_id}; Path=/; HttpOnly; SameSite=Lax")
+
+    # Response helpers
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        for cookie in self.set_cookies:
+            self.send_header("Set-Cookie", cookie)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_html(self, status: int, document: str):
+        self._send(status, document.encode("utf-8"), "text/html; charset=UTF-8", {"Cache-Control": "no-store"})
+
+    def _redirect(self, location: str):
+        self._send(HTTPStatus.FOUND, b"", "text/html; charset=UTF-8", {"Location": location})
+
+    def _send_static(self, path: str):
+        content_type, body, etag = _STATIC_ASSETS[path]
+        if self.headers.get("If-None-Match") == etag:
+            self._send(HTTPStatus.NOT_MODIFIED, b"", content_type, {"ETag": etag})
+            return
+        self._send(HTTPStatus.OK, body, content_type,
+                   {"ETag": etag, "Cache-Control": "public, max-age=3600"})
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        headers = {"Cache-Control": "no-store"}
+        if self.command == "GET" and status == HTTPStatus.OK:
+            # Lets clients revalidate API reads with If-None-Match
+            headers["ETag"] = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                self._send(HTTPStatus.NOT_MODIFIED, b"", "application/json", headers)
+                return
+        self._send(status, body, "application/json", headers)
+
+    def _send_list(self, records: List[dict], total: int):
+        self._send_json(HTTPStatus.OK, {"data": records, "meta": {"total": total}, "rels": []})
+
+    def _send_record(self, record: Optional[dict]):
+        if record is None:
+            self._api_error(HTTPStatus.NOT_FOUND, "Record Not Found")
+        else:
+            self._send_json(HTTPStatus.OK, {"data": record, "meta": [], "rels": []})
+
+    def _send_saved(self, record: Optional[dict], errors: Dict[str, str]):
+        if errors:
+            self._send_json(HTTPStatus.UNPROCESSABLE_ENTITY, {"error": {
+                "status": "422", "message": "Invalid Parameter", "data": {"invalidParamKeys": errors}}})
+        else:
+            self._send_json(HTTPStatus.OK, {"data": record, "meta": [], "rels": []})
+
+    def _send_deleted(self, ids: List[int]):
+        if not ids:
+            self._api_error(HTTPStatus.NOT_FOUND, "Records Not Found")
+        else:
+            self._send_json(HTTPStatus.OK, {"data": ids, "meta": [], "rels": []})
+
+    def _api_error(self, status: HTTPStatus, message: str):
+        self._send_json(status, {"error": {"status": str(int(status)), "message": message}})
+
+    def _send_fault(self, status: int, retry_after: Optional[float]):
+        headers = {"Retry-After": f"{retry_after:g}"} if retry_after is not None else {}
+        self._send(status, json.dumps({"error": {"status": str(status), "message": "Injected fault"}}).encode(),
+                   "application/json", headers)
+
+
+def _role(user: Optional[dict]) -> Optional[str]:
+    """Role name of a stored user"""
+    return USER_ROLES.get(user["userRoleId"]) if user else None
+
+
+# Markup
+
+def _document(title: str, body: str, page: str = "") -> str:
+    """Complete HTML document loading the shared stylesheet and script"""
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f'<title>{html.escape(title)}</title><link rel="stylesheet" href="/web/dist/css/app.css">'
+        f'</head><body data-page="{page}">{body}'
+        '<div class="oxd-toast-container oxd-toast-container--bottom" id="oxd-toaster_1"></div>'
+        '<script src="/web/dist/js/app.js"></script></body></html>'
+    )
+
+
+def _input_group(label: str, field: str, required: bool = False) -> str:
+    """OXD label + field pair; page objects locate fields through the label"""
+    return (
+        '<div class="oxd-input-group oxd-input-field-bottom-space">'
+        f'<div class="oxd-input-group__label-wrapper"><label class="oxd-label'
+        f'{" oxd-input-field-required" if required else ""}">{label}</label></div>'
+        f'<div>{field}</div></div>'
+    )
+
+
+def _text_input(name: str, input_type: str = "text", placeholder: str = "") -> str:
+    placeholder_attr = f' placeholder="{placeholder}"' if placeholder else ""
+    return (f'<input class="oxd-input oxd-input--active" name="{name}" type="{input_type}"'
+            f'{placeholder_attr} autocomplete="off">')
+
+
+def _select(name: str, options: List[Tuple[str, str]]) -> str:
+    """OXD select: a text box opening a listbox of options"""
+    items = "".join(f'<div role="option" class="oxd-select-option" data-value="{value}">'
+                    f'<span>{label}</span></div>' for value, label in [("", "-- Select --")] + options)
+    return (
+        f'<div class="oxd-select-wrapper" data-name="{name}" data-value="">'
+        '<div class="oxd-select-text oxd-select-text--active">'
+        '<div class="oxd-select-text-input" tabindex="0">-- Select --</div>'
+        '<div class="oxd-select-text--after"><i class="oxd-icon bi-caret-down-fill oxd-select-text--arrow"></i></div>'
+        f'</div><div class="oxd-select-dropdown --positon-bottom" role="listbox" hidden>{items}</div></div>'
+    )
+
+
+def _autocomplete(name: str) -> str:
+    """OXD employee autocomplete, filled from the employees API"""
+    return (
+        f'<div class="oxd-autocomplete-wrapper" data-name="{name}" data-value="">'
+        '<div class="oxd-autocomplete-text-input oxd-autocomplete-text-input--active">'
+        '<input placeholder="Type for hints..." autocomplete="off" data-v-autocomplete=""></div>'
+        '<div class="oxd-autocomplete-dropdown --positon-bottom" role="listbox" hidden></div></div>'
+    )
+
+
+def _form_error(text: str = "") -> str:
+    return f'<span class="oxd-text oxd-text--span oxd-input-field-error-message oxd-input-group__message">{text}</span>'
+
+
+def _login_document(csrf_token: str, flash: Optional[str]) -> str:
+    alert = (
+        '<div class="oxd-alert oxd-alert--error" role="alert"><div class="oxd-alert-content oxd-alert-content--error">'
+        '<i class="oxd-icon bi-exclamation-circle oxd-alert-content-icon"></i>'
+        f'<p class="oxd-text oxd-text--p oxd-alert-content-text">{html.escape(flash)}</p></div></div>'
+    ) if flash else ""
+    body = (
+        '<div class="orangehrm-login-layout"><div class="orangehrm-login-layout-blob">'
+        '<div class="orangehrm-login-container"><div class="orangehrm-login-slot-wrapper">'
+        '<div class="orangehrm-login-branding"><img src="/web/images/ohrm_branding.svg" alt="company-branding"></div>'
+        '<div class="orangehrm-login-slot"><h5 class="oxd-text oxd-text--h5 orangehrm-login-title">Login</h5>'
+        f'<div class="orangehrm-login-error">{alert}</div>'
+        '<div class="orangehrm-login-form">'
+        f'<form class="oxd-form" method="post" action="{WEB_PREFIX}/auth/validate" novalidate>'
+        f'<input type="hidden" name="_token" value="{html.escape(csrf_token)}">'
+        + _input_group("Username", _text_input("username", placeholder="Username") + _form_error())
+        + _input_group("Password", _text_input("password", "password", "Password") + _form_error())
+        + '<div class="oxd-form-actions orangehrm-login-action">'
+        '<button type="submit" class="oxd-button oxd-button--medium oxd-button--main orangehrm-login-button">'
+        ' Login </button></div>'
+        f'<div class="orangehrm-login-forgot"><a class="orangehrm-login-forgot-header" '
+        f'href="{WEB_PREFIX}/auth/requestPasswordResetCode">Forgot your password? </a></div>'
+        '</form></div></div></div></div></div></div>'
+    )
+    return _document("OrangeHRM", body, "login")
+
+
+def _layout(module: str, page_id: str, content: str, user: dict, data: StandInData) -> str:
+    """Authenticated page: side menu, top bar with user dropdown, content"""
+    role = _role(user)
+    employee = data.employees.get(user["empNumber"], {})
+    display_name = html.escape(f"{employee.get('firstName', '')} {employee.get('lastName', '')}".strip()
+                               or user["userName"])
+    menu = "".join(
+        '<li class="oxd-main-menu-item-wrapper">'
+        f'<a class="oxd-main-menu-item{" active" if label == module else ""}" href="{WEB_PREFIX}{path}">'
+        f'<span class="oxd-text oxd-text--span oxd-main-menu-item--name">{label}</span></a></li>'
+        for label, path, roles in _MENU if role in roles
+    )
+    body = (
+        '<div class="oxd-layout"><div class="oxd-layout-navigation">'
+        '<aside class="oxd-sidepanel"><div class="oxd-sidepanel-header">'
+        '<a class="oxd-brand" href="/"><img src="/web/images/ohrm_branding.svg" alt="client brand banner"></a></div>'
+        '<nav class="oxd-navbar-nav" role="navigation" aria-label="Sidepanel">'
+        f'<ul class="oxd-main-menu">{menu}</ul></nav></aside></div>'
+        '<div class="oxd-layout-container"><header class="oxd-topbar"><div class="oxd-topbar-header">'
+        '<div class="oxd-topbar-header-title"><span class="oxd-topbar-header-breadcrumb">'
+        f'<h6 class="oxd-text oxd-text--h6 oxd-topbar-header-breadcrumb-module">{module}</h6></span></div>'
+        '<div class="oxd-topbar-header-userarea"><ul><li class="oxd-userdropdown">'
+        '<span class="oxd-userdropdown-tab">'
+        f'<p class="oxd-userdropdown-name">{display_name}</p>'
+        '<i class="oxd-icon bi-caret-down-fill oxd-userdropdown-icon"></i></span>'
+        '<ul class="oxd-dropdown-menu" role="menu" hidden>'
+        '<li><a class="oxd-userdropdown-link" role="menuitem" href="#">About</a></li>'
+        '<li><a class="oxd-userdropdown-link" role="menuitem" href="#">Support</a></li>'
+        '<li><a class="oxd-userdropdown-link" role="menuitem" href="#">Change Password</a></li>'
+        f'<li><a class="oxd-userdropdown-link" role="menuitem" href="{WEB_PREFIX}/auth/logout">Logout</a></li>'
+        '</ul></li></ul></div></div></header>'
+        f'<div class="oxd-layout-context">{content}</div></div></div>'
+    )
+    return _document("OrangeHRM", body, page_id)
+
+
+def _list_page(title: str, list_name: str, filters: str = "", add_url: str = "") -> str:
+    """Filter form (optional), records count, table and pagination filled by the script"""
+    filter_form = (
+        '<div class="oxd-table-filter"><div class="oxd-table-filter-header">'
+        f'<h5 class="oxd-text oxd-text--h5 oxd-table-filter-title">{title}</h5></div>'
+        '<hr class="oxd-divider"><form class="oxd-form" data-filter-form novalidate>'
+        f'<div class="oxd-form-row"><div class="oxd-grid-4 orangehrm-full-width-grid">{filters}</div></div>'
+        '<hr class="oxd-divider"><div class="oxd-form-actions">'
+        '<button type="button" class="oxd-button oxd-button--medium oxd-button--ghost" data-action="reset"> Reset </button>'
+        '<button type="submit" class="oxd-button oxd-button--medium oxd-button--secondary orangehrm-left-space">'
+        ' Search </button></div></form></div>'
+    ) if filters else ""
+    add_button = (
+        '<div class="orangehrm-header-container">'
+        f'<button type="button" class="oxd-button oxd-button--medium oxd-button--secondary" data-href="{add_url}">'
+        '<i class="oxd-icon bi-plus oxd-button-icon"></i> Add </button></div><hr class="oxd-divider">'
+    ) if add_url else ""
+    return (
+        f'{filter_form}<div class="orangehrm-paper-container" data-list="{list_name}">{add_button}'
+        '<div class="orangehrm-horizontal-padding orangehrm-vertical-padding">'
+        '<span class="oxd-text oxd-text--span" data-records-count></span></div>'
+        '<div class="orangehrm-container"><div class="oxd-table" role="table">'
+        '<div class="oxd-table-header" role="rowgroup"></div><div class="oxd-table-body" role="rowgroup">'
+        '<div class="oxd-loading-spinner-container"><div class="oxd-loading-spinner"></div></div></div></div></div>'
+        '<div class="orangehrm-bottom-container"><nav class="oxd-pagination-nav" aria-label="Pagination Navigation">'
+        '</nav></div></div>'
+        '<div class="oxd-dialog-container-default" data-delete-dialog hidden><div class="oxd-dialog-sheet" role="document">'
+        '<div class="orangehrm-modal-header"><p class="oxd-text oxd-text--p oxd-text--card-title">Are you Sure?</p></div>'
+        '<div class="orangehrm-text-center-align"><p class="oxd-text oxd-text--p oxd-text--card-body">'
+        'The selected record will be permanently deleted. Are you sure you want to continue?</p></div>'
+        '<div class="orangehrm-modal-footer">'
+        '<button type="button" class="oxd-button oxd-button--medium oxd-button--ghost" data-action="cancel-delete">'
+        ' No, Cancel </button>'
+        '<button type="button" class="oxd-button oxd-button--medium oxd-button--label-danger" data-action="confirm-delete">'
+        '<i class="oxd-icon bi-trash oxd-button-icon"></i> Yes, Delete </button></div></div></div>'
+    )
+
+
+def _user_form(title: str) -> str:
+    """Add/Edit System User form"""
+    fields = (
+        _input_group("User Role", _select("userRoleId", [("1", "Admin"), ("2", "ESS")]) + _form_error(), True)
+        + _input_group("Employee Name", _autocomplete("empNumber") + _form_error(), True)
+        + _input_group("Status", _select("status", [("1", "Enabled"), ("0", "Disabled")]) + _form_error(), True)
+        + _input_group("Username", _text_input("username") + _form_error(), True)
+        + _input_group("Password", _text_input("password", "password") + _form_error())
+        + _input_group("Confirm Password", _text_input("confirmPassword", "password") + _form_error())
+    )
+    return (
+        '<div class="orangehrm-background-container"><div class="orangehrm-card-container">'
+        f'<h6 class="oxd-text oxd-text--h6 orangehrm-main-title">{title}</h6><hr class="oxd-divider">'
+        f'<form class="oxd-form" data-user-form novalidate><div class="oxd-form-row">'
+        f'<div class="oxd-grid-2 orangehrm-full-width-grid">{fields}</div></div>'
+        '<hr class="oxd-divider"><div class="oxd-form-actions">'
+        '<p class="oxd-text oxd-text--p orangehrm-form-hint">* Required</p>'
+        '<button type="button" class="oxd-button oxd-button--medium oxd-button--ghost" data-action="cancel"> Cancel </button>'
+        '<button type="submit" class="oxd-button oxd-button--medium oxd-button--secondary orangehrm-left-space">'
+        ' Save </button></div></form></div></div>'
+    )
+
+
+_DASHBOARD = (
+    '<div class="oxd-grid-3 orangehrm-dashboard-grid">'
+    '<div class="oxd-grid-item"><div class="oxd-sheet orangehrm-dashboard-widget">'
+    '<div class="orangehrm-dashboard-widget-header"><p class="oxd-text oxd-text--p">Time at Work</p></div>'
+    '<div class="orangehrm-dashboard-widget-body"><p class="oxd-text oxd-text--p" data-time-at-work>...</p>'
+    '</div></div></div>'
+    '<div class="oxd-grid-item"><div class="oxd-sheet orangehrm-dashboard-widget">'
+    '<div class="orangehrm-dashboard-widget-header"><p class="oxd-text oxd-text--p">My Actions</p></div>'
+    '<div class="orangehrm-dashboard-widget-body"><p class="oxd-text oxd-text--p">No Pending Actions</p>'
+    '</div></div></div>'
+    '<div class="oxd-grid-item"><div class="oxd-sheet orangehrm-dashboard-widget">'
+    '<div class="orangehrm-dashboard-widget-header"><p class="oxd-text oxd-text--p">Quick Launch</p></div>'
+    '<div class="orangehrm-dashboard-widget-body orangehrm-quick-launch">'
+    + "".join(f'<div class="orangehrm-quick-launch-card"><p class="oxd-text oxd-text--small">{label}</p></div>'
+              for label in ("Assign Leave", "Leave List", "Timesheets", "Apply Leave", "My Leave", "My Timesheet"))
+    + '</div></div></div></div>'
+)
+
+_USER_FILTERS = (
+    _input_group("Username", _text_input("username"))
+    + _input_group("User Role", _select("userRoleId", [("1", "Admin"), ("2", "ESS")]))
+    + _input_group("Employee Name", _autocomplete("empNumber"))
+    + _input_group("Status", _select("status", [("1", "Enabled"), ("0", "Disabled")]))
+)
+
+# Path below /web/index.php -> (module shown in the top bar, page id for the script, content, roles)
+_PAGES: Dict[str, Tuple[str, str, str, Tuple[str, ...]]] = {
+    "/dashboard/index": ("Dashboard", "dashboard", _DASHBOARD, ("Admin", "ESS")),
+    "/admin/viewSystemUsers": ("Admin", "admin-users",
+                               _list_page("System Users", "users", _USER_FILTERS,
+                                          f"{WEB_PREFIX}/admin/saveSystemUser"), ("Admin",)),
+    "/admin/saveSystemUser": ("Admin", "admin-user-form", _user_form("Add User"), ("Admin",)),
+    "/pim/viewEmployeeList": ("PIM", "pim-employees",
+                              _list_page("Employee Information", "employees"), ("Admin",)),
+    "/leave/viewLeaveList": ("Leave", "leave-list", _list_page("Leave List", "leave"), ("Admin", "ESS")),
+    "/time/viewEmployeeTimesheet": ("Time", "time",
+                                    '<div class="orangehrm-card-container"><h6 class="oxd-text oxd-text--h6">'
+                                    'Select Employee</h6></div>', ("Admin", "ESS")),
+    "/recruitment/viewCandidates": ("Recruitment", "recruitment-candidates",
+                                    _list_page("Candidates", "candidates"), ("Admin",)),
+    "/pim/viewMyDetails": ("PIM", "my-info",
+                           '<div class="orangehrm-card-container"><h6 class="oxd-text oxd-text--h6">'
+                           'Personal Details</h6></div>', ("Admin", "ESS")),
+}
+
+
+def _match_edit_page(path: str) -> Optional[Tuple[str, str, str, Tuple[str, ...]]]:
+    """Edit System User page: /admin/saveSystemUser/<id>"""
+    if re.fullmatch(r"/admin/saveSystemUser/\d+", path):
+        return "Admin", "admin-user-form", _user_form("Edit User"), ("Admin",)
+    return None
+
+
+# Static assets
+
+_APP_CSS = """
+*{box-sizing:border-box}[hidden]{display:none!important}
+body{margin:0;font-family:Nunito,Arial,sans-serif;font-size:14px;color:#64728c;background:#f6f6f6}
+.oxd-text{margin:0}.oxd-text--h5{font-size:18px;color:#303030}.oxd-text--h6{font-size:16px;color:#303030}
+.oxd-layout{display:flex;min-height:100vh}.oxd-layout-navigation{width:240px;background:#fff;flex-shrink:0}
+.oxd-layout-container{flex:1;min-width:0}.oxd-layout-context{padding:20px}
+.oxd-sidepanel-header{padding:16px}.oxd-brand img{height:40px}
+.oxd-main-menu{list-style:none;margin:0;padding:8px}
+.oxd-main-menu-item{display:block;padding:10px 16px;border-radius:20px;color:#64728c;text-decoration:none}
+.oxd-main-menu-item.active{background:#ff7b1d;color:#fff}
+.oxd-topbar{background:#fff;box-shadow:0 2px 4px rgba(0,0,0,.05)}
+.oxd-topbar-header{display:flex;justify-content:space-between;align-items:center;height:64px;padding:0 20px}
+.oxd-topbar-header-userarea ul{list-style:none;margin:0;padding:0}
+.oxd-userdropdown{position:relative;cursor:pointer}
+.oxd-userdropdown-tab{display:flex;align-items:center;gap:8px;padding:8px}
+.oxd-dropdown-menu{position:absolute;right:0;top:100%;z-index:10;list-style:none;margin:0;padding:8px 0;
+ min-width:180px;background:#fff;border-radius:8px;box-shadow:0 4px 12px rgba(0,0,0,.15)}
+.oxd-userdropdown-link{display:block;padding:8px 16px;color:#64728c;text-decoration:none}
+.oxd-table-filter,.orangehrm-paper-container,.orangehrm-card-container,.oxd-sheet{background:#fff;
+ border-radius:12px;padding:16px 20px;margin-bottom:20px}
+.oxd-grid-4,.oxd-grid-3,.oxd-grid-2{display:grid;gap:16px}.oxd-grid-4{grid-template-columns:repeat(4,1fr)}
+.oxd-grid-3{grid-template-columns:repeat(3,1fr)}.oxd-grid-2{grid-template-columns:repeat(2,1fr)}
+.oxd-input-group__label-wrapper{margin-bottom:4px}.oxd-label{font-size:12px}
+.oxd-input-field-required:after{content:" *";color:#eb0910}
+.oxd-input,.oxd-select-text,.oxd-autocomplete-text-input input{width:100%;height:38px;padding:6px 12px;
+ border:1px solid #e8eaef;border-radius:8px;background:#fff;font:inherit;color:#64728c}
+.oxd-select-wrapper,.oxd-autocomplete-wrapper{position:relative}
+.oxd-select-text{display:flex;justify-content:space-between;align-items:center;cursor:pointer}
+.oxd-select-dropdown,.oxd-autocomplete-dropdown{position:absolute;left:0;right:0;z-index:5;background:#fff;
+ border-radius:8px;box-shadow:0 4px 12px rgba(0,0,0,.15);max-height:240px;overflow:auto}
+.oxd-select-option,.oxd-autocomplete-option{padding:8px 12px;cursor:pointer}
+.oxd-select-option:hover,.oxd-autocomplete-option.--focus{background:#ff7b1d;color:#fff}
+.oxd-input-field-error-message{display:block;min-height:0;font-size:12px;color:#eb0910}
+.oxd-form-actions{display:flex;justify-content:flex-end;align-items:center;gap:8px;margin-top:12px}
+.orangehrm-form-hint{margin-right:auto}
+.oxd-button{height:38px;padding:0 20px;border-radius:20px;border:1px solid #ff7b1d;background:#fff;
+ color:#ff7b1d;font:inherit;cursor:pointer}
+.oxd-button--secondary,.oxd-button--main{background:#ff7b1d;color:#fff}
+.oxd-button--label-danger{background:#eb0910;border-color:#eb0910;color:#fff}
+.oxd-icon-button{border:0;background:transparent;cursor:pointer;padding:4px 8px;color:#64728c}
+.oxd-sr-only{position:absolute;width:1px;height:1px;overflow:hidden;clip:rect(0 0 0 0)}
+.oxd-table-row{display:flex;align-items:center;min-height:52px}
+.oxd-table-th,.oxd-table-cell{flex:1;padding:8px;overflow:hidden}
+.oxd-table-th:first-child,.oxd-table-cell:first-child{flex:0 0 40px}
+.oxd-table-header{font-weight:bold;border-bottom:1px solid #e8eaef}
+.oxd-table-card{border-radius:12px;margin:4px 0;background:#fff;box-shadow:0 1px 2px rgba(0,0,0,.05)}
+.oxd-loading-spinner-container{display:flex;justify-content:center;padding:24px}
+.oxd-loading-spinner{width:40px;height:40px;border:4px solid #e8eaef;border-top-color:#ff7b1d;
+ border-radius:50%;animation:oxd-spin 1s linear infinite}
+@keyframes oxd-spin{to{transform:rotate(360deg)}}
+.oxd-pagination__ul{display:flex;justify-content:center;gap:4px;list-style:none;padding:0}
+.oxd-pagination-page-item{min-width:32px;height:32px;border:0;border-radius:50%;background:transparent;cursor:pointer}
+.oxd-pagination-page-item--current{background:#e8eaef}
+.oxd-dialog-container-default{position:fixed;inset:0;z-index:20;display:flex;align-items:center;
+ justify-content:center;background:rgba(0,0,0,.4)}
+.oxd-dialog-sheet{background:#fff;border-radius:12px;padding:20px;max-width:480px}
+.orangehrm-modal-footer{display:flex;justify-content:center;gap:8px;margin-top:16px}
+.oxd-toast-container{position:fixed;left:20px;bottom:20px;z-index:30}
+.oxd-toast{min-width:300px;margin-top:8px;padding:12px 16px;border-radius:8px;background:#fff;
+ box-shadow:0 4px 12px rgba(0,0,0,.15);border-left:6px solid #ff7b1d}
+.oxd-toast--success{border-left-color:#5fba2c}.oxd-toast--error{border-left-color:#eb0910}
+.orangehrm-dashboard-widget{min-height:160px}.orangehrm-quick-launch{display:grid;
+ grid-template-columns:repeat(3,1fr);gap:8px}
+.orangehrm-login-layout{display:flex;align-items:center;justify-content:center;min-height:100vh;padding:16px}
+.orangehrm-login-container{width:100%;max-width:480px;background:#fff;border-radius:16px;padding:24px;
+ box-shadow:0 4px 12px rgba(0,0,0,.1)}
+.orangehrm-login-branding{text-align:center}.orangehrm-login-branding img{width:200px;height:60px}
+.orangehrm-login-title{text-align:center;margin:16px 0}.orangehrm-login-error{margin-bottom:12px}
+.oxd-alert{padding:12px;border-radius:8px;background:#fde8e8;color:#eb0910}
+.orangehrm-login-button{width:100%}.orangehrm-login-forgot{text-align:center;margin-top:16px}
+.orangehrm-login-forgot-header{color:#ff7b1d;text-decoration:none}
+@media (max-width:800px){.oxd-layout-navigation{display:none}.oxd-grid-4,.oxd-grid-3,.oxd-grid-2{
+ grid-template-columns:1fr}}
+"""
+
+_APP_JS = r"""
+(function () {
+  'use strict';
+  var WEB = '/web/index.php';
+  var API = WEB + '/api/v2';
+  var PAGE_SIZE = 50;
+
+  function api(method, path, body) {
+    return fetch(API + path, {
+      method: method,
+      credentials: 'same-origin',
+      headers: {'Accept': 'application/json', 'Content-Type': 'application/json'},
+      body: body === undefined ? undefined : JSON.stringify(body)
+    }).then(function (response) {
+      return response.json().catch(function () { return {}; }).then(function (payload) {
+        return {ok: response.ok, status: response.status, payload: payload};
+      });
+    });
+  }
+
+  function escapeHtml(value) {
+    return String(value === null || value === undefined ? '' : value).replace(/[&<>"']/g, function (c) {
+      return {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}[c];
+    });
+  }
+
+  function fullName(person) {
+    if (!person) return '';
+    return [person.firstName, person.middleName, person.lastName].filter(Boolean).join(' ');
+  }
+
+  function toast(kind, message) {
+    var container = document.getElementById('oxd-toaster_1');
+    var item = document.createElement('div');
+    item.className = 'oxd-toast oxd-toast--' + kind + ' oxd-toast-container--toast';
+    item.innerHTML = '<div class="oxd-toast-start"><div class="oxd-toast-content oxd-toast-content--' + kind + '">' +
+      '<p class="oxd-text oxd-text--p oxd-text--toast-title oxd-toast-content-text">' +
+      (kind === 'success' ? 'Success' : kind === 'error' ? 'Error' : 'Info') + '</p>' +
+      '<p class="oxd-text oxd-text--p oxd-text--toast-message oxd-toast-content-text">' + escapeHtml(message) +
+      '</p></div></div>';
+    container.appendChild(item);
+    setTimeout(function () { item.remove(); }, 3000);
+  }
+
+  // Select boxes
+
+  function initSelects(root) {
+    root.querySelectorAll('.oxd-select-wrapper').forEach(function (wrapper) {
+      var text = wrapper.querySelector('.oxd-select-text-input');
+      var dropdown = wrapper.querySelector('.oxd-select-dropdown');
+      wrapper.querySelector('.oxd-select-text').addEventListener('click', function () {
+        dropdown.hidden = !dropdown.hidden;
+      });
+      dropdown.addEventListener('click', function (event) {
+        var option = event.target.closest('.oxd-select-option');
+        if (!option) return;
+        setSelect(wrapper, option.dataset.value);
+        dropdown.hidden = true;
+      });
+      document.addEventListener('click', function (event) {
+        if (!wrapper.contains(event.target)) dropdown.hidden = true;
+      });
+      wrapper.reset = function () { setSelect(wrapper, ''); };
+    });
+  }
+
+  function setSelect(wrapper, value) {
+    var option = wrapper.querySelector('.oxd-select-option[data-value="' + value + '"]');
+    wrapper.dataset.value = value;
+    wrapper.querySelector('.oxd-select-text-input').textContent = option ? option.textContent : '-- Select --';
+  }
+
+  // Employee autocomplete
+
+  function initAutocompletes(root) {
+    root.querySelectorAll('.oxd-autocomplete-wrapper').forEach(function (wrapper) {
+      var input = wrapper.querySelector('input');
+      var dropdown = wrapper.querySelector('.oxd-autocomplete-dropdown');
+      var timer = null;
+      var sequence = 0;
+      var active = -1;
+
+      function options() {
+        return dropdown.querySelectorAll('.oxd-autocomplete-option[data-value]');
+      }
+
+      function highlight(index) {
+        var items = options();
+        if (!items.length) return;
+        active = (index + items.length) % items.length;
+        items.forEach(function (item, i) { item.classList.toggle('--focus', i === active); });
+      }
+
+      function choose(option) {
+        wrapper.dataset.value = option.dataset.value;
+        input.value = option.textContent;
+        dropdown.hidden = true;
+      }
+
+      input.addEventListener('input', function () {
+        var query = input.value.trim();
+        wrapper.dataset.value = '';
+        active = -1;
+        clearTimeout(timer);
+        if (!query) {
+          dropdown.hidden = true;
+          return;
+        }
+        dropdown.innerHTML = '<div role="option" class="oxd-autocomplete-option">Searching....</div>';
+        dropdown.hidden = false;
+        timer = setTimeout(function () {
+          var current = ++sequence;
+          api('GET', '/pim/employees?nameOrId=' + encodeURIComponent(query) + '&limit=10').then(function (result) {
+            if (current !== sequence) return;
+            var employees = result.ok ? result.payload.data : [];
+            dropdown.innerHTML = employees.length ? employees.map(function (employee) {
+              return '<div role="option" class="oxd-autocomplete-option" data-value="' + employee.empNumber +
+                '"><span>' + escapeHtml(fullName(employee)) + '</span></div>';
+            }).join('') : '<div role="option" class="oxd-autocomplete-option">No Records Found</div>';
+          });
+        }, 200);
+      });
+
+      input.addEventListener('keydown', function (event) {
+        if (dropdown.hidden) return;
+        if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
+          event.preventDefault();
+          highlight(active + (event.key === 'ArrowDown' ? 1 : -1));
+        } else if (event.key === 'Enter') {
+          event.preventDefault();
+          if (active >= 0) choose(options()[active]);
+        } else if (event.key === 'Escape') {
+          dropdown.hidden = true;
+        }
+      });
+
+      dropdown.addEventListener('mousedown', function (event) {
+        var option = event.target.closest('.oxd-autocomplete-option[data-value]');
+        if (option) {
+          event.preventDefault();
+          choose(option);
+        }
+      });
+
+      document.addEventListener('click', function (event) {
+        if (!wrapper.contains(event.target)) dropdown.hidden = true;
+      });
+
+      wrapper.reset = function () {
+        wrapper.dataset.value = '';
+        input.value = '';
+        dropdown.hidden = true;
+      };
+      wrapper.setValue = function (value, label) {
+        wrapper.dataset.value = value;
+        input.value = label;
+      };
+    });
+  }
+
+  // Lists
+
+  function actions(record) {
+    return '<div class="oxd-table-cell-actions">' +
+      '<button type="button" class="oxd-icon-button oxd-table-cell-action-space" data-action="delete" data-id="' +
+      record.id + '"><i class="oxd-icon bi-trash"></i><span class="oxd-sr-only">Delete</span></button>' +
+      (record.editUrl ? '<button type="button" class="oxd-icon-button oxd-table-cell-action-space" data-href="' +
+        record.editUrl + '"><i class="oxd-icon bi-pencil-fill"></i><span class="oxd-sr-only">Edit</span></button>' : '') +
+      '</div>';
+  }
+
+  var LISTS = {
+    users: {
+      path: '/admin/users',
+      headers: ['Username', 'User Role', 'Employee Name', 'Status', 'Actions'],
+      row: function (user) {
+        return [escapeHtml(user.userName), escapeHtml(user.userRole.displayName), escapeHtml(fullName(user.employee)),
+          user.status ? 'Enabled' : 'Disabled',
+          actions({id: user.id, editUrl: WEB + '/admin/saveSystemUser/' + user.id})];
+      }
+    },
+    employees: {
+      path: '/pim/employees',
+      headers: ['Id', 'First (& Middle) Name', 'Last Name', 'Job Title', 'Employment Status', 'Sub Unit',
+        'Supervisor', 'Actions'],
+      row: function (employee) {
+        return [escapeHtml(employee.employeeId),
+          escapeHtml([employee.firstName, employee.middleName].filter(Boolean).join(' ')),
+          escapeHtml(employee.lastName), '', '', '', '', actions({id: employee.empNumber})];
+      }
+    },
+    leave: {
+      path: '/leave/leave-requests',
+      headers: ['Date', 'Employee Name', 'Leave Type', 'Number of Days', 'Status', 'Comments', 'Actions'],
+      row: function (request) {
+        var dates = request.dates.fromDate === request.dates.toDate ? request.dates.fromDate
+          : request.dates.fromDate + ' to ' + request.dates.toDate;
+        return [dates, escapeHtml(fullName(request.employee)), escapeHtml(request.leaveType.name),
+          request.numberOfDays.toFixed(2),
+          escapeHtml(request.leaveBreakdown.map(function (b) { return b.name; }).join(', ')),
+          escapeHtml(request.lastComment ? request.lastComment.comment : ''), actions({id: request.id})];
+      }
+    },
+    candidates: {
+      path: '/recruitment/candidates',
+      headers: ['Vacancy', 'Candidate', 'Hiring Manager', 'Date of Application', 'Status', 'Actions'],
+      row: function (candidate) {
+        return [escapeHtml(candidate.vacancy.name), escapeHtml(fullName(candidate)), '',
+          candidate.dateOfApplication, escapeHtml(candidate.status.label), ''];
+      }
+    }
+  };
+
+  function initList(container) {
+    var config = LISTS[container.dataset.list];
+    var form = document.querySelector('[data-filter-form]');
+    var table = container.querySelector('.oxd-table');
+    var body = table.querySelector('.oxd-table-body');
+    var count = container.querySelector('[data-records-count]');
+    var nav = container.querySelector('.oxd-pagination-nav');
+    var dialog = document.querySelector('[data-delete-dialog]');
+    var state = {page: 1, filters: {}, deleteId: null};
+
+    table.querySelector('.oxd-table-header').innerHTML = '<div class="oxd-table-header-row oxd-table-row" role="row">' +
+      '<div class="oxd-table-th" role="columnheader"></div>' +
+      config.headers.map(function (header) {
+        return '<div class="oxd-table-th" role="columnheader">' + header + '</div>';
+      }).join('') + '</div>';
+
+    function query() {
+      var params = ['limit=' + PAGE_SIZE, 'offset=' + (state.page - 1) * PAGE_SIZE];
+      Object.keys(state.filters).forEach(function (key) {
+        if (state.filters[key] !== '') params.push(key + '=' + encodeURIComponent(state.filters[key]));
+      });
+      return config.path + '?' + params.join('&');
+    }
+
+    function load() {
+      body.innerHTML = '<div class="oxd-loading-spinner-container"><div class="oxd-loading-spinner"></div></div>';
+      return api('GET', query()).then(function (result) {
+        var records = result.ok ? result.payload.data : [];
+        var total = result.ok ? result.payload.meta.total : 0;
+        if (!result.ok) toast('error', 'Unexpected Error Occurred');
+        body.innerHTML = records.map(function (record) {
+          return '<div class="oxd-table-card"><div class="oxd-table-row oxd-table-row--with-border" role="row">' +
+            '<div class="oxd-table-cell oxd-padding-cell" role="cell"></div>' +
+            config.row(record).map(function (cell) {
+              return '<div class="oxd-table-cell oxd-padding-cell" role="cell"><div>' + cell + '</div></div>';
+            }).join('') + '</div></div>';
+        }).join('');
+        count.textContent = total === 0 ? 'No Records Found'
+          : '(' + total + ') Record' + (total === 1 ? '' : 's') + ' Found';
+        renderPagination(Math.ceil(total / PAGE_SIZE));
+      });
+    }
+
+    function renderPagination(pages) {
+      if (pages <= 1) {
+        nav.innerHTML = '';
+        return;
+      }
+      var items = [];
+      if (state.page > 1) {
+        items.push('<li><button type="button" class="oxd-pagination-page-item oxd-pagination-page-item--previous-next"' +
+          ' data-page="' + (state.page - 1) + '"><i class="oxd-icon bi-chevron-left"></i></button></li>');
+      }
+      for (var page = 1; page <= pages; page++) {
+        items.push('<li><button type="button" class="oxd-pagination-page-item oxd-pagination-page-item--page' +
+          (page === state.page ? ' oxd-pagination-page-item--current' : '') + '" data-page="' + page + '">' +
+          page + '</button></li>');
+      }
+      if (state.page < pages) {
+        items.push('<li><button type="button" class="oxd-pagination-page-item oxd-pagination-page-item--previous-next"' +
+          ' data-page="' + (state.page + 1) + '"><i class="oxd-icon bi-chevron-right"></i></button></li>');
+      }
+      nav.innerHTML = '<ul class="oxd-pagination__ul">' + items.join('') + '</ul>';
+    }
+
+    nav.addEventListener('click', function (event) {
+      var button = event.target.closest('[data-page]');
+      if (!button) return;
+      state.page = Number(button.dataset.page);
+      load();
+    });
+
+    body.addEventListener('click', function (event) {
+      var button = event.target.closest('[data-action="delete"]');
+      if (!button) return;
+      state.deleteId = Number(button.dataset.id);
+      dialog.hidden = false;
+    });
+
+    dialog.addEventListener('click', function (event) {
+      var button = event.target.closest('[data-action]');
+      if (!button) return;
+      dialog.hidden = true;
+      if (button.dataset.action !== 'confirm-delete') return;
+      api('DELETE', config.path, {ids: [state.deleteId]}).then(function (result) {
+        toast(result.ok ? 'success' : 'error', result.ok ? 'Successfully Deleted' : 'Unexpected Error Occurred');
+        load();
+      });
+    });
+
+    if (form) {
+      form.addEventListener('submit', function (event) {
+        event.preventDefault();
+        state.page = 1;
+        state.filters = {username: form.querySelector('input[name="username"]').value.trim()};
+        form.querySelectorAll('[data-name]').forEach(function (wrapper) {
+          state.filters[wrapper.dataset.name] = wrapper.dataset.value;
+        });
+        load().then(function () {
+          if (count.textContent === 'No Records Found') toast('info', 'No Records Found');
+        });
+      });
+      form.querySelector('[data-action="reset"]').addEventListener('click', function () {
+        form.querySelector('input[name="username"]').value = '';
+        form.querySelectorAll('[data-name]').forEach(function (wrapper) { wrapper.reset(); });
+        state.page = 1;
+        state.filters = {};
+        load();
+      });
+    }
+
+    load();
+  }
+
+  // Add/Edit user form
+
+  function initUserForm(form) {
+    var match = location.pathname.match(/saveSystemUser\/(\d+)$/);
+    var userId = match ? match[1] : null;
+    var listUrl = WEB + '/admin/viewSystemUsers';
+
+    function field(name) {
+      return form.querySelector('[name="' + name + '"], [data-name="' + name + '"]');
+    }
+
+    function setError(name, message) {
+      var group = field(name).closest('.oxd-input-group');
+      group.querySelector('.oxd-input-field-error-message').textContent = message || '';
+    }
+
+    if (userId) {
+      api('GET', '/admin/users/' + userId).then(function (result) {
+        if (!result.ok) return;
+        var user = result.payload.data;
+        setSelect(field('userRoleId'), String(user.userRole.id));
+        setSelect(field('status'), user.status ? '1' : '0');
+        field('empNumber').setValue(user.employee.empNumber, fullName(user.employee));
+        field('username').value = user.userName;
+      });
+    }
+
+    form.querySelector('[data-action="cancel"]').addEventListener('click', function () {
+      location.assign(listUrl);
+    });
+
+    form.addEventListener('submit', function (event) {
+      event.preventDefault();
+      var payload = {
+        username: field('username').value.trim(),
+        password: field('password').value,
+        status: field('status').dataset.value === '1',
+        userRoleId: Number(field('userRoleId').dataset.value) || null,
+        empNumber: Number(field('empNumber').dataset.value) || null
+      };
+      var errors = {};
+      ['userRoleId', 'empNumber'].forEach(function (name) { if (!payload[name]) errors[name] = 'Required'; });
+      if (field('status').dataset.value === '') errors.status = 'Required';
+      if (!payload.username) errors.username = 'Required';
+      if (!userId && !payload.password) errors.password = 'Required';
+      if (payload.password !== field('confirmPassword').value) errors.confirmPassword = 'Passwords do not match';
+      ['userRoleId', 'empNumber', 'status', 'username', 'password', 'confirmPassword'].forEach(function (name) {
+        setError(name, errors[name]);
+      });
+      if (Object.keys(errors).length) return;
+      if (userId && !payload.password) delete payload.password;
+
+      api(userId ? 'PUT' : 'POST', userId ? '/admin/users/' + userId : '/admin/users', payload).then(function (result) {
+        if (result.ok) {
+          toast('success', userId ? 'Successfully Updated' : 'Successfully Saved');
+          setTimeout(function () { location.assign(listUrl); }, 1500);
+        } else if (result.status === 422) {
+          var invalid = result.payload.error.data.invalidParamKeys;
+          Object.keys(invalid).forEach(function (name) { setError(name, invalid[name]); });
+        } else {
+          toast('error', 'Unexpected Error Occurred');
+        }
+      });
+    });
+  }
+
+  // Login form
+
+  function initLoginForm(form) {
+    form.addEventListener('submit', function (event) {
+      var missing = false;
+      ['username', 'password'].forEach(function (name) {
+        var input = form.querySelector('[name="' + name + '"]');
+        var message = input.closest('.oxd-input-group').querySelector('.oxd-input-field-error-message');
+        message.textContent = input.value ? '' : 'Required';
+        missing = missing || !input.value;
+      });
+      if (missing) event.preventDefault();
+    });
+  }
+
+  // Layout
+
+  function initLayout() {
+    var dropdown = document.querySelector('.oxd-userdropdown');
+    if (dropdown) {
+      var menu = dropdown.querySelector('.oxd-dropdown-menu');
+      dropdown.querySelector('.oxd-userdropdown-tab').addEventListener('click', function () {
+        menu.hidden = !menu.hidden;
+      });
+      document.addEventListener('click', function (event) {
+        if (!dropdown.contains(event.target)) menu.hidden = true;
+      });
+    }
+    document.addEventListener('click', function (event) {
+      var link = event.target.closest('button[data-href]');
+      if (link) location.assign(link.dataset.href);
+    });
+  }
+
+  function initDashboard() {
+    var target = document.querySelector('[data-time-at-work]');
+    api('GET', '/dashboard/employees/time-at-work').then(function (result) {
+      var total = result.ok ? result.payload.meta.currentDay.totalTime : {hours: 0, minutes: 0};
+      target.textContent = 'Punched Out - ' + total.hours + ' Hrs ' + total.minutes + ' Min Today';
+    });
+  }
+
+  initLayout();
+  initSelects(document);
+  initAutocompletes(document);
+  var page = document.body.dataset.page;
+  var login = page === 'login' && document.querySelector('.orangehrm-login-form form');
+  if (login) initLoginForm(login);
+  if (page === 'dashboard') initDashboard();
+  var list = document.querySelector('[data-list]');
+  if (list) initList(list);
+  var userForm = document.querySelector('[data-user-form]');
+  if (userForm) initUserForm(userForm);
+})();
+"""
+
+_LOGO_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="200" height="60" viewBox="0 0 200 60">'
+    '<rect width="200" height="60" rx="8" fill="#ff7b1d"/>'
+    '<text x="100" y="38" font-family="Arial" font-size="22" font-weight="bold" fill="#fff" '
+    'text-anchor="middle">OrangeHRM</text></svg>'
+)
+
+
+def _static(content_type: str, content: str) -> Tuple[str, bytes, str]:
+    body = content.encode("utf-8")
+    return content_type, body, f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+
+
+_STATIC_ASSETS: Dict[str, Tuple[str, bytes, str]] = {
+    "/web/dist/css/app.css": _static("text/css; charset=UTF-8", _APP_CSS),
+    "/web/dist/js/app.js": _static("application/javascript; charset=UTF-8", _APP_JS),
+    "/web/images/ohrm_branding.svg": _static("image/svg+xml", _LOGO_SVG),
+}
+
+
+# Run the stand-in on its own
+if __name__ == "__main__":
+    server = StandInServer().start()
+    print(f"OrangeHRM stand-in running on {server.url} - press Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
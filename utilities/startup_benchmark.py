@@ -0,0 +1,93 @@
+"""
+Startup benchmark: cost of importing the framework and of collecting the tests
+
+Every xdist worker, every --collect-only and every helper script imports
+conftest (and through it config.settings and utilities.*). This script times
+that in fresh interpreters and lists which heavy third-party packages the
+import pulls in:
+
+    python -m utilities.startup_benchmark --runs 7
+    python -m utilities.startup_benchmark --baseline HEAD~1    # compare with a commit
+"""
+import argparse
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Packages that should only be imported by the code that needs them
+HEAVY_PACKAGES = ("aiohttp", "requests", "pydantic", "faker", "playwright", "dotenv")
+
+IMPORT_CONFTEST = [sys.executable, "-c", "import conftest"]
+COLLECT_ONLY = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", "-o", "addopts="]
+
+_IMPORTTIME = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def _median_seconds(command: List[str], cwd: Path, runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(command, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def heavy_imports(cwd: Path) -> Dict[str, float]:
+    """Milliseconds spent importing each heavy package when conftest is imported"""
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", "import conftest"], cwd=cwd,
+                            capture_output=True, text=True, check=True).stderr
+    found = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match and match.group(3) in HEAVY_PACKAGES:
+            found[match.group(3)] = int(match.group(1)) / 1000
+    return found
+
+
+def measure(cwd: Path, runs: int) -> Dict[str, object]:
+    """Median conftest import and collection times of the tree in cwd"""
+    return {
+        "import_conftest": _median_seconds(IMPORT_CONFTEST, cwd, runs),
+        "collect_only": _median_seconds(COLLECT_ONLY, cwd, runs),
+        "heavy_imports": heavy_imports(cwd),
+    }
+
+
+def _report(label: str, result: Dict[str, object]):
+    heavy = result["heavy_imports"]
+    print(f"{label}:")
+    print(f"  import conftest      {result['import_conftest'] * 1000:8.0f} ms")
+    print(f"  pytest --collect-only {result['collect_only'] * 1000:7.0f} ms")
+    print("  heavy imports        " + (", ".join(f"{name} {ms:.0f} ms" for name, ms in heavy.items()) or "none"))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement (median)")
+    parser.add_argument("--baseline", help="Git revision to measure for comparison, in a temporary worktree")
+    args = parser.parse_args(argv)
+
+    current = measure(ROOT_DIR, args.runs)
+    if args.baseline:
+        worktree = Path(tempfile.mkdtemp(prefix="startup-baseline-")) / "tree"
+        subprocess.run(["git", "worktree", "add", "--detach", str(worktree), args.baseline],
+                       cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        try:
+            _report(f"baseline ({args.baseline})", measure(worktree, args.runs))
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], cwd=ROOT_DIR, check=False)
+            shutil.rmtree(worktree.parent, ignore_errors=True)
+    _report("current", current)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
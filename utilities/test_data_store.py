@@ -0,0 +1,228 @@
+"""
+Typed test data loaded from config/test_data.json
+
+Each section of the data file has a pydantic model. A section is read and
+validated the first time a test asks for it, then kept for the session.
+Large sections can live in their own file, config/test_data/<section>.json,
+which is only read by sessions that use it. Validated sections are also
+pickled to TEST_DATA_CACHE_DIR under a key made of the source file hash, the
+section type and the source of this module (which defines the models and
+their validators), so later sessions skip validation until any of them
+changes. Building a TypeAdapter costs more than validating a section, so it
+is only built on a cache miss.
+"""
+import functools
+import hashlib
+import json
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from pydantic import (
+    BaseModel, ConfigDict, Field, PositiveFloat, PositiveInt, TypeAdapter, ValidationError, model_validator
+)
+from config.settings import TEST_DATA_CACHE_DIR, TEST_DATA_FILE, TEST_DATA_SECTIONS_DIR
+from utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdminUser(BaseModel):
+    """Login of an admin account"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    username: str = Field(min_length=1)
+    password: str = Field(min_length=1)
+    role: str
+
+
+class EmployeeRecord(BaseModel):
+    """Employee form input (fields may be empty for negative tests)"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    firstName: str
+    middleName: str = ""
+    lastName: str
+    # OrangeHRM accepts at most 10 characters
+    employeeId: Optional[str] = Field(default=None, max_length=10)
+
+
+class EmployeeData(BaseModel):
+    """Valid and invalid employee form input"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    valid: EmployeeRecord
+    invalid: EmployeeRecord
+
+
+class Pagination(BaseModel):
+    """Page sizes of list views"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    default_page_size: PositiveInt
+    max_page_size: PositiveInt
+
+    @model_validator(mode="after")
+    def _default_within_max(self) -> "Pagination":
+        if self.default_page_size > self.max_page_size:
+            raise ValueError("default_page_size is larger than max_page_size")
+        return self
+
+
+class BudgetConfig(BaseModel):
+    """Performance budget of one page object interaction (see utilities.perf_budget)"""
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    max_ms: PositiveFloat
+    percentile: float = Field(default=75, gt=0, le=100)
+    min_samples: PositiveInt = 3
+
+
+# Section name -> type it is validated as; other sections are returned as parsed JSON
+SECTION_TYPES: Dict[str, Any] = {
+    "admin_users": List[AdminUser],
+    "employee_data": EmployeeData,
+    "user_roles": List[str],
+    "search_keywords": List[str],
+    "pagination": Pagination,
+    # Interaction label (e.g. "AdminPage.search_by_username") -> budget
+    "performance_budgets": Dict[str, BudgetConfig],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _models_fingerprint() -> bytes:
+    """Hash of this module's source, which defines the models and their validators"""
+    return hashlib.sha256(Path(__file__).read_bytes()).digest()
+
+
+class TestDataError(ValueError):
+    """Raised when a test data section is missing or does not match its model"""
+
+
+class TestDataStore:
+    """Lazily loaded, validated test data sections"""
+
+    __test__ = False
+
+    def __init__(self, data_file: Path = TEST_DATA_FILE, sections_dir: Path = TEST_DATA_SECTIONS_DIR,
+                 cache_dir: Optional[Path] = TEST_DATA_CACHE_DIR, section_types: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            data_file: JSON file with one key per section
+            sections_dir: Directory of <section>.json files, which take precedence
+            cache_dir: Directory of validated sections; None disables the disk cache
+            section_types: Section name -> type; SECTION_TYPES by default
+        """
+        self.data_file = data_file
+        self.sections_dir = sections_dir
+        self.cache_dir = cache_dir
+        self.section_types = SECTION_TYPES if section_types is None else section_types
+        self._sections: Dict[str, Any] = {}
+        # Raw bytes of the files read so far, and the parsed data file
+        self._raw: Dict[Path, bytes] = {}
+        self._data_file_json: Optional[Dict[str, Any]] = None
+        self._lock = threading.RLock()
+
+    @property
+    def admin_users(self) -> List[AdminUser]:
+        return self.section("admin_users")
+
+    @property
+    def employee_data(self) -> EmployeeData:
+        return self.section("employee_data")
+
+    @property
+    def user_roles(self) -> List[str]:
+        return self.section("user_roles")
+
+    @property
+    def search_keywords(self) -> List[str]:
+        return self.section("search_keywords")
+
+    @property
+    def pagination(self) -> Pagination:
+        return self.section("pagination")
+
+    def __getitem__(self, name: str) -> Any:
+        return self.section(name)
+
+    def section(self, name: str) -> Any:
+        """
+        Return a section, loading and validating it on first use
+
+        Args:
+            name: Section name (key of the data file, or name of a section file)
+
+        Returns:
+            The section as its model type, or as parsed JSON if it has none
+
+        Raises:
+            TestDataError: The section does not exist or is invalid
+        """
+        with self._lock:
+            if name not in self._sections:
+                self._sections[name] = self._load(name)
+            return self._sections[name]
+
+    def _source(self, name: str) -> Path:
+        section_file = self.sections_dir / f"{name}.json"
+        return section_file if section_file.exists() else self.data_file
+
+    def _read(self, path: Path) -> bytes:
+        if path not in self._raw:
+            self._raw[path] = path.read_bytes()
+        return self._raw[path]
+
+    def _load(self, name: str) -> Any:
+        source = self._source(name)
+        section_type = self.section_types.get(name)
+
+        cache_file = None
+        if section_type is not None and self.cache_dir is not None:
+            key_parts = (self._read(source), repr(section_type).encode("utf-8"), _models_fingerprint())
+            key = hashlib.sha256(b"\0".join(key_parts)).hexdigest()[:16]
+            cache_file = self.cache_dir / f"{name}-{key}.pickle"
+            if cache_file.exists():
+                try:
+                    with open(cache_file, "rb") as f:
+                        return pickle.load(f)
+                except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+                    logger.warning(f"Ignoring unreadable test data cache {cache_file.name}: {e}")
+
+        raw = self._raw_section(name, source)
+        if section_type is None:
+            return raw
+        try:
+            value = TypeAdapter(section_type).validate_python(raw)
+        except ValidationError as e:
+            raise TestDataError(f"Invalid test data section '{name}' in {source}:\n{e}") from e
+
+        if cache_file is not None:
+            self._store(cache_file, name, value)
+        return value
+
+    def _raw_section(self, name: str, source: Path) -> Any:
+        """Parsed JSON of the section"""
+        if source != self.data_file:
+            return json.loads(self._read(source))
+        if self._data_file_json is None:
+            self._data_file_json = json.loads(self._read(source))
+        if name not in self._data_file_json:
+            raise TestDataError(f"No test data section '{name}' in {source} or {self.sections_dir}")
+        return self._data_file_json[name]
+
+    def _store(self, cache_file: Path, name: str, value: Any):
+        """Write a validated section to the cache, replacing older versions of it"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{name}-*.pickle"):
+                stale.unlink(missing_ok=True)
+            # Workers may write the same entry at once; os.replace keeps it whole
+            temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_file, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not cache test data section '{name}': {e}")
@@ -0,0 +1,247 @@
+"""
+Front-end performance metrics captured while the UI tests run (opt-in)
+
+install() adds PerformanceObservers for LCP, layout shifts and long tasks to a
+browser context. BasePage reads them around every navigation it waits for:
+a full page load yields Navigation Timing, paint timings, LCP, CLS and long
+tasks; an SPA route change yields the layout shift and long tasks that
+happened during it. Samples are tagged with the logical page (login,
+dashboard, admin, pim, ...) and appended to reports/web_vitals/<worker>.jsonl;
+the controlling process aggregates them into p50/p95/p99 per page.
+"""
+from __future__ import annotations
+import html
+import json
+import os
+import shutil
+import weakref
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from config.settings import WEB_VITALS_DIR
+from utilities.helpers import get_worker_id
+from utilities.run_stats import percentile
+from utilities.logger import get_logger
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+
+logger = get_logger(__name__)
+
+# Runs before any page script, so buffered entries from the start of the load are seen
+_INIT_SCRIPT = """
+(() => {
+    if (window.__webVitals) return;
+    const vitals = window.__webVitals = {lcp: null, cls: 0, longTasks: 0, longTaskMs: 0, blockingMs: 0};
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe('largest-contentful-paint', entry => { vitals.lcp = entry.startTime; });
+    observe('layout-shift', entry => { if (!entry.hadRecentInput) vitals.cls += entry.value; });
+    observe('longtask', entry => {
+        vitals.longTasks += 1;
+        vitals.longTaskMs += entry.duration;
+        vitals.blockingMs += Math.max(0, entry.duration - 50);
+    });
+})();
+"""
+
+_COLLECT_JS = """
+() => {
+    const vitals = window.__webVitals || {};
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = {};
+    performance.getEntriesByType('paint').forEach(entry => { paint[entry.name] = entry.startTime; });
+    return {
+        url: location.href,
+        timeOrigin: performance.timeOrigin,
+        navigation: nav ? {
+            ttfb_ms: nav.responseStart,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+            load_ms: nav.loadEventEnd,
+            transfer_kb: nav.transferSize / 1024,
+        } : null,
+        fp_ms: paint['first-paint'] ?? null,
+        fcp_ms: paint['first-contentful-paint'] ?? null,
+        lcp_ms: vitals.lcp ?? null,
+        cls: vitals.cls ?? 0,
+        long_tasks: vitals.longTasks ?? 0,
+        long_task_ms: vitals.longTaskMs ?? 0,
+        blocking_ms: vitals.blockingMs ?? 0,
+    };
+}
+"""
+
+# URL path fragment -> logical page, first match wins
+PAGE_NAMES = (
+    ("/auth/login", "login"),
+    ("/dashboard/", "dashboard"),
+    ("/admin/", "admin"),
+    ("/pim/", "pim"),
+    ("/leave/", "leave"),
+    ("/time/", "time"),
+    ("/recruitment/", "recruitment"),
+)
+
+# Counters reported as the change over an SPA route change
+_DELTA_METRICS = ("cls", "long_tasks", "long_task_ms", "blocking_ms")
+
+# Metrics shown in the report, in this order
+REPORTED_METRICS = ("ready_ms", "ttfb_ms", "fcp_ms", "lcp_ms", "dom_content_loaded_ms", "load_ms",
+                    "cls", "long_task_ms", "blocking_ms")
+
+_installed: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+
+def install(context: BrowserContext):
+    """Observe LCP, layout shifts and long tasks in every page of context"""
+    context.add_init_script(_INIT_SCRIPT)
+    _installed.add(context)
+
+
+def is_installed(page: Page) -> bool:
+    """Whether metrics are collected for page (checked without a browser round trip)"""
+    return page.context in _installed
+
+
+def page_name(url: str) -> str:
+    """Logical page of a URL, e.g. "admin" for .../admin/viewSystemUsers"""
+    for fragment, name in PAGE_NAMES:
+        if fragment in url:
+            return name
+    return url.split("?")[0].rstrip("/").rsplit("/", 1)[-1] or "other"
+
+
+def mark(page: Page) -> Optional[Dict[str, Any]]:
+    """Current counters of page, taken before a navigation"""
+    try:
+        return page.evaluate(_COLLECT_JS)
+    except Exception as e:
+        logger.debug("Web vitals mark failed: %s", e)
+        return None
+
+
+def capture(page: Page, before: Optional[Dict[str, Any]], ready_ms: float) -> Optional[Dict[str, Any]]:
+    """
+    Record the metrics of the navigation that happened since before was taken
+
+    Args:
+        page: Page that navigated
+        before: Result of mark() taken before the navigation started
+        ready_ms: Time until the page's readiness signals were met
+
+    Returns:
+        Recorded sample, or None if the page could not be read
+    """
+    try:
+        after = page.evaluate(_COLLECT_JS)
+        full_load = before is None or after["timeOrigin"] != before["timeOrigin"]
+        if full_load and after["navigation"] and not after["navigation"]["load_ms"]:
+            # Ready before the load event: wait for it so load timings are complete
+            page.wait_for_load_state("load")
+            after = page.evaluate(_COLLECT_JS)
+    except Exception as e:
+        logger.debug("Web vitals capture failed: %s", e)
+        return None
+
+    sample: Dict[str, Any] = {
+        "page": page_name(after["url"]),
+        "kind": "load" if full_load else "spa",
+        "ready_ms": round(ready_ms, 1),
+        "test": os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0],
+    }
+    if full_load:
+        sample.update(after["navigation"] or {})
+        sample.update({key: after[key] for key in ("fp_ms", "fcp_ms", "lcp_ms", *_DELTA_METRICS)})
+    else:
+        sample.update({key: after[key] - before.get(key, 0) for key in _DELTA_METRICS})
+    record_sample(sample)
+    return sample
+
+
+def record_sample(sample: Dict[str, Any], vitals_dir: Path = WEB_VITALS_DIR):
+    """Append one sample to this worker's metrics file"""
+    vitals_dir.mkdir(parents=True, exist_ok=True)
+    with open(vitals_dir / f"{get_worker_id()}.jsonl", 'a', encoding='utf-8') as f:
+        f.write(json.dumps(sample) + "\n")
+
+
+def load_samples(vitals_dir: Path = WEB_VITALS_DIR) -> List[Dict[str, Any]]:
+    """Read the samples written by all workers"""
+    samples = []
+    if vitals_dir.exists():
+        for path in sorted(vitals_dir.glob("*.jsonl")):
+            with open(path, 'r', encoding='utf-8') as f:
+                samples.extend(json.loads(line) for line in f if line.strip())
+    return samples
+
+
+def reset_samples(vitals_dir: Path = WEB_VITALS_DIR):
+    """Remove samples of a previous run"""
+    if vitals_dir.exists():
+        shutil.rmtree(vitals_dir)
+
+
+def aggregate(samples: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Percentiles per logical page and metric
+
+    Args:
+        samples: Result of load_samples()
+
+    Returns:
+        {"dashboard (load)": {"lcp_ms": {"n", "p50", "p95", "p99"}, ...}, ...}
+    """
+    values: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+    for sample in samples:
+        group = f"{sample['page']} ({sample['kind']})"
+        for metric in REPORTED_METRICS:
+            if sample.get(metric) is not None:
+                values[group][metric].append(sample[metric])
+
+    return {
+        group: {
+            metric: {"n": len(series), "p50": percentile(series, 50), "p95": percentile(series, 95),
+                     "p99": percentile(series, 99)}
+            for metric, series in sorted(metrics.items(), key=lambda item: REPORTED_METRICS.index(item[0]))
+        }
+        for group, metrics in sorted(values.items())
+    }
+
+
+def write_summary(aggregates: Dict[str, Any], vitals_dir: Path = WEB_VITALS_DIR) -> Path:
+    """Write the aggregates of the run to <vitals_dir>/summary.json"""
+    vitals_dir.mkdir(parents=True, exist_ok=True)
+    path = vitals_dir / "summary.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(aggregates, f, indent=2)
+    return path
+
+
+def _format_value(metric: str, value: float) -> str:
+    return f"{value:.3f}" if metric == "cls" else f"{value:.0f}"
+
+
+def format_lines(aggregates: Dict[str, Any]) -> List[str]:
+    """One line per page and metric: n, p50, p95, p99"""
+    lines = []
+    for group, metrics in aggregates.items():
+        for metric, stats in metrics.items():
+            lines.append(f"{group:<22} {metric:<22} n={stats['n']:<4} "
+                         + " ".join(f"{p}={_format_value(metric, stats[p]):>7}" for p in ("p50", "p95", "p99")))
+    return lines
+
+
+def format_html(aggregates: Dict[str, Any]) -> str:
+    """Aggregates as an HTML table for the pytest-html summary"""
+    rows = "".join(
+        f"<tr><td>{html.escape(group)}</td><td>{metric}</td><td>{stats['n']}</td>"
+        + "".join(f"<td>{_format_value(metric, stats[p])}</td>" for p in ("p50", "p95", "p99"))
+        + "</tr>"
+        for group, metrics in aggregates.items()
+        for metric, stats in metrics.items()
+    )
+    return ("<h3>Web vitals</h3><table><thead><tr><th>Page</th><th>Metric</th><th>n</th>"
+            f"<th>p50</th><th>p95</th><th>p99</th></tr></thead><tbody>{rows}</tbody></table>")